@@ -3,8 +3,9 @@ import tomllib
 from pathlib import Path
 
 import toml
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
+from backend.core.enum import LiquidityMode, OverrunPolicy
 from backend.features.tunnel.network_utils.network_types import NetworkType
 from backend.features.tunnel.providers import AVAILABLE_PROVIDERS
 
@@ -24,6 +25,16 @@ class SimulationConfig(BaseModel):
     monthly_contribution: float = 0.0
 
 
+class EngineConfig(BaseModel):
+    preload_prices: bool = True
+    overrun_policy: OverrunPolicy = OverrunPolicy.CATCH_UP
+    max_catch_up_ticks: int = Field(default=10, ge=0)
+    tick_trace: bool = False
+    persistence_queue_size: int = Field(default=64, ge=1)
+    liquidity_mode: LiquidityMode = LiquidityMode.VIRTUAL
+    market_data_depth: int = Field(default=30, ge=1)
+
+
 class RealtimeConfig(BaseModel):
     use_sse: bool = False
 
@@ -68,6 +79,7 @@ class LoggingConfig(BaseModel):
 class TomlSettings(BaseModel):
     database: DatabaseConfig = DatabaseConfig()
     simulation: SimulationConfig = SimulationConfig()
+    engine: EngineConfig = EngineConfig()
     realtime: RealtimeConfig = RealtimeConfig()
     host: HostConfig = HostConfig()
     server: ServerConfig = ServerConfig()
@@ -76,7 +88,7 @@ class TomlSettings(BaseModel):
 
 def _load_toml_settings() -> TomlSettings:  # pyright: ignore[reportUnusedFunction]
     if not CONFIG_PATH.exists():
-        defaults = TomlSettings().model_dump()
+        defaults = TomlSettings().model_dump(mode="json")
 
         with CONFIG_PATH.open("w") as f:
             toml.dump(defaults, f)
@@ -1,22 +1,70 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from typing import Concatenate, ParamSpec, TypeVar
 
 from sqlalchemy.orm import Session
 
-from backend.core.database import SessionLocal
-
 T = TypeVar("T")
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Sessão da unidade de trabalho ativa no contexto (thread/task) atual
+_current_session: ContextVar[Session | None] = ContextVar(
+    "unit_of_work_session", default=None
+)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Session]:
+    """
+    Agrupa as chamadas de repositório do bloco em uma única sessão e um commit.
+
+    Métodos `@transactional` chamados dentro do bloco reutilizam a sessão em vez
+    de abrir a própria; qualquer exceção desfaz o bloco inteiro. Blocos
+    aninhados se juntam ao mais externo.
+    """
+    active = _current_session.get()
+    if active is not None:
+        yield active
+        return
+
+    session = _new_session()
+    token = _current_session.set(session)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _current_session.reset(token)
+        session.close()
+
+
+def _new_session() -> Session:
+    # Import tardio: importar repositórios não conecta ao banco, só usá-los
+    # (os workers da varredura de backtest nunca abrem conexão)
+    from backend.core.database import SessionLocal  # noqa: PLC0415
+
+    return SessionLocal()
+
 
 def transactional(
     func: Callable[Concatenate[T, Session, P], R],
 ) -> Callable[Concatenate[T, P], R]:
     @wraps(func)
     def wrapper(self: T, *args: P.args, **kwargs: P.kwargs) -> R:
-        session = SessionLocal()
+        active = _current_session.get()
+        if active is not None:
+            # Dentro de uma unidade de trabalho: o commit fica para o fim do bloco,
+            # mas o flush deixa as escritas visíveis às próximas consultas
+            result = func(self, active, *args, **kwargs)
+            active.flush()
+            return result
+
+        session = _new_session()
         try:
             result = func(self, session, *args, **kwargs)
             session.commit()
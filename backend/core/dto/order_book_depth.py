@@ -0,0 +1,23 @@
+from typing import Literal
+
+from backend.core.dto.base import BaseDTO
+
+
+class DepthLevelDTO(BaseDTO):
+    price: float
+    size: int
+
+
+class OrderBookDepthDTO(BaseDTO):
+    """
+    Profundidade L2 de um ticker.
+
+    `snapshot` traz todos os níveis; `diff` traz só os níveis alterados desde
+    o `seq` anterior, com o novo tamanho agregado (0 = nível removido).
+    """
+
+    type: Literal["snapshot", "diff"]
+    ticker: str
+    seq: int
+    bids: list[DepthLevelDTO]
+    asks: list[DepthLevelDTO]
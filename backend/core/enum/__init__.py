@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, StrEnum
 
 
 class FixedIncomeType(Enum):
@@ -68,3 +68,18 @@ class EquityEventType(Enum):
 class FixedIncomeEventType(Enum):
     BUY = "BUY"
     REDEEM = "REDEEM"
+
+
+class OverrunPolicy(StrEnum):
+    CATCH_UP = "catch_up"
+    SKIP = "skip"
+
+
+class LiquidityMode(StrEnum):
+    VIRTUAL = "virtual"
+    MATERIALIZED = "materialized"
+
+
+class EconomicIndicatorType(StrEnum):
+    IPCA = "ipca"
+    SELIC = "selic"
@@ -27,3 +27,10 @@ class InsufficentPositionError(ForbiddenError):
 
     def __init__(self, detail: str = "Posição insuficiente para completar a operação"):
         super().__init__(detail=detail)
+
+
+class PersistenceError(RuntimeError):
+    """Um job de persistência em background falhou: memória e banco divergem."""
+
+    def __init__(self, detail: str = "Falha ao persistir os dados da simulação"):
+        super().__init__(detail)
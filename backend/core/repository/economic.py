@@ -1,12 +1,65 @@
+from collections.abc import Sequence
 from datetime import date
 
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from backend.core.decorators.transactional_method import transactional
+from backend.core.models.models import IpcaHistory, SelicHistory
+
 
 class EconomicRepository:
-    def get_cdi_rate(self, date: date):
-        return 0.149
+    @transactional
+    def get_ipca_history(self, session: Session) -> pd.DataFrame:
+        """Variação mensal do IPCA (%), com rate_date no primeiro dia do mês."""
+        statement = select(
+            IpcaHistory.ref_month.label("rate_date"), IpcaHistory.rate_value
+        ).order_by(IpcaHistory.ref_month)
+        return pd.read_sql(statement, session.connection())
+
+    @transactional
+    def get_selic_history(self, session: Session) -> pd.DataFrame:
+        """Meta da SELIC (% a.a.) a partir de cada data."""
+        statement = select(SelicHistory.rate_date, SelicHistory.rate_value).order_by(
+            SelicHistory.rate_date
+        )
+        return pd.read_sql(statement, session.connection())
 
-    def get_ipca_rate(self, date: date):
-        return 0.0468
+    @transactional
+    def upsert_ipca_history(
+        self, session: Session, rows: Sequence[tuple[date, float]]
+    ) -> int:
+        if not rows:
+            return 0
+        # Uma linha por mês: ON CONFLICT não aceita a mesma chave duas vezes
+        months = {d.replace(day=1): v for d, v in rows}
+        statement = insert(IpcaHistory).values(
+            [{"ref_month": d, "rate_value": v} for d, v in months.items()]
+        )
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[IpcaHistory.ref_month],
+                set_={"rate_value": statement.excluded.rate_value},
+            )
+        )
+        return len(months)
 
-    def get_selic_rate(self, date: date):
-        return 0.150
+    @transactional
+    def upsert_selic_history(
+        self, session: Session, rows: Sequence[tuple[date, float]]
+    ) -> int:
+        if not rows:
+            return 0
+        days = dict(rows)
+        statement = insert(SelicHistory).values(
+            [{"rate_date": d, "rate_value": v} for d, v in days.items()]
+        )
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[SelicHistory.rate_date],
+                set_={"rate_value": statement.excluded.rate_value},
+            )
+        )
+        return len(days)
@@ -1,5 +1,6 @@
 from collections import defaultdict
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from backend.core.decorators.transactional_method import transactional
@@ -13,6 +14,36 @@ from backend.core.models.models import (
     EventFixedIncome,
     Stock,
 )
+from backend.core.utils.bulk_copy import copy_rows
+
+# Colunas gravadas via COPY, na ordem das tuplas montadas abaixo
+_CASHFLOW_COLUMNS = (
+    "simulation_id",
+    "user_id",
+    "event_type",
+    "amount",
+    "event_date",
+    "created_at",
+)
+_EQUITY_COLUMNS = (
+    "simulation_id",
+    "user_id",
+    "stock_id",
+    "event_type",
+    "quantity",
+    "price",
+    "event_date",
+    "created_at",
+)
+_FIXED_INCOME_COLUMNS = (
+    "simulation_id",
+    "user_id",
+    "asset_id",
+    "event_type",
+    "amount",
+    "event_date",
+    "created_at",
+)
 
 
 class EventRepository:
@@ -38,55 +69,70 @@ class EventRepository:
     def _insert_cashflows(
         self, session: Session, cashflow_events: list[CashflowEventDTO]
     ) -> None:
-        cashflow_models = [
-            EventCashflow(
-                simulation_id=e.simulation_id,
-                user_id=e.user_id,
-                event_type=e.event_type.value,
-                amount=e.amount,
-                event_date=e.event_date,
-                created_at=e.created_at,
-            )
-            for e in cashflow_events
-        ]
-        session.add_all(cashflow_models)
+        copy_rows(
+            session,
+            EventCashflow,
+            _CASHFLOW_COLUMNS,
+            (
+                (
+                    e.simulation_id,
+                    e.user_id,
+                    e.event_type.value,
+                    e.amount,
+                    e.event_date,
+                    e.created_at,
+                )
+                for e in cashflow_events
+            ),
+        )
 
     def _insert_equities(
         self, session: Session, equity_events: list[EquityEventDTO]
     ) -> None:
         tickers = {e.ticker for e in equity_events}
 
-        stocks = session.query(Stock).filter(Stock.ticker.in_(tickers)).all()
-        stock_map = {s.ticker: s.id for s in stocks}
+        stock_map = dict(
+            session.execute(
+                select(Stock.ticker, Stock.id).where(Stock.ticker.in_(tickers))
+            ).tuples()
+        )
 
-        equity_models = [
-            EventEquity(
-                simulation_id=e.simulation_id,
-                user_id=e.user_id,
-                stock_id=stock_map[e.ticker],
-                event_type=e.event_type.value,
-                quantity=e.quantity,
-                price=e.price,
-                event_date=e.event_date,
-                created_at=e.created_at,
-            )
-            for e in equity_events
-        ]
-        session.add_all(equity_models)
+        copy_rows(
+            session,
+            EventEquity,
+            _EQUITY_COLUMNS,
+            (
+                (
+                    e.simulation_id,
+                    e.user_id,
+                    stock_map[e.ticker],
+                    e.event_type.value,
+                    e.quantity,
+                    e.price,
+                    e.event_date,
+                    e.created_at,
+                )
+                for e in equity_events
+            ),
+        )
 
     def _insert_fixed_income(
         self, session: Session, fixed_income_events: list[FixedIncomeEventDTO]
     ) -> None:
-        fixed_income_models = [
-            EventFixedIncome(
-                simulation_id=e.simulation_id,
-                user_id=e.user_id,
-                asset_id=e.asset_id,
-                event_type=e.event_type.value,
-                amount=e.amount,
-                event_date=e.event_date,
-                created_at=e.created_at,
-            )
-            for e in fixed_income_events
-        ]
-        session.add_all(fixed_income_models)
+        copy_rows(
+            session,
+            EventFixedIncome,
+            _FIXED_INCOME_COLUMNS,
+            (
+                (
+                    e.simulation_id,
+                    e.user_id,
+                    e.asset_id,
+                    e.event_type.value,
+                    e.amount,
+                    e.event_date,
+                    e.created_at,
+                )
+                for e in fixed_income_events
+            ),
+        )
@@ -1,39 +1,92 @@
+from collections.abc import Sequence
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, event, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from backend.core.decorators.transactional_method import transactional
 from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
+from backend.core.dto.fixed_income_position import FixedIncomePositionDTO
 from backend.core.enum import FixedIncomeType, RateIndexType
 from backend.core.models.models import FixedIncomeAsset, FixedIncomePosition
 
 
 class FixedIncomeRepository:
+    def __init__(self):
+        # Cache asset_uuid -> id; só recebe ids de transações já commitadas
+        self._asset_ids: dict[UUID, int] = {}
+
+    def get_or_create_asset(self, asset: FixedIncomeAssetDTO) -> int:
+        asset_id = self._asset_ids.get(asset.asset_uuid)
+        if asset_id is None:
+            asset_id = self.get_or_create_assets([asset])[asset.asset_uuid]
+        return asset_id
+
+    def get_or_create_assets(
+        self, assets: Sequence[FixedIncomeAssetDTO]
+    ) -> dict[UUID, int]:
+        """Ids dos ativos, criando os que faltam no banco em um único INSERT."""
+        ids: dict[UUID, int] = {}
+        missing: dict[UUID, FixedIncomeAssetDTO] = {}
+        for asset in assets:
+            asset_id = self._asset_ids.get(asset.asset_uuid)
+            if asset_id is None:
+                missing[asset.asset_uuid] = asset
+            else:
+                ids[asset.asset_uuid] = asset_id
+        if missing:
+            ids.update(self._upsert_assets(list(missing.values())))
+        return ids
+
     @transactional
-    def get_or_create_asset(self, session: Session, asset: FixedIncomeAssetDTO) -> int:
-        # Verifica se o ativo existe
-        stmt = select(FixedIncomeAsset.id).where(
-            FixedIncomeAsset.asset_uuid == asset.asset_uuid
-        )
-        existing_id = session.scalar(stmt)
-        if existing_id:
-            return existing_id
-        # Cria o ativo e retorna
-        db_asset = FixedIncomeAsset(
-            asset_uuid=asset.asset_uuid,
-            name=asset.name,
-            issuer=asset.issuer,
-            investment_type=asset.investment_type.db_value,
-            rate_type=asset.rate_index.db_value,
-            maturity_date=asset.maturity_date,
-            interest_rate=asset.interest_rate,
+    def _upsert_assets(
+        self, session: Session, assets: Sequence[FixedIncomeAssetDTO]
+    ) -> dict[UUID, int]:
+        stmt = (
+            insert(FixedIncomeAsset)
+            .values(
+                [
+                    {
+                        "asset_uuid": asset.asset_uuid,
+                        "name": asset.name,
+                        "issuer": asset.issuer,
+                        "investment_type": asset.investment_type.db_value,
+                        "rate_type": asset.rate_index.db_value,
+                        "maturity_date": asset.maturity_date,
+                        "interest_rate": asset.interest_rate,
+                    }
+                    for asset in assets
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[FixedIncomeAsset.asset_uuid])
+            .returning(FixedIncomeAsset.asset_uuid, FixedIncomeAsset.id)
         )
-        session.add(db_asset)
-        session.flush()
+        ids: dict[UUID, int] = dict(session.execute(stmt).tuples().all())
+
+        # Os que já existiam não voltam no RETURNING
+        existing = [asset.asset_uuid for asset in assets if asset.asset_uuid not in ids]
+        if existing:
+            ids.update(
+                session.execute(
+                    select(FixedIncomeAsset.asset_uuid, FixedIncomeAsset.id).where(
+                        FixedIncomeAsset.asset_uuid.in_(existing)
+                    )
+                )
+                .tuples()
+                .all()
+            )
 
-        return db_asset.id
+        # Um rollback (ex: da unidade de trabalho) não pode deixar ids no cache
+        event.listen(
+            session,
+            "after_commit",
+            lambda _session: self._asset_ids.update(ids),
+            once=True,
+        )
+        return ids
 
     @transactional
     def get_asset_by_uuid(
@@ -55,46 +108,54 @@ class FixedIncomeRepository:
         )
 
     @transactional
-    def upsert_position(
+    def upsert_positions(
         self,
         session: Session,
         simulation_id: int,
-        user_id: int,
-        asset_id: int,
-        total_applied: Decimal,
-        current_value: Decimal,
         accrual_date: date,
-        first_applied_date: date | None = None,
+        positions: Sequence[tuple[int, int, FixedIncomePositionDTO]],
     ) -> None:
-        stmt = select(FixedIncomePosition).where(
-            FixedIncomePosition.simulation_id == simulation_id,
-            FixedIncomePosition.user_id == user_id,
-            FixedIncomePosition.asset_id == asset_id,
-        )
+        """
+        Insere ou atualiza as posições em um único INSERT ... ON CONFLICT.
 
-        position = session.scalar(stmt)
-        now = datetime.now(UTC)
+        `positions` traz (user_id, asset_id, posição); em conflito, só valores,
+        data de acúmulo e updated_at mudam.
+        """
+        if not positions:
+            return
 
-        if position is None:
-            # INSERT
-            position = FixedIncomePosition(
-                simulation_id=simulation_id,
-                user_id=user_id,
-                asset_id=asset_id,
-                total_applied=total_applied,
-                current_value=current_value,
-                last_accrual_date=accrual_date,
-                first_applied_date=first_applied_date,
-                created_at=now,
-                updated_at=now,
+        now = datetime.now(UTC)
+        stmt = insert(FixedIncomePosition).values(
+            [
+                {
+                    "simulation_id": simulation_id,
+                    "user_id": user_id,
+                    "asset_id": asset_id,
+                    "total_applied": Decimal(position.total_applied),
+                    "current_value": Decimal(position.current_value),
+                    "last_accrual_date": accrual_date,
+                    "first_applied_date": position.first_applied_date,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for user_id, asset_id, position in positions
+            ]
+        )
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    FixedIncomePosition.simulation_id,
+                    FixedIncomePosition.user_id,
+                    FixedIncomePosition.asset_id,
+                ],
+                set_={
+                    "total_applied": stmt.excluded.total_applied,
+                    "current_value": stmt.excluded.current_value,
+                    "last_accrual_date": stmt.excluded.last_accrual_date,
+                    "updated_at": stmt.excluded.updated_at,
+                },
             )
-            session.add(position)
-        else:
-            # UPDATE
-            position.total_applied = total_applied
-            position.current_value = current_value
-            position.last_accrual_date = accrual_date
-            position.updated_at = now
+        )
 
     @transactional
     def delete_position(
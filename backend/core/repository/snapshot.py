@@ -1,7 +1,10 @@
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
 from datetime import UTC, date, datetime
 from decimal import Decimal
 
-from sqlalchemy import Case, func, select, true
+from sqlalchemy import Case, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from backend.core.decorators.transactional_method import transactional
@@ -11,159 +14,175 @@ from backend.core.models.models import (
     EventEquity,
     FixedIncomePosition,
     Snapshots,
-    StockPriceHistory,
 )
 from backend.core.runtime.simulation_manager import SimulationManager
 
+# Chave primária primeiro; o restante é atualizado em caso de conflito
+_SNAPSHOT_COLUMNS = (
+    "simulation_id",
+    "user_id",
+    "snapshot_date",
+    "total_equity",
+    "total_fixed",
+    "total_cash",
+    "total_contribution",
+    "total_networth",
+    "created_at",
+)
+
 
 class SnapshotRepository:
     @transactional
-    def create_snapshot(
+    def create_snapshots(
         self,
         session: Session,
-        user_id: int,
+        user_ids: Sequence[int],
         snapshot_date: date,
-    ) -> SnapshotDTO:
+        close_prices: Mapping[int, float],
+    ) -> list[SnapshotDTO]:
+        """
+        Calcula e grava o snapshot de todos os usuários de uma vez.
+
+        Cada total vem de uma única consulta agrupada por usuário e as linhas
+        são gravadas em um único INSERT ... ON CONFLICT. Retorna os snapshots
+        na ordem de `user_ids`.
+        """
+        if not user_ids:
+            return []
         simulation_id = SimulationManager.get_active_simulation_id()
 
         # --------------------------------------------------
-        # 2. CASHFLOW (TOTAL)
+        # 1. CASHFLOW E CONTRIBUIÇÕES (TOTAL)
         # --------------------------------------------------
-        total_cash = Decimal(
-            session.execute(
-                select(
-                    func.coalesce(
-                        func.sum(
-                            Case(
-                                (
-                                    EventCashflow.event_type.in_(
-                                        ["DEPOSIT", "DIVIDEND", "CONTRIBUTION"]
-                                    ),
-                                    EventCashflow.amount,
-                                ),
-                                (
-                                    EventCashflow.event_type == "WITHDRAW",
-                                    -EventCashflow.amount,
-                                ),
-                                else_=Decimal("0"),
-                            )
+        cashflows = session.execute(
+            select(
+                EventCashflow.user_id,
+                func.sum(
+                    Case(
+                        (
+                            EventCashflow.event_type.in_(
+                                ["DEPOSIT", "DIVIDEND", "CONTRIBUTION"]
+                            ),
+                            EventCashflow.amount,
                         ),
-                        0,
-                    )
-                ).where(
-                    EventCashflow.user_id == user_id,
-                    EventCashflow.simulation_id == simulation_id,
-                    EventCashflow.event_date <= snapshot_date,
-                )
-            ).scalar_one()
-        )
-
-        # --------------------------------------------------
-        # 2.5. TOTAL CONTRIBUTIONS
-        # --------------------------------------------------
-        total_contribution = Decimal(
-            session.execute(
-                select(
-                    func.coalesce(
-                        func.sum(EventCashflow.amount),
-                        0,
+                        (
+                            EventCashflow.event_type == "WITHDRAW",
+                            -EventCashflow.amount,
+                        ),
+                        else_=Decimal("0"),
                     )
-                ).where(
-                    EventCashflow.user_id == user_id,
-                    EventCashflow.simulation_id == simulation_id,
-                    EventCashflow.event_type == "CONTRIBUTION",
-                    EventCashflow.event_date <= snapshot_date,
-                )
-            ).scalar_one()
-        )
-
-        # --------------------------------------------------
-        # 3. EQUITY (MARK-TO-MARKET)
-        # --------------------------------------------------
-        positions = (
-            select(
-                EventEquity.stock_id,
+                ),
                 func.sum(
                     Case(
-                        (EventEquity.event_type == "BUY", EventEquity.quantity),
-                        (EventEquity.event_type == "SELL", -EventEquity.quantity),
-                        else_=0,
+                        (
+                            EventCashflow.event_type == "CONTRIBUTION",
+                            EventCashflow.amount,
+                        ),
+                        else_=Decimal("0"),
                     )
-                ).label("quantity"),
+                ),
             )
             .where(
-                EventEquity.user_id == user_id,
-                EventEquity.simulation_id == simulation_id,
-                EventEquity.event_date <= snapshot_date,
+                EventCashflow.user_id.in_(user_ids),
+                EventCashflow.simulation_id == simulation_id,
+                EventCashflow.event_date <= snapshot_date,
             )
-            .group_by(EventEquity.stock_id)
-        ).subquery()
+            .group_by(EventCashflow.user_id)
+        ).tuples()
+        total_cash: dict[int, Decimal] = {}
+        total_contribution: dict[int, Decimal] = {}
+        for user_id, cash, contribution in cashflows:
+            total_cash[user_id] = Decimal(cash)
+            total_contribution[user_id] = Decimal(contribution)
 
-        price_lateral = (
-            select(StockPriceHistory.close)
-            .where(
-                StockPriceHistory.stock_id == positions.c.stock_id,
-                StockPriceHistory.price_date <= snapshot_date,
+        # --------------------------------------------------
+        # 2. EQUITY (MARK-TO-MARKET)
+        # --------------------------------------------------
+        quantity = func.sum(
+            Case(
+                (EventEquity.event_type == "BUY", EventEquity.quantity),
+                (EventEquity.event_type == "SELL", -EventEquity.quantity),
+                else_=0,
             )
-            .order_by(StockPriceHistory.price_date.desc())
-            .limit(1)
-            .lateral()
-        )
-
-        total_equity = Decimal(
-            session.execute(
-                select(
-                    func.coalesce(
-                        func.sum(positions.c.quantity * price_lateral.c.close),
-                        0,
-                    )
-                )
-                .select_from(positions)
-                .join(price_lateral, true())
-                .where(positions.c.quantity != 0)
-            ).scalar_one()
         )
+        quantities = session.execute(
+            select(EventEquity.user_id, EventEquity.stock_id, quantity)
+            .where(
+                EventEquity.user_id.in_(user_ids),
+                EventEquity.simulation_id == simulation_id,
+                EventEquity.event_date <= snapshot_date,
+            )
+            .group_by(EventEquity.user_id, EventEquity.stock_id)
+            .having(quantity != 0)
+        ).tuples()
+        equity_value: dict[int, float] = defaultdict(float)
+        for user_id, stock_id, size in quantities:
+            if stock_id in close_prices:
+                equity_value[user_id] += size * close_prices[stock_id]
 
         # --------------------------------------------------
-        # 4. FIXED INCOME (MARK-TO-MARKET)
+        # 3. FIXED INCOME (MARK-TO-MARKET)
         # --------------------------------------------------
-        total_fixed = Decimal(
+        total_fixed = dict(
             session.execute(
                 select(
-                    func.coalesce(
-                        func.sum(FixedIncomePosition.current_value),
-                        0,
-                    )
-                ).where(
-                    FixedIncomePosition.user_id == user_id,
+                    FixedIncomePosition.user_id,
+                    func.sum(FixedIncomePosition.current_value),
+                )
+                .where(
+                    FixedIncomePosition.user_id.in_(user_ids),
                     FixedIncomePosition.simulation_id == simulation_id,
                 )
-            ).scalar_one()
+                .group_by(FixedIncomePosition.user_id)
+            ).tuples()
         )
 
         # --------------------------------------------------
-        # 5. NET WORTH
+        # 4. NET WORTH
         # --------------------------------------------------
-        total_networth = total_cash + total_equity + total_fixed
+        now = datetime.now(UTC)
+        snapshots = []
+        for user_id in user_ids:
+            cash = total_cash.get(user_id, Decimal(0))
+            equity = Decimal(equity_value.get(user_id, 0))
+            fixed = Decimal(total_fixed.get(user_id, 0))
+            snapshots.append(
+                Snapshots(
+                    simulation_id=simulation_id,
+                    user_id=user_id,
+                    snapshot_date=snapshot_date,
+                    total_equity=equity,
+                    total_fixed=fixed,
+                    total_cash=cash,
+                    total_contribution=total_contribution.get(user_id, Decimal(0)),
+                    total_networth=cash + equity + fixed,
+                    created_at=now,
+                )
+            )
 
         # --------------------------------------------------
-        # 6. Persistir snapshot
+        # 5. Persistir snapshots (upsert em lote)
         # --------------------------------------------------
-        snapshot = Snapshots(
-            simulation_id=simulation_id,
-            user_id=user_id,
-            snapshot_date=snapshot_date,
-            total_equity=total_equity,
-            total_fixed=total_fixed,
-            total_cash=total_cash,
-            total_contribution=total_contribution,
-            total_networth=total_networth,
-            created_at=datetime.now(UTC),
+        stmt = insert(Snapshots).values(
+            [
+                {column: getattr(snapshot, column) for column in _SNAPSHOT_COLUMNS}
+                for snapshot in snapshots
+            ]
+        )
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    Snapshots.simulation_id,
+                    Snapshots.user_id,
+                    Snapshots.snapshot_date,
+                ],
+                set_={
+                    column: stmt.excluded[column] for column in _SNAPSHOT_COLUMNS[3:]
+                },
+            )
         )
 
-        session.merge(snapshot)
-
-        return SnapshotDTO.from_model(snapshot)
+        return [SnapshotDTO.from_model(snapshot) for snapshot in snapshots]
 
     @transactional
     def get_last_snapshot_date(
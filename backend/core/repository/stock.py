@@ -1,6 +1,10 @@
+import itertools
+from collections.abc import Collection
 from datetime import date
 
-from sqlalchemy import delete, select
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from backend.core.decorators.transactional_method import transactional
@@ -10,6 +14,7 @@ from backend.core.dto.stock_details import StockDetailsDTO
 from backend.core.dto.stock_price_history import StockPriceHistoryDTO
 from backend.core.dto.stock_status import StockStatusDTO
 from backend.core.models.models import Stock, StockPriceHistory
+from backend.core.utils.bulk_copy import copy_rows
 
 
 class StockRepository:
@@ -26,48 +31,94 @@ class StockRepository:
 
     @transactional
     def add_stock_price_history(
-        self, session: Session, stock_price_history: list[StockPriceHistory]
-    ) -> None:
-        session.add_all(stock_price_history)
+        self, session: Session, stock_id: int, prices: pd.DataFrame
+    ) -> int:
+        """
+        Insere o histórico via COPY, direto das colunas do DataFrame.
+
+        `prices` é indexado pela data e tem as colunas open, high, low, close e
+        volume; as datas não podem existir ainda para o ativo. Retorna o número
+        de registros inseridos.
+        """
+        return copy_rows(
+            session,
+            StockPriceHistory,
+            ("stock_id", "price_date", "open", "high", "low", "close", "volume"),
+            zip(
+                itertools.repeat(stock_id),
+                prices.index.to_numpy("datetime64[D]").tolist(),
+                prices["open"].to_numpy(np.float64).tolist(),
+                prices["high"].to_numpy(np.float64).tolist(),
+                prices["low"].to_numpy(np.float64).tolist(),
+                prices["close"].to_numpy(np.float64).tolist(),
+                prices["volume"].to_numpy(np.int64).tolist(),
+                strict=True,
+            ),
+        )
+
+    def get_stocks_by_date(self, current_date: date) -> list[CandleDTO]:
+        return self.get_latest_candles(current_date)
 
     @transactional
-    def get_stocks_by_date(
-        self, session: Session, current_date: date
+    def get_latest_candles(
+        self,
+        session: Session,
+        current_date: date | None = None,
+        tickers: Collection[str] | None = None,
     ) -> list[CandleDTO]:
-        stocks = session.execute(select(Stock)).scalars().all()
-        stocks_with_history: list[CandleDTO] = []
-        for stock in stocks:
-            ph = (
-                session.execute(
-                    select(StockPriceHistory)
-                    .where(
-                        StockPriceHistory.stock_id == stock.id,
-                        StockPriceHistory.price_date <= current_date,
-                    )
-                    .order_by(StockPriceHistory.price_date.desc())
+        """Retorna o último candle de cada ticker até a data, em uma única consulta."""
+        statement = (
+            select(Stock, StockPriceHistory)
+            .join(StockPriceHistory, StockPriceHistory.stock_id == Stock.id)
+            .distinct(StockPriceHistory.stock_id)
+            .order_by(StockPriceHistory.stock_id, StockPriceHistory.price_date.desc())
+        )
+        if current_date is not None:
+            statement = statement.where(StockPriceHistory.price_date <= current_date)
+        if tickers is not None:
+            statement = statement.where(Stock.ticker.in_(tickers))
+
+        candles: list[CandleDTO] = []
+        for stock, ph in session.execute(statement).tuples():
+            change = ph.close - ph.open
+            change_pct = (change / ph.open * 100) if ph.open != 0 else 0
+            candles.append(
+                CandleDTO(
+                    id=stock.id,
+                    ticker=stock.ticker,
+                    name=stock.name,
+                    close=ph.close,
+                    low=ph.low,
+                    high=ph.high,
+                    volume=ph.volume,
+                    open=ph.open,
+                    price_date=ph.price_date,
+                    change=round(change, 2),
+                    change_pct=f"{change_pct:+.2f}%",
                 )
-                .scalars()
-                .first()
             )
-            if ph:
-                change = ph.close - ph.open
-                change_pct = (change / ph.open * 100) if ph.open != 0 else 0
-                stocks_with_history.append(
-                    CandleDTO(
-                        id=ph.stock.id,
-                        ticker=ph.stock.ticker,
-                        name=ph.stock.name,
-                        close=ph.close,
-                        low=ph.low,
-                        high=ph.high,
-                        volume=ph.volume,
-                        open=ph.open,
-                        price_date=ph.price_date,
-                        change=round(change, 2),
-                        change_pct=f"{change_pct:+.2f}%",
-                    )
-                )
-        return stocks_with_history
+        return candles
+
+    @transactional
+    def get_price_history_frame(self, session: Session, end_date: date) -> pd.DataFrame:
+        """Retorna o histórico OHLCV de todos os tickers até a data, em colunas."""
+        statement = (
+            select(
+                StockPriceHistory.stock_id,
+                Stock.ticker,
+                Stock.name,
+                StockPriceHistory.price_date,
+                StockPriceHistory.open,
+                StockPriceHistory.high,
+                StockPriceHistory.low,
+                StockPriceHistory.close,
+                StockPriceHistory.volume,
+            )
+            .join(Stock, Stock.id == StockPriceHistory.stock_id)
+            .where(StockPriceHistory.price_date <= end_date)
+            .order_by(StockPriceHistory.stock_id, StockPriceHistory.price_date)
+        )
+        return pd.read_sql(statement, session.connection())
 
     @transactional
     def get_stock_details(
@@ -149,22 +200,13 @@ class StockRepository:
 
     @transactional
     def get_all_stocks_with_last_date(self, session: Session) -> list[StockStatusDTO]:
-        stocks = session.execute(select(Stock).order_by(Stock.ticker)).scalars().all()
-        result = []
-        for stock in stocks:
-            last = (
-                session.execute(
-                    select(StockPriceHistory)
-                    .where(StockPriceHistory.stock_id == stock.id)
-                    .order_by(StockPriceHistory.price_date.desc())
-                )
-                .scalars()
-                .first()
-            )
-            result.append(
-                StockStatusDTO(
-                    ticker=stock.ticker,
-                    last_date=last.price_date if last else None,
-                )
-            )
-        return result
+        rows = session.execute(
+            select(Stock.ticker, func.max(StockPriceHistory.price_date))
+            .outerjoin(StockPriceHistory, StockPriceHistory.stock_id == Stock.id)
+            .group_by(Stock.id, Stock.ticker)
+            .order_by(Stock.ticker)
+        ).tuples()
+        return [
+            StockStatusDTO(ticker=ticker, last_date=last_date)
+            for ticker, last_date in rows
+        ]
@@ -1,8 +1,13 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from threading import Lock
 from typing import ClassVar
 
 from backend.core import repository
 from backend.core.dto.events.base_event import BaseEventDTO
+from backend.core.dto.events.equity import EquityEventDTO
+from backend.core.runtime.persistence_writer import PersistenceWriter
 
 
 class EventManager:
@@ -11,22 +16,94 @@ class EventManager:
 
     Responsável por:
     - Acumular eventos em memória de forma thread-safe
-    - Persistir eventos em lote no banco de dados
+    - Persistir eventos em lote no banco de dados, via PersistenceWriter
     - Garantir que eventos não sejam perdidos durante concorrência
+    - Agrupar os eventos de uma operação em lote, fundindo execuções repetidas
     """
 
     _events: ClassVar[list[BaseEventDTO]] = []
     _lock = Lock()
+    # Serializa os flushes (ordem dos lotes) sem segurar _lock durante o put
+    _flush_lock = Lock()
+    _local = threading.local()
 
     @classmethod
     def push_event(cls, event: BaseEventDTO) -> None:
+        buffer: list[BaseEventDTO] | None = getattr(cls._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(event)
+            return
+
         with cls._lock:
             cls._events.append(event)
 
+    @classmethod
+    @contextmanager
+    def batched(cls) -> Iterator[None]:
+        """
+        Acumula os eventos emitidos pela thread atual e os entrega de uma vez
+        ao sair do bloco.
+
+        Execuções de equity do mesmo usuário, ticker, tipo, data e preço viram
+        um único evento com a quantidade somada.
+        """
+        if getattr(cls._local, "buffer", None) is not None:
+            yield  # Lote externo já acumula
+            return
+
+        cls._local.buffer = []
+        try:
+            yield
+        finally:
+            events = _coalesce_equity(cls._local.buffer)
+            cls._local.buffer = None
+            if events:
+                with cls._lock:
+                    cls._events.extend(events)
+
     @classmethod
     def flush(cls) -> None:
-        with cls._lock:
-            if not cls._events:
-                return
-            repository.event.insert_many(cls._events)
-            cls._events.clear()
+        """Entrega o lote acumulado ao writer em background, preservando a ordem."""
+        with cls._flush_lock:
+            with cls._lock:
+                if not cls._events:
+                    return
+                events = cls._events
+                cls._events = []
+            try:
+                PersistenceWriter.submit(lambda: repository.event.insert_many(events))
+            except Exception:
+                # Devolve o lote à frente dos eventos que chegaram nesse meio tempo
+                with cls._lock:
+                    cls._events[:0] = events
+                raise
+
+
+def _coalesce_equity(events: list[BaseEventDTO]) -> list[BaseEventDTO]:
+    merged: list[BaseEventDTO] = []
+    equity: dict[tuple, tuple[int, EquityEventDTO]] = {}
+    for event in events:
+        if not isinstance(event, EquityEventDTO):
+            merged.append(event)
+            continue
+
+        key = (
+            event.simulation_id,
+            event.user_id,
+            event.event_date,
+            event.ticker,
+            event.event_type,
+            event.price,
+        )
+        if key not in equity:
+            equity[key] = (len(merged), event)
+            merged.append(event)
+            continue
+
+        index, previous = equity[key]
+        combined = previous.model_copy(
+            update={"quantity": previous.quantity + event.quantity}
+        )
+        equity[key] = (index, combined)
+        merged[index] = combined
+    return merged
@@ -0,0 +1,105 @@
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from typing import ClassVar
+
+from backend import config
+from backend.core.exceptions import PersistenceError
+
+logger = logging.getLogger(__name__)
+
+type PersistenceJob = Callable[[], None]
+
+
+class PersistenceWriter:
+    """
+    Gerenciador singleton do estágio de persistência em background.
+
+    Responsável por:
+    - Executar jobs de escrita no banco em uma thread dedicada, em ordem FIFO
+    - Aplicar backpressure com fila limitada quando o banco não acompanha o loop
+    - Drenar a fila de forma durável no stop da simulação e no shutdown
+    - Parar de executar jobs após uma falha, descartando os enfileirados, e
+      reportá-la (PersistenceError) em todo submit até o próximo drain/stop
+    """
+
+    _queue: ClassVar[queue.Queue[PersistenceJob | None]] = queue.Queue(
+        maxsize=config.toml.engine.persistence_queue_size
+    )
+    _thread: ClassVar[threading.Thread | None] = None
+    _lock = threading.Lock()
+    # Primeira falha; enquanto definida, os jobs seguintes são descartados
+    _failure: ClassVar[Exception | None] = None
+
+    @classmethod
+    def submit(cls, job: PersistenceJob) -> None:
+        """Enfileira um job; bloqueia se a fila estiver cheia."""
+        with cls._lock:
+            failure = cls._failure
+        if failure is not None:
+            raise PersistenceError from failure
+        cls._ensure_started()
+        cls._queue.put(job)
+
+    @classmethod
+    def drain(cls) -> None:
+        """Bloqueia até que todos os jobs enfileirados tenham sido executados."""
+        with cls._lock:
+            if cls._thread is None:
+                return
+        cls._queue.join()
+        cls._raise_failure()
+
+    @classmethod
+    def stop(cls) -> None:
+        """Drena a fila e encerra a thread de escrita."""
+        with cls._lock:
+            thread = cls._thread
+            if thread is None:
+                return
+            cls._queue.put(None)
+            cls._thread = None
+        thread.join()
+        cls._raise_failure()
+
+    @classmethod
+    def _ensure_started(cls) -> None:
+        with cls._lock:
+            if cls._thread is not None:
+                return
+            cls._thread = threading.Thread(
+                target=cls._run,
+                daemon=True,
+                name="persistence-writer",
+            )
+            cls._thread.start()
+
+    @classmethod
+    def _run(cls) -> None:
+        while True:
+            job = cls._queue.get()
+            try:
+                if job is None:
+                    return
+                with cls._lock:
+                    failed = cls._failure is not None
+                if failed:
+                    # Escrever por cima da lacuna quebraria a ordem dos dados
+                    logger.warning("Job de persistência descartado após falha")
+                    continue
+                job()
+            except Exception as e:
+                logger.exception("Erro ao executar job de persistência")
+                with cls._lock:
+                    cls._failure = cls._failure or e
+            finally:
+                cls._queue.task_done()
+
+    @classmethod
+    def _raise_failure(cls) -> None:
+        """Propaga e limpa a falha após drenar a fila; o writer volta a executar."""
+        with cls._lock:
+            failure, cls._failure = cls._failure, None
+        if failure is not None:
+            raise PersistenceError from failure
@@ -0,0 +1,39 @@
+from collections.abc import Iterable, Sequence
+from typing import Any, cast
+
+import psycopg
+from psycopg import sql
+from sqlalchemy.orm import Session
+
+from backend.core.models.models import Base
+
+
+def copy_rows(
+    session: Session,
+    model: type[Base],
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> int:
+    """
+    Insere as linhas com `COPY ... FROM STDIN`, sem instanciar modelos ORM.
+
+    Usa a conexão da sessão, então participa da mesma transação (inclusive de
+    uma unidade de trabalho). Não há ON CONFLICT: quem chama garante que as
+    linhas são novas. Retorna o número de linhas copiadas.
+    """
+    # Pendências do ORM vão antes, pois as linhas podem referenciá-las
+    session.flush()
+    connection = cast(
+        "psycopg.Connection", session.connection().connection.driver_connection
+    )
+
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(model.__tablename__),
+        sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+    )
+    count = 0
+    with connection.cursor() as cursor, cursor.copy(statement) as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
@@ -0,0 +1,32 @@
+import threading
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+
+
+class KeyedLock[K: Hashable]:
+    """
+    Conjunto de locks reentrantes, um por chave, criados sob demanda.
+
+    Responsável por:
+    - Fornecer um RLock exclusivo por chave (ticker, client_id...)
+    - Adquirir várias chaves sempre na mesma ordem canônica para evitar deadlock
+    """
+
+    def __init__(self):
+        self._locks: dict[K, threading.RLock] = {}
+        self._guard = threading.Lock()
+
+    def __call__(self, key: K) -> threading.RLock:
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._guard:
+                lock = self._locks.setdefault(key, threading.RLock())
+        return lock
+
+    @contextmanager
+    def acquire_many(self, keys: Iterable[K]) -> Iterator[None]:
+        """Adquire os locks das chaves (sem repetição) ordenados por `str(key)`."""
+        with ExitStack() as stack:
+            for key in sorted(set(keys), key=str):
+                stack.enter_context(self(key))
+            yield
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, cast
+from uuid import UUID
+
+from backend.core.enum import EquityEventType
+from backend.core.utils.keyed_lock import KeyedLock
+from backend.core.utils.lazy_dict import LazyDict
+from backend.features.variable_income.broker import Broker
+from backend.features.variable_income.entities.position import Position
+
+if TYPE_CHECKING:
+    from backend.features.simulation.simulation_engine import SimulationEngine
+
+
+@dataclass(frozen=True, slots=True)
+class BacktestTrade:
+    trade_date: date
+    ticker: str
+    action: EquityEventType
+    quantity: int
+    price: float
+
+
+class BacktestLedger:
+    """
+    Substituto em memória do caixa do SimulationEngine para o backtest.
+
+    Responsável por:
+    - Manter o saldo de cada cliente sem banco nem eventos de cashflow
+    - Expor a data corrente do replay para o broker
+    """
+
+    simulation_id = 0
+
+    def __init__(self, starting_cash: float, current_date: date):
+        self.starting_cash = starting_cash
+        self.current_date = current_date
+        self._cash: dict[UUID, float] = {}
+
+    def get_cash(self, client_id: UUID) -> float:
+        return self._cash.get(client_id, self.starting_cash)
+
+    def add_cash(self, client_id: UUID, cash: float) -> None:
+        self._cash[client_id] = self.get_cash(client_id) + cash
+
+
+class BacktestBroker(Broker):
+    """
+    Broker de renda variável do backtest.
+
+    Responsável por:
+    - Reaproveitar as regras de reserva e execução do Broker
+    - Começar todos os clientes sem posições, sem carregar do banco
+    - Registrar as execuções em memória em vez de emitir eventos de equity
+    """
+
+    def __init__(self, ledger: BacktestLedger):
+        super().__init__(cast("SimulationEngine", ledger), KeyedLock[UUID]())
+        self._ledger = ledger
+        self._positions: LazyDict[UUID, dict[str, Position]] = LazyDict(lambda _: {})
+        self.trades: list[BacktestTrade] = []
+
+    def _record_trade(
+        self,
+        client_id: UUID,
+        ticker: str,
+        event_type: EquityEventType,
+        size: int,
+        price: float,
+    ) -> None:
+        self.trades.append(
+            BacktestTrade(
+                trade_date=self._ledger.current_date,
+                ticker=ticker,
+                action=event_type,
+                quantity=size,
+                price=price,
+            )
+        )
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Collection, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from backend.core.exceptions.http_exceptions import UnprocessableEntityError
+from backend.features.backtest.backtest_broker import (
+    BacktestBroker,
+    BacktestLedger,
+    BacktestTrade,
+)
+from backend.features.realtime import muted
+from backend.features.strategy.base_strategy import BaseStrategy
+from backend.features.variable_income.entities.candle import Candle
+from backend.features.variable_income.entities.order import OrderAction
+from backend.features.variable_income.liquidity.beta_distribution import (
+    BetaLiquidityDistribution,
+)
+from backend.features.variable_income.matching_engine import MatchingEngine
+
+# Cliente em nome do qual a estratégia opera durante o backtest
+BACKTEST_CLIENT_ID = uuid.uuid5(uuid.NAMESPACE_DNS, "backtest.simulador-financeiro")
+
+_OHLCV = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(frozen=True, slots=True)
+class BacktestResult:
+    strategy: str
+    tickers: list[str]
+    starting_cash: float
+    final_equity: float
+    trades: list[BacktestTrade]
+    equity_curve: pd.Series  # patrimônio ao fim de cada dia, indexado pela data
+    ticks: int
+    elapsed: float  # segundos
+
+    @property
+    def dates(self) -> list[date]:
+        """Dias da curva de patrimônio."""
+        return self.equity_curve.index.to_numpy("datetime64[D]").tolist()
+
+    @property
+    def total_return(self) -> float:
+        return self.final_equity / self.starting_cash - 1
+
+    @property
+    def max_drawdown(self) -> float:
+        """Maior queda relativa do patrimônio a partir de um pico (0 a 1)."""
+        if self.equity_curve.empty:
+            return 0.0
+        equity = self.equity_curve.to_numpy()
+        peaks = np.maximum.accumulate(equity)
+        return float(np.max(1 - equity / peaks))
+
+
+class Backtester:
+    """
+    Replay offline de estratégias sobre o histórico de preços.
+
+    Responsável por:
+    - Guardar o histórico OHLCV em matrizes data x ticker, pivotadas uma única vez
+    - Gravar e reabrir as matrizes em disco como memmap, para processos paralelos
+    - Reproduzir os candles dia a dia no MatchingEngine, com liquidez sintética
+    - Executar a estratégia com broker e caixa em memória, sem banco e sem notify
+    - Reportar trades, curva de patrimônio e tempo de execução
+    """
+
+    def __init__(self, dates: np.ndarray, tickers: Sequence[str], prices: np.ndarray):
+        """
+        `prices` tem forma (5, datas, tickers): OHLCV em f8, NaN onde o ticker
+        não negociou; `dates` (datetime64[D], crescentes) e `tickers` rotulam os
+        eixos. O replay só fatia `prices`, que pode ser um memmap somente leitura.
+        """
+        self._dates = dates
+        self._tickers = list(tickers)
+        self._prices = prices
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> Backtester:
+        """`frame` segue o formato de `repository.stock.get_price_history_frame`."""
+        pivot = (
+            frame.assign(price_date=pd.to_datetime(frame["price_date"]))
+            .pivot(index="price_date", columns="ticker", values=list(_OHLCV))
+            .sort_index()
+        )
+        return cls(
+            pivot.index.to_numpy("datetime64[D]"),
+            [str(t) for t in pivot["close"].columns],
+            np.stack([pivot[name].to_numpy(np.float64) for name in _OHLCV]),
+        )
+
+    @classmethod
+    def load(cls, end_date: date) -> Backtester:
+        # Import tardio: os workers da varredura não tocam no banco (nem o criam)
+        from backend.core import repository  # noqa: PLC0415
+
+        return cls.from_frame(repository.stock.get_price_history_frame(end_date))
+
+    def save(self, directory: Path) -> None:
+        """Grava as matrizes em .npy, para reabrir com `open_memmap`."""
+        np.save(directory / "prices.npy", self._prices, allow_pickle=False)
+        np.save(directory / "dates.npy", self._dates, allow_pickle=False)
+        np.save(directory / "tickers.npy", np.array(self._tickers), allow_pickle=False)
+
+    @classmethod
+    def open_memmap(cls, directory: Path) -> Backtester:
+        """Reabre o que `save` gravou; os preços ficam mapeados, sem cópia."""
+        return cls(
+            np.load(directory / "dates.npy"),
+            np.load(directory / "tickers.npy").tolist(),
+            np.load(directory / "prices.npy", mmap_mode="r"),
+        )
+
+    def run(
+        self,
+        strategy_cls: type[BaseStrategy],
+        *,
+        start_date: date,
+        end_date: date,
+        starting_cash: float,
+        tickers: Collection[str] | None = None,
+        params: Mapping[str, Any] | None = None,
+        liquidity: Mapping[str, Any] | None = None,
+    ) -> BacktestResult:
+        """
+        `params` vai para o construtor da estratégia; `liquidity` substitui os
+        parâmetros da BetaLiquidityDistribution (alpha, beta, levels, tick_size).
+        """
+        rows, columns = self._replay_window(start_date, end_date, tickers)
+        dates: list[date] = self._dates[rows].tolist()
+
+        started = time.perf_counter()
+        ledger = BacktestLedger(starting_cash, start_date)
+        broker = BacktestBroker(ledger)
+        engine = MatchingEngine(broker)
+        try:
+            if liquidity:
+                engine.market_liquidity.distribution = BetaLiquidityDistribution(
+                    **liquidity
+                )
+            strategy = strategy_cls(engine, BACKTEST_CLIENT_ID, **(params or {}))
+        except (TypeError, ValueError) as e:
+            raise UnprocessableEntityError(f"Parâmetros inválidos: {e}") from e
+
+        opens, highs, lows, closes, volumes = self._prices
+        ticker_names = [self._tickers[j] for j in columns.tolist()]
+        column_of = {self._tickers[j]: j for j in columns.tolist()}
+        last_close = np.full(len(self._tickers), np.nan)
+        equity = np.empty(len(dates))
+
+        with muted():
+            for n, (i, current_date) in enumerate(
+                zip(rows.tolist(), dates, strict=True)
+            ):
+                ledger.current_date = current_date
+                present = columns[~np.isnan(closes[i, columns])].tolist()
+
+                for j in present:
+                    engine.market_data.add_candle(
+                        Candle(
+                            ticker=self._tickers[j],
+                            price_date=current_date,
+                            open=float(opens[i, j]),
+                            high=float(highs[i, j]),
+                            low=float(lows[i, j]),
+                            close=float(closes[i, j]),
+                            volume=int(volumes[i, j]),
+                        )
+                    )
+                engine.on_ticks([self._tickers[j] for j in present])
+
+                strategy.next()
+
+                last_close[present] = closes[i, present]
+                equity[n] = self._equity(engine, broker, ledger, column_of, last_close)
+
+        return BacktestResult(
+            strategy=strategy_cls.__name__,
+            tickers=ticker_names,
+            starting_cash=starting_cash,
+            final_equity=float(equity[-1]) if len(equity) else starting_cash,
+            trades=broker.trades,
+            equity_curve=pd.Series(equity, index=pd.Index(dates, name="date")),
+            ticks=len(dates),
+            elapsed=time.perf_counter() - started,
+        )
+
+    def _replay_window(
+        self,
+        start_date: date,
+        end_date: date,
+        tickers: Collection[str] | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Linhas (datas com pregão) e colunas (tickers com preço) do período."""
+        if start_date > end_date:
+            raise UnprocessableEntityError("A data inicial deve ser anterior à final")
+
+        lo = int(np.searchsorted(self._dates, np.datetime64(start_date, "D")))
+        hi = int(
+            np.searchsorted(self._dates, np.datetime64(end_date, "D"), side="right")
+        )
+        columns = np.arange(len(self._tickers))
+        if tickers is not None:
+            columns = columns[np.isin(self._tickers, list(tickers))]
+
+        missing = np.isnan(self._prices[3, lo:hi])[:, columns]
+        rows = lo + np.flatnonzero(~missing.all(axis=1))
+        columns = columns[~missing.all(axis=0)]
+        if rows.size == 0:
+            raise UnprocessableEntityError("Nenhum preço no período para os tickers")
+        return rows, columns
+
+    @staticmethod
+    def _equity(
+        engine: MatchingEngine,
+        broker: BacktestBroker,
+        ledger: BacktestLedger,
+        column_of: Mapping[str, int],
+        last_close: np.ndarray,
+    ) -> float:
+        """Caixa + posições a mercado + caixa reservado em compras LIMIT pendentes."""
+        total = ledger.get_cash(BACKTEST_CLIENT_ID)
+        for ticker, position in broker.get_positions(BACKTEST_CLIENT_ID).items():
+            total += position.size * float(last_close[column_of[ticker]])
+
+        for ticker in column_of:
+            if not engine.order_book.has_orders(ticker):
+                continue
+            total += sum(
+                order.price * order.remaining
+                for order in engine.order_book.get_orders(ticker)
+                if order.client_id == BACKTEST_CLIENT_ID
+                and order.action == OrderAction.BUY
+            )
+        return total
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import tempfile
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from backend.features.backtest.backtester import Backtester
+from backend.features.strategy.registry import get_strategy
+
+# Backtester do processo worker, criado uma vez pelo initializer
+_worker_backtester: Backtester | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SweepConfig:
+    """Uma configuração da varredura: estratégia e parâmetros de liquidez."""
+
+    params: Mapping[str, Any] = field(default_factory=dict)
+    liquidity: Mapping[str, Any] = field(default_factory=dict)
+
+
+def param_grid(**axes: Sequence[Any]) -> list[dict[str, Any]]:
+    """Produto cartesiano dos eixos, ex.: `param_grid(fast=[5, 10], slow=[20])`."""
+    names = list(axes)
+    return [
+        dict(zip(names, values, strict=True))
+        for values in itertools.product(*axes.values())
+    ]
+
+
+def sample_params(
+    rng: np.random.Generator, n: int, **ranges: Sequence[float]
+) -> list[dict[str, Any]]:
+    """
+    `n` amostras uniformes (Monte Carlo) de cada parâmetro em [min, max].
+
+    Limites inteiros sorteiam inteiros (ex.: janelas de média); os demais,
+    floats em [min, max).
+    """
+    columns: dict[str, list[Any]] = {}
+    for name, (lo, hi) in ranges.items():
+        if isinstance(lo, int) and isinstance(hi, int):
+            columns[name] = rng.integers(lo, hi, n, endpoint=True).tolist()
+        else:
+            columns[name] = rng.uniform(lo, hi, n).tolist()
+    return [{name: values[i] for name, values in columns.items()} for i in range(n)]
+
+
+def monte_carlo_configs(
+    rng: np.random.Generator,
+    n: int,
+    *,
+    params: Mapping[str, Sequence[float]],
+    liquidity: Mapping[str, Sequence[float]],
+) -> list[SweepConfig]:
+    """`n` configurações sorteadas nos intervalos da estratégia e da liquidez."""
+    return [
+        SweepConfig(params=p, liquidity=lq)
+        for p, lq in zip(
+            sample_params(rng, n, **params),
+            sample_params(rng, n, **liquidity),
+            strict=True,
+        )
+    ]
+
+
+def run_sweep(
+    frame: pd.DataFrame,
+    configs: Iterable[SweepConfig],
+    *,
+    strategy: str,
+    start_date: date,
+    end_date: date,
+    starting_cash: float,
+    tickers: Sequence[str] | None = None,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Executa um backtest por configuração em paralelo, em processos separados.
+
+    O histórico é pivotado e gravado uma única vez em arquivos .npy, que cada
+    worker mapeia em modo leitura: as páginas ficam compartilhadas pelo cache
+    do sistema, sem cópia por processo nem serialização por tarefa.
+
+    Retorna uma linha por configuração, na ordem recebida, com os parâmetros
+    (`liquidity.*` para os de liquidez), patrimônio final, retorno, drawdown
+    máximo, número de trades e tempo de execução.
+    """
+    get_strategy(strategy)  # Falha cedo, antes de subir o pool
+    configs = list(configs)
+
+    with tempfile.TemporaryDirectory(prefix="sweep-") as workdir:
+        Backtester.from_frame(frame).save(Path(workdir))
+
+        # spawn: workers limpos, sem herdar threads (writer, loop) do processo pai
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(workdir,),
+        ) as pool:
+            rows = list(
+                pool.map(
+                    _run_config,
+                    configs,
+                    itertools.repeat(
+                        (strategy, start_date, end_date, starting_cash, tickers)
+                    ),
+                )
+            )
+
+    return pd.DataFrame(rows)
+
+
+def _init_worker(directory: str) -> None:
+    global _worker_backtester
+    _worker_backtester = Backtester.open_memmap(Path(directory))
+
+
+def _run_config(
+    config: SweepConfig,
+    run_args: tuple[str, date, date, float, Sequence[str] | None],
+) -> dict[str, Any]:
+    strategy, start_date, end_date, starting_cash, tickers = run_args
+    if _worker_backtester is None:
+        raise RuntimeError("Worker da varredura não inicializado")
+
+    started = time.perf_counter()
+    result = _worker_backtester.run(
+        get_strategy(strategy),
+        start_date=start_date,
+        end_date=end_date,
+        starting_cash=starting_cash,
+        tickers=tickers,
+        params=config.params,
+        liquidity=config.liquidity,
+    )
+    return {
+        **config.params,
+        **{f"liquidity.{k}": v for k, v in config.liquidity.items()},
+        "final_equity": result.final_equity,
+        "total_return": result.total_return,
+        "max_drawdown": result.max_drawdown,
+        "trades": len(result.trades),
+        "elapsed": time.perf_counter() - started,
+    }
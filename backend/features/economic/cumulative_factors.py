@@ -0,0 +1,79 @@
+import math
+from datetime import date, timedelta
+
+import numpy as np
+
+from backend.features.economic.indicator_series import IndicatorSeries
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+
+# Dias úteis por ano na conversão de taxa anual para diária
+BUSINESS_DAYS_PER_YEAR = 252
+
+
+def business_day_number(current_date: date) -> int:
+    """Quantidade de dias úteis (seg-sex) de 1970-01-01 até a data, inclusive."""
+    return int(np.busday_count(_EPOCH, current_date + timedelta(days=1)))
+
+
+def daily_log_factor(annual_rate: float) -> float:
+    """log(1 + taxa diária) equivalente à taxa anual, em 252 dias úteis."""
+    return math.log1p(annual_rate) / BUSINESS_DAYS_PER_YEAR
+
+
+class CumulativeFactors:
+    """
+    Tabela de fatores de juros acumulados de um indexador, por dia útil.
+
+    Responsável por:
+    - Acumular log(1 + taxa diária) dia útil a dia útil, a partir da origem
+    - Estender a tabela sob demanda, com as taxas da série para os dias novos
+    - Responder o fator entre dois dias úteis em O(1), pela diferença dos logs
+    """
+
+    def __init__(self, series: IndicatorSeries):
+        self._series = series
+        self._origin: int | None = None
+        # _log[k]: soma dos logs dos dias úteis origin+1 .. origin+k
+        self._log = np.zeros(256)
+        self._size = 0
+
+    def log_factor(self, day_number: int) -> float:
+        """Log do fator acumulado até o dia útil `day_number` (inclusive)."""
+        origin = self.extend(day_number)
+        if day_number < origin:
+            raise ValueError("Dia anterior à origem da tabela de fatores")
+        return float(self._log[day_number - origin])
+
+    def log_factors(self, day_numbers: np.ndarray) -> np.ndarray:
+        """Versão vetorizada de `log_factor` (dias já cobertos pela tabela)."""
+        if self._origin is None:
+            raise ValueError("Tabela de fatores vazia")
+        offsets = day_numbers - self._origin
+        if offsets.size and (offsets.min() < 0 or offsets.max() >= self._size):
+            raise ValueError("Dia fora do intervalo da tabela de fatores")
+        return self._log[offsets]
+
+    def extend(self, day_number: int) -> int:
+        """Garante a tabela até o dia útil; retorna o dia útil de origem."""
+        if self._origin is None:
+            self._origin = day_number
+            self._size = 1
+        origin = self._origin
+
+        end = day_number - origin + 1
+        if end <= self._size:
+            return origin
+        if end > len(self._log):
+            grown = np.zeros(max(end, 2 * len(self._log)))
+            grown[: self._size] = self._log[: self._size]
+            self._log = grown
+
+        # Data de cada dia útil novo (o n-ésimo dia útil desde a época)
+        dates = np.busday_offset(
+            _EPOCH, np.arange(origin + self._size, origin + end) - 1
+        )
+        steps = np.log1p(self._series.rates_at(dates)) / BUSINESS_DAYS_PER_YEAR
+        self._log[self._size : end] = self._log[self._size - 1] + np.cumsum(steps)
+        self._size = end
+        return origin
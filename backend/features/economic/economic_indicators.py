@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from backend.core import repository
+from backend.core.dto.economic_indicators import EconomicIndicatorsDTO
+from backend.core.enum import RateIndexType
+from backend.features.economic.cumulative_factors import (
+    CumulativeFactors,
+    business_day_number,
+)
+from backend.features.economic.indicator_series import IndicatorSeries
+
+# Taxas anuais usadas quando o banco não tem a série
+_FALLBACK_IPCA = 0.0468
+_FALLBACK_SELIC = 0.150
+
+# O CDI acompanha a SELIC, 0,10 p.p. abaixo
+_CDI_SPREAD = -0.001
+
+
+class EconomicIndicators:
+    """
+    Indicadores econômicos (IPCA, SELIC e CDI) da simulação, em memória.
+
+    As séries são lidas do banco uma única vez por simulação; a partir daí
+    nenhuma consulta de taxa vai ao banco.
+
+    Responsável por:
+    - Converter o histórico para taxas anuais (IPCA mensal é anualizado)
+    - Derivar o CDI da SELIC
+    - Responder a taxa de um indexador em uma data (busca binária)
+    - Manter uma tabela de fatores acumulados por indexador, pré-calculada
+      para o período da simulação
+    """
+
+    def __init__(self, ipca: IndicatorSeries, selic: IndicatorSeries):
+        self._series = {
+            RateIndexType.IPCA: ipca,
+            RateIndexType.SELIC: selic,
+            RateIndexType.CDI: selic.shifted(_CDI_SPREAD),
+        }
+        self._factors = {
+            rate_index: CumulativeFactors(series)
+            for rate_index, series in self._series.items()
+        }
+
+    @classmethod
+    def load(
+        cls, start_date: date | None = None, end_date: date | None = None
+    ) -> EconomicIndicators:
+        ipca = repository.economic.get_ipca_history()
+        selic = repository.economic.get_selic_history()
+        ipca_monthly = ipca["rate_value"].to_numpy(np.float64) / 100
+        indicators = cls(
+            IndicatorSeries(
+                pd.to_datetime(ipca["rate_date"]).to_numpy("datetime64[D]"),
+                (1 + ipca_monthly) ** 12 - 1,
+                _FALLBACK_IPCA,
+            ),
+            IndicatorSeries(
+                pd.to_datetime(selic["rate_date"]).to_numpy("datetime64[D]"),
+                selic["rate_value"].to_numpy(np.float64) / 100,
+                _FALLBACK_SELIC,
+            ),
+        )
+        if start_date is not None and end_date is not None:
+            indicators.precompute(start_date, end_date)
+        return indicators
+
+    def precompute(self, start_date: date, end_date: date) -> None:
+        """Calcula de uma vez as tabelas de fatores do período."""
+        for factors in self._factors.values():
+            factors.extend(business_day_number(start_date))
+            factors.extend(business_day_number(end_date))
+
+    def rate(self, rate_index: RateIndexType, current_date: date) -> float:
+        return self._series[rate_index].rate_at(current_date)
+
+    def factors(self, rate_index: RateIndexType) -> CumulativeFactors:
+        return self._factors[rate_index]
+
+    def get_cdi_rate(self, current_date: date) -> float:
+        return self.rate(RateIndexType.CDI, current_date)
+
+    def get_ipca_rate(self, current_date: date) -> float:
+        return self.rate(RateIndexType.IPCA, current_date)
+
+    def get_selic_rate(self, current_date: date) -> float:
+        return self.rate(RateIndexType.SELIC, current_date)
+
+    def to_dto(self, current_date: date) -> EconomicIndicatorsDTO:
+        return EconomicIndicatorsDTO(
+            ipca=self.get_ipca_rate(current_date),
+            selic=self.get_selic_rate(current_date),
+            cdi=self.get_cdi_rate(current_date),
+        )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date
+
+import numpy as np
+
+
+class IndicatorSeries:
+    """
+    Série histórica de um indicador, como função degrau da data.
+
+    Cada observação vale da sua data até a véspera da próxima; antes da
+    primeira observação vale a primeira, depois da última vale a última.
+    Sem observações, a série é constante no valor de fallback.
+
+    Responsável por:
+    - Manter datas e taxas anuais em arrays ordenados
+    - Responder a taxa vigente em uma data por busca binária
+    - Responder as taxas de várias datas de uma vez (np.searchsorted)
+    """
+
+    def __init__(self, dates: np.ndarray, annual_rates: np.ndarray, fallback: float):
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        order = np.argsort(dates, kind="stable")
+        self._dates = dates[order]
+        self._rates = np.asarray(annual_rates, dtype=np.float64)[order]
+        self._ordinals: list[int] = [d.toordinal() for d in self._dates.tolist()]
+        self._fallback = fallback
+
+    @classmethod
+    def constant(cls, annual_rate: float) -> IndicatorSeries:
+        return cls(np.array([], dtype="datetime64[D]"), np.array([]), annual_rate)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def rate_at(self, current_date: date) -> float:
+        """Taxa anual vigente na data."""
+        if not self._ordinals:
+            return self._fallback
+        i = bisect_right(self._ordinals, current_date.toordinal()) - 1
+        return float(self._rates[max(i, 0)])
+
+    def rates_at(self, dates: np.ndarray) -> np.ndarray:
+        """Versão vetorizada de `rate_at` (datas em datetime64[D])."""
+        if not self._ordinals:
+            return np.full(len(dates), self._fallback)
+        i = np.searchsorted(self._dates, dates, side="right") - 1
+        return self._rates[np.maximum(i, 0)]
+
+    def shifted(self, spread: float) -> IndicatorSeries:
+        """Mesma série somada a um spread fixo (ex: CDI a partir da SELIC)."""
+        return IndicatorSeries(
+            self._dates, self._rates + spread, self._fallback + spread
+        )
@@ -1,20 +1,62 @@
-from dataclasses import dataclass, field
+from __future__ import annotations
+
 from datetime import date
+from typing import TYPE_CHECKING
 
-from backend.core import repository
 from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
-from backend.core.enum import FixedIncomeType, RateIndexType
+from backend.core.enum import FixedIncomeType
+
+if TYPE_CHECKING:
+    from backend.features.fixed_income.fixed_income_book import FixedIncomeBook
 
 
-@dataclass
 class FixedIncomePosition:
-    asset: FixedIncomeAssetDTO
-    total_applied: float  # Capital inicial (C)
-    current_value: float = field(init=False)  # Montante (M)
-    first_applied_date: date  # Data do primeiro aporte
+    """
+    Posição de renda fixa de um cliente.
+
+    Enquanto aberta, capital aplicado (C) e montante (M) vivem em um slot do
+    FixedIncomeBook, que calcula o montante sob demanda a partir da data de
+    abertura (`as_of`); ao fechar, os valores finais ficam na própria posição.
+    """
+
+    __slots__ = (
+        "_book",
+        "_closed_values",
+        "_slot",
+        "asset",
+        "first_applied_date",
+    )
+
+    def __init__(
+        self,
+        book: FixedIncomeBook,
+        asset: FixedIncomeAssetDTO,
+        total_applied: float,  # Capital inicial (C)
+        first_applied_date: date,  # Data do primeiro aporte
+        as_of: date,  # Data em que o montante vale total_applied
+    ):
+        self.asset = asset
+        self.first_applied_date = first_applied_date
+        self._book = book
+        self._slot = book.open(asset, total_applied, as_of)
+        self._closed_values: tuple[float, float] | None = None
 
-    def __post_init__(self):
-        self.current_value = self.total_applied
+    @property
+    def total_applied(self) -> float:
+        if self._closed_values is not None:
+            return self._closed_values[0]
+        return self._book.total_applied(self._slot)
+
+    @property
+    def current_value(self) -> float:
+        """Montante (M)."""
+        if self._closed_values is not None:
+            return self._closed_values[1]
+        return self._book.current_value(self._slot)
+
+    @property
+    def slot(self) -> int:
+        return self._slot
 
     def invest(self, value: float):
         """
@@ -22,30 +64,12 @@ class FixedIncomePosition:
         - aumenta o capital aplicado (C)
         - aumenta o montante (M)
         """
-        self.total_applied += value
-        self.current_value += value
+        self._book.invest(self._slot, value)
 
-    def apply_daily_interest(self, current_date: date):
-        """
-        Aplica juros diários sobre o montante (M).
-        """
-        annual_rate = self.get_index_rate(current_date, self.asset.rate_index)
-        daily_rate = self.annual_to_daily_rate(annual_rate)
-        self.current_value *= 1 + daily_rate
-
-    def get_index_rate(self, current_date: date, rate_index: RateIndexType) -> float:
-        match rate_index:
-            case RateIndexType.CDI:
-                return repository.economic.get_cdi_rate(current_date)
-            case RateIndexType.IPCA:
-                return repository.economic.get_ipca_rate(current_date)
-            case RateIndexType.SELIC:
-                return repository.economic.get_selic_rate(current_date)
-            case RateIndexType.PREFIXADO:
-                return self.asset.interest_rate
-
-    def annual_to_daily_rate(self, annual_rate: float) -> float:
-        return (1 + annual_rate) ** (1 / 252) - 1
+    def close(self) -> None:
+        """Libera o slot no book, congelando os valores atuais."""
+        if self._closed_values is None:
+            self._closed_values = self._book.close(self._slot)
 
     def calculate_ir(self, current_date: date) -> float:
         if self.asset.investment_type in (FixedIncomeType.LCI, FixedIncomeType.LCA):
@@ -7,6 +7,7 @@ from backend.core.dto.fixed_income_asset import (
     FixedIncomeAssetDTO,
 )
 from backend.core.enum import FixedIncomeType, RateIndexType
+from backend.features.economic.economic_indicators import EconomicIndicators
 from backend.features.fixed_income.factory.abstract_factory import (
     AbstractFixedIncomeFactory,
 )
@@ -48,7 +49,11 @@ class FixedIncomeFactory:
 
     @classmethod
     def generate_assets(
-        cls, current_date: date, n: int, seed: int | None = None
+        cls,
+        current_date: date,
+        indicators: EconomicIndicators,
+        n: int,
+        seed: int | None = None,
     ) -> dict[str, FixedIncomeAssetDTO]:
         if seed is not None:
             random.seed(seed)
@@ -70,14 +75,14 @@ class FixedIncomeFactory:
         for asset_type, rate_index in combinations:
             factory = cls._registry[asset_type]
             for _ in range(base_count):
-                asset = factory.create_asset(rate_index, current_date)
+                asset = factory.create_asset(rate_index, current_date, indicators)
                 generated[str(asset.asset_uuid)] = asset
 
         # Restante aleatório porém balanceado
         extras = random.sample(combinations, remainder)
         for asset_type, rate_index in extras:
             factory = cls._registry[asset_type]
-            asset = factory.create_asset(rate_index, current_date)
+            asset = factory.create_asset(rate_index, current_date, indicators)
             generated[str(asset.asset_uuid)] = asset
 
         return generated
@@ -3,9 +3,9 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable
 from datetime import date, timedelta
 
-from backend.core import repository
 from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
 from backend.core.enum import RateIndexType
+from backend.features.economic.economic_indicators import EconomicIndicators
 
 
 class AbstractFixedIncomeFactory(ABC):
@@ -24,20 +24,24 @@ class AbstractFixedIncomeFactory(ABC):
         return list(self._strategies.keys())
 
     def create_asset(
-        self, rate_index: RateIndexType, current_date: date
+        self,
+        rate_index: RateIndexType,
+        current_date: date,
+        indicators: EconomicIndicators,
     ) -> FixedIncomeAssetDTO:
         try:
-            return self._strategies[rate_index](current_date)
+            strategy = self._strategies[rate_index]
         except KeyError as e:
             raise ValueError(
                 f"Indexador {rate_index} não suportado por {self.__class__.__name__}"
             ) from e
+        return strategy(current_date, indicators)
 
     @property
     @abstractmethod
     def _strategies(
         self,
-    ) -> dict[RateIndexType, Callable[[date], FixedIncomeAssetDTO]]:
+    ) -> dict[RateIndexType, Callable[[date, EconomicIndicators], FixedIncomeAssetDTO]]:
         """Mapeia indexadores para funções de criação de ativos."""
         pass
 
@@ -95,15 +99,15 @@ class AbstractFixedIncomeFactory(ABC):
     def _generate_ipca_spread(
         self,
         current_date: date,
-        spread_index: Callable[[date], float],
+        indicators: EconomicIndicators,
+        spread_index: RateIndexType,
         multiplier: float = 1.0,
     ) -> float:
         """
         Retorna spread real (ex: 0.045 = IPCA + 4.5%)
         """
-        spread_base = spread_index(current_date) - repository.economic.get_ipca_rate(
-            current_date
-        )
+        base_rate = indicators.rate(spread_index, current_date)
+        spread_base = base_rate - indicators.get_ipca_rate(current_date)
         return self._random_rate(spread_base, 0.01, multiplier)
 
     def _generate_prefixado_rate(
@@ -1,11 +1,11 @@
 from datetime import date
 
-from backend.core import repository
 from backend.core.dto.fixed_income_asset import (
     FixedIncomeAssetDTO,
 )
 from backend.core.enum import FixedIncomeType, RateIndexType
 from backend.core.utils import format_percent
+from backend.features.economic.economic_indicators import EconomicIndicators
 from backend.features.fixed_income.factory.abstract_factory import (
     AbstractFixedIncomeFactory,
 )
@@ -27,7 +27,9 @@ class LCIFactory(AbstractFixedIncomeFactory):
             RateIndexType.PREFIXADO: self.create_prefixado,
         }
 
-    def create_cdi(self, current_date: date) -> FixedIncomeAssetDTO:
+    def create_cdi(
+        self, current_date: date, indicators: EconomicIndicators
+    ) -> FixedIncomeAssetDTO:
         maturity_date = self._generate_maturity(current_date, 0, 6)
         rate = self._generate_cdi_rate(multiplier=0.85)
         issuer = "Banco Imobiliário"
@@ -41,11 +43,14 @@ class LCIFactory(AbstractFixedIncomeFactory):
             maturity_date=maturity_date,
         )
 
-    def create_ipca(self, current_date: date) -> FixedIncomeAssetDTO:
+    def create_ipca(
+        self, current_date: date, indicators: EconomicIndicators
+    ) -> FixedIncomeAssetDTO:
         maturity_date = self._generate_maturity(current_date, 0, 8)
         spread = self._generate_ipca_spread(
             current_date,
-            spread_index=repository.economic.get_cdi_rate,
+            indicators,
+            spread_index=RateIndexType.CDI,
             multiplier=0.85,
         )
         issuer = "Banco Imobiliário"
@@ -59,10 +64,12 @@ class LCIFactory(AbstractFixedIncomeFactory):
             maturity_date=maturity_date,
         )
 
-    def create_prefixado(self, current_date: date) -> FixedIncomeAssetDTO:
+    def create_prefixado(
+        self, current_date: date, indicators: EconomicIndicators
+    ) -> FixedIncomeAssetDTO:
         maturity_date = self._generate_maturity(current_date, 0, 5)
         rate = self._generate_prefixado_rate(
-            current_date, base_index=repository.economic.get_cdi_rate, multiplier=0.85
+            current_date, base_index=indicators.get_cdi_rate, multiplier=0.85
         )
         issuer = "Banco Imobiliário"
 
@@ -1,10 +1,10 @@
 from datetime import date
 
-from backend.core import repository
 from backend.core.dto.fixed_income_asset import (
     FixedIncomeAssetDTO,
 )
 from backend.core.enum import FixedIncomeType, RateIndexType
+from backend.features.economic.economic_indicators import EconomicIndicators
 from backend.features.fixed_income.factory.abstract_factory import (
     AbstractFixedIncomeFactory,
 )
@@ -27,12 +27,15 @@ class TesouroFactory(AbstractFixedIncomeFactory):
             RateIndexType.PREFIXADO: self.create_prefixado,
         }
 
-    def create_ipca(self, current_date: date) -> FixedIncomeAssetDTO:
+    def create_ipca(
+        self, current_date: date, indicators: EconomicIndicators
+    ) -> FixedIncomeAssetDTO:
         maturity_date = self._generate_maturity(current_date, 3, 15)
         maturity_year = maturity_date.year
         spread = self._generate_ipca_spread(
             current_date,
-            spread_index=repository.economic.get_selic_rate,
+            indicators,
+            spread_index=RateIndexType.SELIC,
         )
 
         return FixedIncomeAssetDTO(
@@ -44,12 +47,14 @@ class TesouroFactory(AbstractFixedIncomeFactory):
             maturity_date=maturity_date,
         )
 
-    def create_prefixado(self, current_date: date) -> FixedIncomeAssetDTO:
+    def create_prefixado(
+        self, current_date: date, indicators: EconomicIndicators
+    ) -> FixedIncomeAssetDTO:
         maturity_date = self._generate_maturity(current_date, 3, 7)
         maturity_year = maturity_date.year
         rate = self._generate_prefixado_rate(
             current_date,
-            base_index=lambda current_date: repository.economic.get_selic_rate(
+            base_index=lambda current_date: indicators.get_selic_rate(
                 current_date
             )
             - 0.01,  # Redução de 1% devido ao longo prazo
@@ -64,7 +69,9 @@ class TesouroFactory(AbstractFixedIncomeFactory):
             maturity_date=maturity_date,
         )
 
-    def create_selic(self, current_date: date) -> FixedIncomeAssetDTO:
+    def create_selic(
+        self, current_date: date, indicators: EconomicIndicators
+    ) -> FixedIncomeAssetDTO:
         maturity_date = self._generate_maturity(current_date, 3, 7)
         maturity_year = maturity_date.year
         spread = self._generate_selic_spread()
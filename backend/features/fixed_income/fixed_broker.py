@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
-import threading
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
+from functools import partial
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -16,12 +18,15 @@ from backend.core.dto.fixed_income_position import FixedIncomePositionDTO
 from backend.core.enum import FixedIncomeEventType
 from backend.core.exceptions.http_exceptions import ConflictError
 from backend.core.runtime.event_manager import EventManager
+from backend.core.runtime.persistence_writer import PersistenceWriter
 from backend.core.runtime.user_manager import UserManager
+from backend.core.utils.keyed_lock import KeyedLock
 from backend.core.utils.lazy_dict import LazyDict
 from backend.features.fixed_income.entities.fixed_income_position import (
     FixedIncomePosition,
 )
-from backend.features.realtime import notify
+from backend.features.fixed_income.fixed_income_book import FixedIncomeBook
+from backend.features.realtime import is_muted, notify
 from backend.features.realtime.schemas import FixedIncomePositionUpdateEventDTO
 
 if TYPE_CHECKING:
@@ -30,23 +35,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def load_fixed_assets(client_id: UUID) -> dict[str, FixedIncomePosition]:
-    user_id = UserManager.get_user_id(client_id)
-
-    dtos = repository.portfolio.get_fixed_income_positions(user_id)
-
-    assets: dict[str, FixedIncomePosition] = {}
-
-    for dto in dtos:
-        assets[dto.asset.name] = FixedIncomePosition(
-            asset=dto.asset,
-            total_applied=dto.total_applied,
-            first_applied_date=dto.first_applied_date,
-        )
-
-    return assets
-
-
 class FixedBroker:
     """
     Gerenciador de operações e posições de renda fixa.
@@ -54,23 +42,35 @@ class FixedBroker:
     Responsável por:
     - Executar compras de ativos de renda fixa (buy) com validação de saldo e vencimento
     - Manter posições dos players com cache lazy carregado do banco
-    - Aplicar juros diários em todas as posições ativas
+    - Avaliar as posições ativas sob demanda, em forma fechada no FixedIncomeBook
     - Processar vencimento de ativos e creditar valores ao player
     - Registrar eventos de renda fixa (BUY, INTEREST, MATURITY)
     - Emitir notificações realtime de atualizações de portfólio
     """
 
-    def __init__(self, simulation_engine: SimulationEngine, lock: threading.RLock):
+    def __init__(
+        self, simulation_engine: SimulationEngine, client_locks: KeyedLock[UUID]
+    ):
         self._simulation_engine = simulation_engine
-        self._lock = lock
+        self._client_locks = client_locks
+        self._book = FixedIncomeBook(simulation_engine.indicators)
         self._assets: LazyDict[UUID, dict[str, FixedIncomePosition]] = LazyDict(
-            load_fixed_assets
+            self._load_positions
         )
+        # Dono de cada slot ocupado no book: (cliente, nome do ativo)
+        self._slot_owners: dict[int, tuple[UUID, str]] = {}
 
     def get_fixed_positions(self, client_id: UUID) -> dict[str, FixedIncomePosition]:
-        with self._lock:
+        with self._client_locks(client_id):
             return self._assets[client_id]
 
+    def evict(self, client_id: UUID) -> None:
+        """Descarta as posições em cache do cliente, liberando seus slots."""
+        with self._client_locks(client_id):
+            positions = self._assets.pop(client_id, None) or {}
+            for position in positions.values():
+                self._close(position)
+
     def buy(self, client_id: UUID, asset: FixedIncomeAssetDTO, value: float):
         if value <= 0:
             raise ValueError("Valor do investimento deve ser maior que zero")
@@ -80,7 +80,7 @@ class FixedBroker:
                 f"Ativo {asset.name} já venceu em {asset.maturity_date}"
             )
 
-        with self._lock:
+        with self._client_locks(client_id):
             if self._simulation_engine.get_cash(client_id) < value:
                 raise ValueError(f"Saldo insuficiente para investir em {asset.name}")
 
@@ -89,10 +89,12 @@ class FixedBroker:
             if asset.name in self._assets[client_id]:
                 self._assets[client_id][asset.name].invest(value)
             else:
-                self._assets[client_id][asset.name] = FixedIncomePosition(
-                    asset=asset,
-                    total_applied=value,
-                    first_applied_date=self._simulation_engine.current_date,
+                self._open(
+                    client_id,
+                    asset,
+                    value,
+                    self._simulation_engine.current_date,
+                    self._assets[client_id],
                 )
 
         asset_id = repository.fixed_income.get_or_create_asset(asset)
@@ -110,44 +112,83 @@ class FixedBroker:
             f"Investido {value:.2f} em {asset.name} ({asset.investment_type.value})"
         )
 
-    def apply_daily_interest(self, current_date: date):
-        for client_id, assets_by_client in list(self._assets.items()):
+    def advance(self, current_date: date):
+        # Os juros são calculados sob demanda; aqui só os vencimentos do dia
+        expired_slots = self._book.advance(current_date)
+
+        expired_by_client: dict[UUID, list[int]] = defaultdict(list)
+        for slot in expired_slots:
+            owner = self._slot_owners.get(slot)
+            if owner is not None:
+                expired_by_client[owner[0]].append(slot)
+
+        for client_id, slots in expired_by_client.items():
             user_id = UserManager.get_user_id(client_id)
-            updates: list[FixedIncomePositionDTO] = []
-            has_expired = False
-            for asset_name, position in list(assets_by_client.items()):
-                with self._lock:
-                    position.apply_daily_interest(current_date)
-                    expired = current_date >= position.asset.maturity_date
-                    if expired:
-                        del assets_by_client[asset_name]
-                    else:
-                        update_dto = FixedIncomePositionDTO(
-                            asset=position.asset,
-                            total_applied=position.total_applied,
-                            current_value=position.current_value,
-                            first_applied_date=position.first_applied_date,
-                        )
-
-                if expired:
-                    self.redeem_position(
-                        current_date,
-                        client_id,
-                        user_id,
-                        asset_name,
-                        position,
-                    )
-                    has_expired = True
-                else:
-                    updates.append(update_dto)
-
-            if updates or has_expired:
-                notify(
-                    "fixed_income_position_update",
-                    FixedIncomePositionUpdateEventDTO(positions=updates).to_json(),
-                    client_id,
+            redeemed: list[tuple[str, FixedIncomePosition]] = []
+            with self._client_locks(client_id):
+                for slot in slots:
+                    # O cliente pode ter sido descartado do cache desde o passo
+                    owner = self._slot_owners.get(slot)
+                    if owner is None or owner[0] != client_id:
+                        continue
+                    position = self._assets[client_id].pop(owner[1])
+                    self._close(position)
+                    redeemed.append((owner[1], position))
+            for asset_name, position in redeemed:
+                self.redeem_position(
+                    current_date, client_id, user_id, asset_name, position
                 )
 
+        if is_muted():
+            return
+
+        updates_by_client = self.get_position_dtos(list(self._assets), cached_only=True)
+        for client_id, updates in updates_by_client.items():
+            if not updates and client_id not in expired_by_client:
+                continue
+            notify(
+                "fixed_income_position_update",
+                FixedIncomePositionUpdateEventDTO(positions=updates).to_json(),
+                client_id,
+            )
+
+    def get_position_dtos(
+        self, client_ids: Iterable[UUID], *, cached_only: bool = False
+    ) -> dict[UUID, list[FixedIncomePositionDTO]]:
+        """
+        Posições dos clientes avaliadas em lote, em uma única consulta ao book.
+
+        Com `cached_only`, clientes fora do cache não são carregados do banco.
+        """
+        client_ids = list(client_ids)
+        if not cached_only:
+            # Carga do banco fora do lote, com um lock de cliente por vez
+            for client_id in client_ids:
+                self.get_fixed_positions(client_id)
+
+        with self._client_locks.acquire_many(client_ids):
+            positions = [
+                (client_id, position)
+                for client_id in client_ids
+                for position in self._assets.get(client_id, {}).values()
+            ]
+            values = self._book.current_values([p.slot for _, p in positions])
+            totals = [position.total_applied for _, position in positions]
+
+        dtos: dict[UUID, list[FixedIncomePositionDTO]] = {c: [] for c in client_ids}
+        for (client_id, position), total, value in zip(
+            positions, totals, values.tolist(), strict=True
+        ):
+            dtos[client_id].append(
+                FixedIncomePositionDTO(
+                    asset=position.asset,
+                    total_applied=total,
+                    current_value=value,
+                    first_applied_date=position.first_applied_date,
+                )
+            )
+        return dtos
+
     def redeem_position(
         self,
         current_date: date,
@@ -172,9 +213,51 @@ class FixedBroker:
                 event_date=current_date,
             )
         )
-        repository.fixed_income.delete_position(
-            simulation_id=simulation_id, user_id=user_id, asset_id=asset_id
+        # Passa pelo writer para não ultrapassar um upsert de snapshot pendente
+        PersistenceWriter.submit(
+            partial(
+                repository.fixed_income.delete_position,
+                simulation_id=simulation_id,
+                user_id=user_id,
+                asset_id=asset_id,
+            )
         )
         logger.info(
             f"REDEEM de {redeem_value:.2f} em {asset_name} (maturity, IR={ir_amount:.2f})"
         )
+
+    def _load_positions(self, client_id: UUID) -> dict[str, FixedIncomePosition]:
+        user_id = UserManager.get_user_id(client_id)
+
+        dtos = repository.portfolio.get_fixed_income_positions(user_id)
+
+        assets: dict[str, FixedIncomePosition] = {}
+
+        for dto in dtos:
+            self._open(
+                client_id, dto.asset, dto.total_applied, dto.first_applied_date, assets
+            )
+
+        return assets
+
+    def _open(
+        self,
+        client_id: UUID,
+        asset: FixedIncomeAssetDTO,
+        value: float,
+        first_applied_date: date,
+        assets: dict[str, FixedIncomePosition],
+    ) -> None:
+        position = FixedIncomePosition(
+            self._book,
+            asset=asset,
+            total_applied=value,
+            first_applied_date=first_applied_date,
+            as_of=self._simulation_engine.current_date,
+        )
+        assets[asset.name] = position
+        self._slot_owners[position.slot] = (client_id, asset.name)
+
+    def _close(self, position: FixedIncomePosition) -> None:
+        self._slot_owners.pop(position.slot, None)
+        position.close()
@@ -0,0 +1,178 @@
+import heapq
+import threading
+from datetime import date
+
+import numpy as np
+
+from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
+from backend.core.enum import RateIndexType
+from backend.features.economic.cumulative_factors import (
+    business_day_number,
+    daily_log_factor,
+)
+from backend.features.economic.economic_indicators import EconomicIndicators
+
+# Código de cada indexador nos arrays do book
+_INDEX_CODES = {rate_index: code for code, rate_index in enumerate(RateIndexType)}
+_PREFIXADO = _INDEX_CODES[RateIndexType.PREFIXADO]
+
+
+class FixedIncomeBook:
+    """
+    Posições de renda fixa de todos os clientes em arrays paralelos (SoA).
+
+    Cada posição guarda só o valor e o dia útil da última avaliação (âncora);
+    o montante é calculado sob demanda em forma fechada, pelo fator acumulado
+    entre a âncora e o dia corrente. Avançar dias não toca nas posições.
+
+    Responsável por:
+    - Alocar slots para as posições abertas, reaproveitando os liberados
+    - Avaliar os indexados pelas tabelas de fatores dos indicadores econômicos
+    - Avaliar posições em O(1), individualmente ou em lote
+    - Apontar os slots cujo ativo vence na data, por um heap de vencimentos
+    """
+
+    def __init__(self, indicators: EconomicIndicators, capacity: int = 64):
+        self._lock = threading.Lock()
+        self._factors = {
+            _INDEX_CODES[rate_index]: indicators.factors(rate_index)
+            for rate_index in (
+                RateIndexType.CDI,
+                RateIndexType.IPCA,
+                RateIndexType.SELIC,
+            )
+        }
+        self._today: int | None = None  # dia útil corrente
+
+        self._anchor_value = np.zeros(capacity)
+        self._anchor_day = np.zeros(capacity, dtype=np.int64)
+        self._total_applied = np.zeros(capacity)
+        self._index = np.zeros(capacity, dtype=np.int8)
+        # log(1 + taxa diária) fixo dos prefixados (indexados usam as tabelas)
+        self._prefixed_log = np.zeros(capacity)
+        self._active = np.zeros(capacity, dtype=bool)
+        # Incrementada a cada abertura, invalida as entradas antigas do heap
+        self._generation = np.zeros(capacity, dtype=np.int64)
+        # (vencimento em date.toordinal(), slot, geração); entradas de slots
+        # fechados ou reaproveitados são descartadas ao sair do heap
+        self._maturities: list[tuple[int, int, int]] = []
+        self._free: list[int] = []
+        self._size = 0  # slots já usados alguma vez
+
+    def advance(self, current_date: date) -> list[int]:
+        """Move o dia corrente para a data e retorna os slots que vencem nela."""
+        with self._lock:
+            self._set_today(current_date)
+            today = current_date.toordinal()
+            expired: list[int] = []
+            while self._maturities and self._maturities[0][0] <= today:
+                _, slot, generation = heapq.heappop(self._maturities)
+                if self._active[slot] and self._generation[slot] == generation:
+                    expired.append(slot)
+            return expired
+
+    def open(
+        self, asset: FixedIncomeAssetDTO, total_applied: float, as_of: date
+    ) -> int:
+        with self._lock:
+            if self._today is None:
+                self._set_today(as_of)
+            anchor = business_day_number(as_of)
+            slot = self._free.pop() if self._free else self._next_slot()
+            code = _INDEX_CODES[asset.rate_index]
+            self._anchor_value[slot] = total_applied
+            self._anchor_day[slot] = anchor
+            self._total_applied[slot] = total_applied
+            self._index[slot] = code
+            self._prefixed_log[slot] = (
+                daily_log_factor(asset.interest_rate) if code == _PREFIXADO else 0
+            )
+            self._active[slot] = True
+            self._generation[slot] += 1
+            heapq.heappush(
+                self._maturities,
+                (asset.maturity_date.toordinal(), slot, int(self._generation[slot])),
+            )
+            return slot
+
+    def invest(self, slot: int, value: float) -> None:
+        """Aporta no slot, reancorando a posição no dia corrente."""
+        with self._lock:
+            self._anchor_value[slot] = self._value(slot) + value
+            if self._today is not None:
+                self._anchor_day[slot] = self._today
+            self._total_applied[slot] += value
+
+    def close(self, slot: int) -> tuple[float, float]:
+        """Libera o slot; retorna (total aplicado, montante) no fechamento."""
+        with self._lock:
+            values = float(self._total_applied[slot]), self._value(slot)
+            self._active[slot] = False
+            self._free.append(slot)
+            return values
+
+    def total_applied(self, slot: int) -> float:
+        return float(self._total_applied[slot])
+
+    def current_value(self, slot: int) -> float:
+        with self._lock:
+            return self._value(slot)
+
+    def current_values(self, slots: list[int]) -> np.ndarray:
+        """Montante de vários slots de uma vez, no dia corrente."""
+        with self._lock:
+            index = np.asarray(slots, dtype=np.intp)
+            if self._today is None:
+                return self._anchor_value[index]
+            codes = self._index[index]
+            anchors = self._anchor_day[index]
+            growth = self._prefixed_log[index] * (self._today - anchors)
+            for code, factors in self._factors.items():
+                mask = codes == code
+                if mask.any():
+                    factors.extend(int(anchors[mask].max()))
+                    growth[mask] = factors.log_factor(
+                        self._today
+                    ) - factors.log_factors(anchors[mask])
+            return self._anchor_value[index] * np.exp(growth)
+
+    def _value(self, slot: int) -> float:
+        anchor_value = float(self._anchor_value[slot])
+        if self._today is None:
+            return anchor_value
+        anchor = int(self._anchor_day[slot])
+        code = int(self._index[slot])
+        if code == _PREFIXADO:
+            growth = float(self._prefixed_log[slot]) * (self._today - anchor)
+        else:
+            factors = self._factors[code]
+            growth = factors.log_factor(self._today) - factors.log_factor(anchor)
+        return anchor_value * float(np.exp(growth))
+
+    def _set_today(self, current_date: date) -> None:
+        self._today = business_day_number(current_date)
+        for factors in self._factors.values():
+            factors.extend(self._today)
+
+    def _next_slot(self) -> int:
+        if self._size == len(self._active):
+            self._grow()
+        slot = self._size
+        self._size += 1
+        return slot
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._active)
+        for name in (
+            "_anchor_value",
+            "_anchor_day",
+            "_total_applied",
+            "_index",
+            "_prefixed_log",
+            "_active",
+            "_generation",
+        ):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
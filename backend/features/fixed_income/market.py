@@ -3,6 +3,7 @@ from datetime import date
 
 from backend.core import repository
 from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
+from backend.features.economic.economic_indicators import EconomicIndicators
 from backend.features.fixed_income.factory import FixedIncomeFactory
 from backend.features.realtime import notify
 from backend.features.realtime.schemas import FixedAssetsUpdateEventDTO
@@ -21,7 +22,8 @@ class FixedIncomeMarket:
     - Fornecer consultas de ativos disponíveis e busca por UUID
     """
 
-    def __init__(self):
+    def __init__(self, indicators: EconomicIndicators):
+        self._indicators = indicators
         self._current_month: tuple[int, int] | None = None
         self._assets: dict[str, FixedIncomeAssetDTO] = {}
 
@@ -52,8 +54,10 @@ class FixedIncomeMarket:
         current_date = date(year, month, 1)
 
         self._assets = FixedIncomeFactory.generate_assets(
-            current_date=current_date, n=10
+            current_date=current_date, indicators=self._indicators, n=10
         )
+        # Grava o hall de uma vez; compras e resgates acham o id no cache
+        repository.fixed_income.get_or_create_assets(self.get_available_assets())
         notify(
             "fixed_assets_update",
             FixedAssetsUpdateEventDTO(assets=self.get_available_assets()).to_json(),
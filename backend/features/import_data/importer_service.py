@@ -8,8 +8,11 @@ import yfinance as yf
 from fastapi import UploadFile
 
 from backend.core import repository
-from backend.core.exceptions.http_exceptions import NotFoundError
-from backend.core.models.models import StockPriceHistory
+from backend.core.enum import EconomicIndicatorType
+from backend.core.exceptions.http_exceptions import (
+    NotFoundError,
+    UnprocessableEntityError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +101,21 @@ def from_csv(file: UploadFile, fillzero: bool = True) -> pd.DataFrame:
     return df
 
 
+def from_sgs_csv(file: UploadFile) -> pd.DataFrame:
+    """Lê uma série do SGS do Banco Central (data;valor, dd/mm/aaaa, 1,23)."""
+    logger.info(f"Lendo série do arquivo CSV '{file.filename}'...")
+    df = pd.read_csv(file.file, sep=";", decimal=",", dtype={"data": str})
+    df.columns = [str(col).strip().lower() for col in df.columns]
+    if not {"data", "valor"} <= set(df.columns):
+        raise UnprocessableEntityError(
+            "CSV inválido: esperado o cabeçalho 'data;valor' do SGS do Banco Central"
+        )
+
+    df["data"] = pd.to_datetime(df["data"], format="%d/%m/%Y", errors="coerce")
+    df["valor"] = pd.to_numeric(df["valor"], errors="coerce")
+    return df.dropna(subset=["data", "valor"])
+
+
 # -------------------
 # Inserção no banco
 # -------------------
@@ -134,22 +152,20 @@ def upsert_dataframe(df: pd.DataFrame, ticker: str, overwrite: bool = False):
                 logger.info(f"'{ticker}' já está atualizado.")
                 return
 
-    # 4. Inserir dados no banco
-    registros = [
-        StockPriceHistory(
-            stock_id=stock.id,
-            price_date=index,
-            open=row["Open"],
-            high=row["High"],
-            low=row["Low"],
-            close=row["Close"],
-            volume=row["Volume"],
-        )
-        for index, row in df.iterrows()
-    ]
-
-    repository.stock.add_stock_price_history(registros)
-    logger.info(f"{len(registros)} registros inseridos para '{ticker}'.")
+    # 4. Inserir dados no banco (COPY direto das colunas)
+    inseridos = repository.stock.add_stock_price_history(
+        stock.id,
+        df.rename(
+            columns={
+                "Open": "open",
+                "High": "high",
+                "Low": "low",
+                "Close": "close",
+                "Volume": "volume",
+            }
+        ),
+    )
+    logger.info(f"{inseridos} registros inseridos para '{ticker}'.")
 
 
 # -------------------
@@ -216,3 +232,20 @@ def update_from_csv(file: UploadFile, ticker: str, overwrite: bool = False):
     except Exception:
         logger.exception("Erro ao ler arquivo CSV")
         raise
+
+
+def update_indicator_from_csv(file: UploadFile, indicator: EconomicIndicatorType):
+    try:
+        df = from_sgs_csv(file)
+        rows = list(
+            zip(df["data"].dt.date, df["valor"].astype(float).tolist(), strict=True)
+        )
+        upsert = {
+            EconomicIndicatorType.IPCA: repository.economic.upsert_ipca_history,
+            EconomicIndicatorType.SELIC: repository.economic.upsert_selic_history,
+        }[indicator]
+        inseridos = upsert(rows)
+        logger.info(f"{inseridos} registros de {indicator.value.upper()} gravados.")
+    except Exception:
+        logger.exception("Erro ao ler série do arquivo CSV")
+        raise
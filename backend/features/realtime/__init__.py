@@ -1,9 +1,18 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from backend.core.runtime.realtime_broker_manager import RealtimeBrokerManager
 from backend.features.realtime.realtime_broker import RealtimeBroker
 from backend.features.realtime.sse_broker import SSEBroker
 from backend.features.realtime.ws_broker import SocketBroker
 from backend.types import ClientID, Event, JSONValue
 
+_local = threading.local()
+
+# Eventos de "estado atual": num lote, só o último payload importa
+_LATEST_STATE_EVENTS = ("cash_update", "position_update")
+
 
 def get_broker() -> RealtimeBroker:
     """
@@ -37,4 +46,87 @@ def notify(event: Event, payload: JSONValue, to: ClientID | None = None) -> None
         notify("trade_update", {"id": 1, "price": 100})
     ```
     """
+    if is_muted():
+        return
+
+    buffer = getattr(_local, "deferred", None)
+    if buffer is not None:
+        buffer.append((event, payload, to))
+        return
+
     get_broker().notify(event, payload, to)
+
+
+def has_subscribers(event: Event) -> bool:
+    """
+    Indica se há clientes inscritos no evento.
+
+    Permite pular a montagem de payloads que ninguém vai receber. Sempre
+    False quando as notificações da thread atual estão suprimidas.
+    """
+    if is_muted():
+        return False
+    return get_broker().has_subscribers(event)
+
+
+def is_muted() -> bool:
+    """Indica se as notificações da thread atual estão suprimidas."""
+    return getattr(_local, "muted", False)
+
+
+@contextmanager
+def muted() -> Iterator[None]:
+    """
+    Suprime as notificações realtime emitidas pela thread atual.
+
+    Usado pelo modo headless (fast-forward), que emite um único conjunto de
+    notificações ao final em vez de uma rajada por tick.
+    """
+    previous = is_muted()
+    _local.muted = True
+    try:
+        yield
+    finally:
+        _local.muted = previous
+
+
+@contextmanager
+def deferred() -> Iterator[None]:
+    """
+    Acumula as notificações realtime da thread atual e as publica ao sair.
+
+    Usado por operações em lote: eventos de estado (`cash_update`,
+    `position_update:*`) repetidos para o mesmo destino são coalescidos e
+    apenas o último payload é enviado.
+    """
+    if getattr(_local, "deferred", None) is not None:
+        yield  # Lote externo já acumula
+        return
+
+    _local.deferred = []
+    try:
+        yield
+    finally:
+        pending = _coalesce(_local.deferred)
+        _local.deferred = None
+        # Publica mesmo em erro: o estado já mudou para quem estava no lote
+        if pending:
+            broker = get_broker()
+            for event, payload, to in pending:
+                broker.notify(event, payload, to)
+
+
+def _coalesce(
+    pending: list[tuple[Event, JSONValue, ClientID | None]],
+) -> list[tuple[Event, JSONValue, ClientID | None]]:
+    # Percorre de trás para frente para manter a última ocorrência de cada estado
+    seen: set[tuple[Event, ClientID | None]] = set()
+    kept: list[tuple[Event, JSONValue, ClientID | None]] = []
+    for event, payload, to in reversed(pending):
+        if event.split(":", 1)[0] in _LATEST_STATE_EVENTS:
+            if (event, to) in seen:
+                continue
+            seen.add((event, to))
+        kept.append((event, payload, to))
+    kept.reverse()
+    return kept
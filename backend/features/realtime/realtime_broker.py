@@ -19,6 +19,11 @@ class RealtimeBroker(ABC):
         """Atualiza os eventos de interesse do cliente."""
         raise NotImplementedError
 
+    @abstractmethod
+    def has_subscribers(self, event: Event) -> bool:
+        """Indica se algum cliente está inscrito no evento."""
+        raise NotImplementedError
+
     @abstractmethod
     def notify(
         self,
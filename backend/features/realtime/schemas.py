@@ -14,6 +14,7 @@ from backend.core.dto.candle import CandleDTO
 from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
 from backend.core.dto.fixed_income_position import FixedIncomePositionDTO
 from backend.core.dto.order import OrderDTO
+from backend.core.dto.order_book_depth import OrderBookDepthDTO
 from backend.core.dto.position import PositionDTO
 from backend.core.dto.simulation import SimulationSettingsDTO, SimulationStatusResponse
 from backend.core.dto.snapshot import SnapshotDTO
@@ -120,3 +121,4 @@ class RealtimeEventCatalog(BaseDTO):
     order_added: OrderEventDTO
     order_updated: OrderEventDTO
     order_book_snapshot: OrderBookSnapshotEventDTO
+    order_book_depth: OrderBookDepthDTO
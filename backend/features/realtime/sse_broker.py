@@ -61,6 +61,10 @@ class SSEBroker(RealtimeBroker):
             for event in events:
                 self._subscriptions[event].add(client_id)
 
+    def has_subscribers(self, event: Event) -> bool:
+        with self._lock:
+            return bool(self._subscriptions.get(event))
+
     def notify(
         self,
         event: Event,
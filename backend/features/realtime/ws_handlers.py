@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from http.cookies import SimpleCookie
 from uuid import UUID
@@ -6,6 +7,7 @@ from socketio import AsyncServer
 
 from backend.core.runtime.user_manager import UserManager
 from backend.features.realtime import get_socket_broker
+from backend.features.variable_income.depth_feed import send_depth_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -53,4 +55,5 @@ def register_ws_handlers(sio: AsyncServer):
         broker.update_subscription(client_id, events)
 
         await sio.emit("subscribed", {"events": events}, to=sid)
+        await asyncio.to_thread(send_depth_snapshots, client_id, events)
         logger.info(f"WS client subscribed: {client_id} -> {events}")
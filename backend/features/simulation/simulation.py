@@ -1,20 +1,27 @@
 import logging
 from datetime import date, timedelta
-from decimal import Decimal
+from functools import partial
+from pathlib import Path
 from uuid import UUID
 
+from backend import config
 from backend.core import repository
+from backend.core.decorators.transactional_method import unit_of_work
 from backend.core.dto.candle import CandleDTO
 from backend.core.dto.economic_indicators import EconomicIndicatorsDTO
 from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
+from backend.core.dto.fixed_income_position import FixedIncomePositionDTO
 from backend.core.dto.order import OrderDTO
+from backend.core.dto.order_book_depth import OrderBookDepthDTO
 from backend.core.dto.player_history import PlayerHistoryDTO
 from backend.core.dto.position import PositionDTO
 from backend.core.dto.simulation import SimulationDTO
 from backend.core.dto.stock_details import StockDetailsDTO
 from backend.core.dto.user import UserDTO
 from backend.core.runtime.event_manager import EventManager
-from backend.features.realtime import notify
+from backend.core.runtime.persistence_writer import PersistenceWriter
+from backend.features.economic.economic_indicators import EconomicIndicators
+from backend.features.realtime import is_muted, muted, notify
 from backend.features.realtime.schemas import (
     SimulationTickUpdateEventDTO,
     SnapshotUpdateEventDTO,
@@ -24,7 +31,9 @@ from backend.features.realtime.schemas import (
     StocksUpdateEventDTO,
 )
 from backend.features.simulation.simulation_engine import SimulationEngine
+from backend.features.simulation.tick_profiler import TickProfiler
 from backend.features.strategy.manual import ManualStrategy
+from backend.features.variable_income.price_store import PriceStore
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +44,9 @@ class Simulation:
 
     Responsável por:
     - Avançar simulação dia-a-dia (next_tick), pulando finais de semana
+    - Avançar em modo headless até uma data alvo (fast_forward)
+    - Medir o tempo de cada fase do tick (profiler)
+    - Servir cotações do histórico pré-carregado em memória ou do banco
     - Aplicar contribuições mensais e registrar eventos mensais
     - Criar snapshots mensais do portfólio de todos os players
     - Fornecer interface de alto nível para operações (criar/cancelar ordens, consultar portfólio)
@@ -46,13 +58,35 @@ class Simulation:
         self._speed = 0
         self.settings = settings
         self._current_date = self.settings.start_date - timedelta(days=1)
+
+        # Séries de IPCA/SELIC/CDI e tabelas de fatores, carregadas uma vez
+        self._indicators = EconomicIndicators.load(
+            self._current_date, settings.end_date
+        )
         self._engine = SimulationEngine(
             self._current_date,
             settings.starting_cash,
             settings.id,
+            self._indicators,
         )
         self._engine.set_strategy(ManualStrategy)
 
+        # Histórico de preços pré-carregado em memória
+        self._prices = (
+            PriceStore.load(settings.end_date)
+            if config.toml.engine.preload_prices
+            else None
+        )
+
+        # Tempos por fase do tick
+        self.profiler = TickProfiler(
+            trace_path=(
+                Path(config.toml.logging.logs_path) / "tick_trace.jsonl"
+                if config.toml.engine.tick_trace
+                else None
+            )
+        )
+
         # Controle de snapshot
         self._last_snapshot_month: tuple[int, int] | None = None
 
@@ -64,6 +98,7 @@ class Simulation:
         self.get_portfolio = self._engine.get_portfolio
         self.create_order = self._engine.matching_engine.submit
         self.cancel_order = self._engine.matching_engine.cancel
+        self.execute_order_batch = self._engine.matching_engine.execute_batch
 
         # Roda o primeiro tick para a inicialização
         self.next_tick()
@@ -75,43 +110,100 @@ class Simulation:
         self._engine.fixed_broker.buy(client_id, asset, value)
 
     def next_tick(self):
-        # Verifica se a simulação terminou
-        if self._current_date > self.settings.end_date:
-            logger.info("Fim da simulação")
-            raise StopIteration()
+        stocks = self._advance(persist_daily=True)
+        logger.info(f"Dia atual: {self.get_current_date_formatted()}")
+        with self.profiler.phase("notify"):
+            self._notify_tick(stocks)
+        self.profiler.end_tick(self._current_date)
+
+    def fast_forward(self, target_date: date | None = None) -> int:
+        """
+        Avança a simulação sem pausas até a data alvo (ou a data final).
+
+        As notificações por tick são suprimidas e os eventos só são
+        persistidos na virada de mês; ao final, um único conjunto de
+        notificações é emitido com o estado atual. Retorna os ticks executados.
+        """
+        end_date = self.settings.end_date
+        target_date = min(target_date, end_date) if target_date else end_date
+        start_date = self._current_date
+        stocks: list[CandleDTO] | None = None
+        ticks = 0
+
+        try:
+            with muted():
+                while self._next_business_day() <= target_date:
+                    stocks = self._advance(persist_daily=False)
+                    self.profiler.end_tick(self._current_date)
+                    ticks += 1
+        finally:
+            EventManager.flush()
 
-        # Avança para o próximo dia útil
-        self._current_date += timedelta(days=1)
-        while self._current_date.weekday() >= 5:
-            self._current_date += timedelta(days=1)
-        if self._current_date > self.settings.end_date:
+        logger.info(
+            f"Fast-forward de {start_date:%d/%m/%Y} até "
+            f"{self.get_current_date_formatted()} ({ticks} ticks)"
+        )
+        if stocks is not None:
+            self._notify_tick(stocks)
+        return ticks
+
+    def _advance(self, *, persist_daily: bool) -> list[CandleDTO]:
+        # Avança para o próximo dia útil, verificando se a simulação terminou
+        next_date = self._next_business_day()
+        if next_date > self.settings.end_date:
             logger.info("Fim da simulação")
             raise StopIteration()
-
-        # Obtém os dados do dia atual e atualiza o buffer
-        stocks = repository.stock.get_stocks_by_date(self._current_date)
-        self._engine.update_market_data(stocks)
-
-        # Executa a estratégia
-        self._engine.next(self._current_date)
-
-        if self._has_month_changed():
-            users = repository.user.get_all_users()
-
-            # Processa eventos mensais antes de persistir
-            self._apply_monthly_contributions(users)
-
+        self._current_date = next_date
+
+        profiler = self.profiler
+        profiler.begin_tick()
+
+        # O tick inteiro usa uma única sessão e um único commit
+        with unit_of_work():
+            # Obtém os dados do dia atual e atualiza o buffer
+            with profiler.phase("market_data"):
+                stocks = self.get_stocks()
+            with profiler.phase("matching"):
+                self._engine.update_market_data(stocks)
+
+            # Aplica juros de renda fixa e executa a estratégia
+            with profiler.phase("fixed_income"):
+                self._engine.advance_fixed_income(self._current_date)
+            with profiler.phase("strategy"):
+                self._engine.run_strategy()
+
+            month_changed = self._has_month_changed()
+            if month_changed:
+                with profiler.phase("snapshots"):
+                    users = repository.user.get_all_users()
+
+                    # Processa eventos mensais antes de persistir
+                    self._apply_monthly_contributions(users)
+
+        # O writer usa outra sessão: os eventos só seguem após o commit do tick,
+        # pois podem referenciar ativos de renda fixa criados nele
+        if month_changed:
             # Persiste os eventos
-            EventManager.flush()
+            with profiler.phase("flush"):
+                EventManager.flush()
 
             # Cria snapshot mensal
-            self._create_monthly_snapshots(users)
-        else:
+            with profiler.phase("snapshots"):
+                self._create_monthly_snapshots(users)
+        elif persist_daily:
             # Persiste os eventos
-            EventManager.flush()
+            with profiler.phase("flush"):
+                EventManager.flush()
 
-        # Emite notificações
-        logger.info(f"Dia atual: {self.get_current_date_formatted()}")
+        return stocks
+
+    def _next_business_day(self) -> date:
+        next_date = self._current_date + timedelta(days=1)
+        while next_date.weekday() >= 5:
+            next_date += timedelta(days=1)
+        return next_date
+
+    def _notify_tick(self, stocks: list[CandleDTO]) -> None:
         for stock in stocks:
             ticker = stock.ticker
             notify(
@@ -140,10 +232,20 @@ class Simulation:
         return self._speed
 
     def get_stocks(self) -> list[CandleDTO]:
-        return repository.stock.get_stocks_by_date(self._current_date)
+        if self._prices is None:
+            return repository.stock.get_latest_candles(self._current_date)
+        return self._prices.get_candles(self._current_date)
 
     def get_stock_details(self, ticker: str) -> StockDetailsDTO | None:
-        return repository.stock.get_stock_details(ticker, self._current_date)
+        # Ações sem histórico até o fim da simulação não estão no store
+        if self._prices is None or not self._prices.has_ticker(ticker):
+            return repository.stock.get_stock_details(ticker, self._current_date)
+        return self._prices.get_stock_details(ticker, self._current_date)
+
+    def get_close_prices(self) -> dict[int, float]:
+        if self._prices is None:
+            return {stock.id: stock.close for stock in self.get_stocks()}
+        return self._prices.get_closes(self._current_date)
 
     def get_portfolio_ticker(self, client_id: UUID, ticker: str) -> PositionDTO:
         positions = self._engine.get_positions(client_id)
@@ -161,26 +263,25 @@ class Simulation:
         )
 
     def get_economic_indicators(self) -> EconomicIndicatorsDTO:
-        return EconomicIndicatorsDTO(
-            ipca=repository.economic.get_ipca_rate(self._current_date),
-            selic=repository.economic.get_selic_rate(self._current_date),
-            cdi=repository.economic.get_cdi_rate(self._current_date),
-        )
+        return self._indicators.to_dto(self._current_date)
 
     def get_statistics(self) -> list[PlayerHistoryDTO]:
         return repository.statistics.get_players_history()
 
     def get_orders(self, ticker: str) -> list[OrderDTO]:
-        orders = self._engine.matching_engine.order_book.get_orders(ticker)
+        orders = self._engine.matching_engine.get_orders(ticker)
         return [OrderDTO.from_model(o) for o in orders]
 
+    def get_order_book_depth(self, ticker: str) -> OrderBookDepthDTO:
+        return self._engine.matching_engine.depth_snapshot(ticker)
+
     def clear_user_cache(self, client_id: UUID) -> None:
         # Remove saldo em cache
         self._engine._cash.pop(client_id, None)
         # Remove posições de renda variável em cache
         self._engine.broker._positions.pop(client_id, None)
-        # Remove ativos de renda fixa em cache
-        self._engine.fixed_broker._assets.pop(client_id, None)
+        # Remove ativos de renda fixa em cache (liberando os slots do book)
+        self._engine.fixed_broker.evict(client_id)
 
     def _has_month_changed(self) -> bool:
         current_month = (self._current_date.year, self._current_date.month)
@@ -201,30 +302,69 @@ class Simulation:
             )
 
     def _create_monthly_snapshots(self, users: list[UserDTO]):
-        snapshots_payload = []
-
-        for user in users:
-            # Obtém as posições de renda fixa antes do snapshot
-            fixed_positions = self.get_fixed_positions(user.client_id)
-
-            for position in fixed_positions.values():
-                asset_id = repository.fixed_income.get_or_create_asset(position.asset)
-                repository.fixed_income.upsert_position(
-                    simulation_id=self.settings.id,
-                    user_id=user.id,
-                    asset_id=asset_id,
-                    total_applied=Decimal(position.total_applied),
-                    current_value=Decimal(position.current_value),
-                    accrual_date=self._current_date,
-                    first_applied_date=position.first_applied_date,
-                )
+        # Captura o estado do mês agora; a escrita roda no PersistenceWriter,
+        # depois do lote de eventos já enfileirado, enquanto o loop segue
+        snapshot_date = self._current_date
+        close_prices = self.get_close_prices()
+        fixed_positions = self._engine.fixed_broker.get_position_dtos(
+            user.client_id for user in users
+        )
+        user_positions = [(user, fixed_positions[user.client_id]) for user in users]
+        PersistenceWriter.submit(
+            partial(
+                self._persist_monthly_snapshots,
+                snapshot_date,
+                close_prices,
+                user_positions,
+                # O writer roda em outra thread: propaga o modo silencioso
+                silent=is_muted(),
+            )
+        )
 
-            # Cria o snapshot
-            snapshot = repository.snapshot.create_snapshot(
-                user_id=user.id,
-                snapshot_date=self._current_date,
+    def _persist_monthly_snapshots(
+        self,
+        snapshot_date: date,
+        close_prices: dict[int, float],
+        user_positions: list[tuple[UserDTO, list[FixedIncomePositionDTO]]],
+        *,
+        silent: bool,
+    ) -> None:
+        # Posições e snapshots de todos os players em uma única transação,
+        # com um upsert em lote para cada tabela
+        with unit_of_work():
+            asset_ids = repository.fixed_income.get_or_create_assets(
+                [
+                    position.asset
+                    for _, fixed_positions in user_positions
+                    for position in fixed_positions
+                ]
+            )
+            repository.fixed_income.upsert_positions(
+                simulation_id=self.settings.id,
+                accrual_date=snapshot_date,
+                positions=[
+                    (user.id, asset_ids[position.asset.asset_uuid], position)
+                    for user, fixed_positions in user_positions
+                    for position in fixed_positions
+                ],
             )
+            users = [user for user, _ in user_positions]
+            snapshots = zip(
+                users,
+                repository.snapshot.create_snapshots(
+                    user_ids=[user.id for user in users],
+                    snapshot_date=snapshot_date,
+                    close_prices=close_prices,
+                ),
+                strict=True,
+            )
+
+        if silent:
+            return
 
+        # Notifica só depois do commit
+        snapshots_payload = []
+        for user, snapshot in snapshots:
             # Portfolio (individual)
             notify(
                 event="snapshot_update",
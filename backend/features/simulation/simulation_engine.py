@@ -1,4 +1,3 @@
-import threading
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
@@ -12,7 +11,9 @@ from backend.core.dto.position import PositionDTO
 from backend.core.enum import CashflowEventType
 from backend.core.runtime.event_manager import EventManager
 from backend.core.runtime.user_manager import UserManager
+from backend.core.utils.keyed_lock import KeyedLock
 from backend.core.utils.lazy_dict import LazyDict
+from backend.features.economic.economic_indicators import EconomicIndicators
 from backend.features.fixed_income.fixed_broker import FixedBroker
 from backend.features.fixed_income.market import FixedIncomeMarket
 from backend.features.realtime import notify
@@ -36,13 +37,27 @@ class SimulationEngine:
     - Registrar eventos de cashflow (depósitos, retiradas, aportes)
     """
 
-    def __init__(self, current_date, starting_cash: float, simulation_id: int):
-        # Protege _cash (aqui) e _positions/_assets (Broker/FixedBroker) contra
-        # mutação concorrente pela thread do loop e pelas threads de request HTTP.
-        self._lock = threading.RLock()
-        self.broker = Broker(self, self._lock)
-        self.fixed_broker = FixedBroker(self, self._lock)
-        self.fixed_income_market = FixedIncomeMarket()
+    def __init__(
+        self,
+        current_date,
+        starting_cash: float,
+        simulation_id: int,
+        indicators: EconomicIndicators,
+    ):
+        # Ledger por cliente: o lock de um client_id protege o _cash (aqui) e as
+        # _positions/_assets (Broker/FixedBroker) daquele cliente contra mutação
+        # concorrente pela thread do loop e pelas threads de request HTTP.
+        #
+        # Ordem de aquisição (livre de deadlock):
+        #   1. locks dos tickers (MatchingEngine), um por vez ou, num lote de
+        #      ordens, vários de uma vez via acquire_many (ordenados)
+        #   2. locks dos clientes, vários sempre via acquire_many (ordenados)
+        # Nunca se adquire um lock de ticker segurando o lock de um cliente.
+        self._client_locks = KeyedLock[UUID]()
+        self.indicators = indicators
+        self.broker = Broker(self, self._client_locks)
+        self.fixed_broker = FixedBroker(self, self._client_locks)
+        self.fixed_income_market = FixedIncomeMarket(indicators)
         self.matching_engine = MatchingEngine(self.broker)
         self._cash: LazyDict[UUID, float] = LazyDict(
             loader=repository.user.get_user_balance
@@ -59,11 +74,11 @@ class SimulationEngine:
         self._strategy = strategy_cls(self.matching_engine, *args, **kwargs)
 
     def get_cash(self, client_id: UUID) -> float:
-        with self._lock:
+        with self._client_locks(client_id):
             return self._cash[client_id]
 
     def add_cash(self, client_id: UUID, cash: float) -> None:
-        with self._lock:
+        with self._client_locks(client_id):
             self._cash[client_id] += cash
             new_cash = self._cash[client_id]
         EventManager.push_event(
@@ -81,7 +96,7 @@ class SimulationEngine:
 
     def add_contribution(self, client_id: UUID, amount: float) -> None:
         """Adiciona aporte mensal (não conta como retorno de investimento)"""
-        with self._lock:
+        with self._client_locks(client_id):
             self._cash[client_id] += amount
             new_cash = self._cash[client_id]
         EventManager.push_event(
@@ -107,10 +122,10 @@ class SimulationEngine:
                 volume=s.volume,
             )
             self.matching_engine.market_data.add_candle(candle)
-            self.matching_engine.on_tick(s.ticker)
+        self.matching_engine.on_ticks([s.ticker for s in stocks])
 
     def get_portfolio(self, client_id: UUID) -> PortfolioDTO:
-        with self._lock:
+        with self._client_locks(client_id):
             positions = list(self.broker.get_positions(client_id).values())
             fixed_income_positions = list(
                 self.fixed_broker.get_fixed_positions(client_id).values()
@@ -141,14 +156,18 @@ class SimulationEngine:
         )
 
     def next(self, current_date: date) -> None:
+        self.advance_fixed_income(current_date)
+        self.run_strategy()
+
+    def advance_fixed_income(self, current_date: date) -> None:
         self.current_date = current_date
 
         self.fixed_income_market.refresh_assets(current_date)
 
-        # Aplica juros dos ativos de renda fixa
-        self.fixed_broker.apply_daily_interest(current_date)
+        # Avança a renda fixa (juros sob demanda) e resgata os vencimentos
+        self.fixed_broker.advance(current_date)
 
-        # Executa a estratégia
+    def run_strategy(self) -> None:
         if not self._strategy:
             raise RuntimeError("Nenhuma estratégia configurada")
         self._strategy.next()
@@ -37,6 +37,17 @@ class SimulationLoader:
     @classmethod
     def load(cls, summary: SimulationSummaryDTO) -> SimulationDTO:
         """Retoma uma simulação existente a partir do último snapshot."""
+        sim = cls.resume(summary)
+        simulation_controller.start()
+        notify(
+            "simulation_started",
+            SimulationStatusResponse(active=True, simulation=sim.settings).to_json(),
+        )
+        return sim.settings
+
+    @classmethod
+    def resume(cls, summary: SimulationSummaryDTO) -> Simulation:
+        """Instancia e registra uma simulação existente, sem iniciar o loop."""
         last_snapshot_date = repository.snapshot.get_last_snapshot_date(summary.id)
         resume_start = last_snapshot_date or summary.start_date
 
@@ -60,9 +71,4 @@ class SimulationLoader:
         repository.simulation.touch_last_simulated(summary.id)
         SimulationManager.register_simulation(sim)
         SettingsManager.clear()
-        simulation_controller.start()
-        notify(
-            "simulation_started",
-            SimulationStatusResponse(active=True, simulation=sim.settings).to_json(),
-        )
-        return sim.settings
+        return sim
@@ -1,13 +1,19 @@
 import logging
 import threading
-import time
 from datetime import date
 from enum import Enum
 
+from backend import config
 from backend.core.exceptions import NoActiveSimulationError
+from backend.core.runtime.event_manager import EventManager
+from backend.core.runtime.persistence_writer import PersistenceWriter
 from backend.core.runtime.simulation_manager import SimulationManager
 from backend.features.realtime import notify
 from backend.features.realtime.schemas import SimulationEndedEventDTO
+from backend.features.simulation.tick_scheduler import (
+    TickScheduler,
+    TickSchedulerStats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +31,10 @@ class SimulationLoopController:
     - Gerenciar thread dedicada para executar a simulação
     - Controlar estados (STOPPED, RUNNING) de forma thread-safe
     - Implementar pausa/retomada da simulação
+    - Cadenciar os ticks por deadline, sem drift, conforme a velocidade
+    - Executar fast-forward headless sem concorrer com os ticks da thread
     - Encerrar gracefully ao receber stop ou atingir data final
+    - Drenar a persistência pendente antes de liberar a simulação
     - Notificar eventos de início, fim e erros via realtime
     """
 
@@ -34,7 +43,12 @@ class SimulationLoopController:
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()
         self._lock = threading.Lock()
+        self._tick_lock = threading.Lock()
         self._state = SimulationState.STOPPED
+        self._scheduler = TickScheduler(
+            policy=config.toml.engine.overrun_policy,
+            max_catch_up=config.toml.engine.max_catch_up_ticks,
+        )
 
     def start(self) -> None:
         """Inicia uma nova simulação criando uma thread dedicada."""
@@ -51,6 +65,7 @@ class SimulationLoopController:
                 raise
 
             self._stop_event.clear()
+            self._scheduler.reset()
             self._thread = threading.Thread(
                 target=self._run,
                 daemon=True,
@@ -68,6 +83,18 @@ class SimulationLoopController:
         logger.info("Simulação retomada.")
         self._pause_event.set()
 
+    def fast_forward(self, target_date: date | None = None) -> int:
+        """Avança a simulação ativa até a data alvo, bloqueando os ticks da thread."""
+        simulation = SimulationManager.get_active_simulation()
+        with self._tick_lock:
+            ticks = simulation.fast_forward(target_date)
+            # O tempo gasto no fast-forward não conta como atraso do loop
+            self._scheduler.reset()
+            return ticks
+
+    def get_stats(self) -> TickSchedulerStats:
+        return self._scheduler.get_stats()
+
     def stop(self) -> date | None:
         """Encerra a simulação em execução e retorna a data final."""
         with self._lock:
@@ -87,7 +114,10 @@ class SimulationLoopController:
             self._state = SimulationState.STOPPED
             self._thread = None
 
-        SimulationManager.clear_simulation()
+        try:
+            self._drain_persistence()
+        finally:
+            SimulationManager.clear_simulation()
 
     def _run(self):
         logger.info("Loop da simulação iniciado.")
@@ -107,10 +137,12 @@ class SimulationLoopController:
                 # 🔸 PAUSE (speed == 0)
                 if speed <= 0:
                     self._pause_event.wait()  # bloqueia até unpause ou stop
+                    self._scheduler.reset()
                     continue
 
                 try:
-                    simulation.next_tick()
+                    with self._tick_lock:
+                        simulation.next_tick()
                 except StopIteration:
                     notify(
                         "simulation_ended",
@@ -118,7 +150,8 @@ class SimulationLoopController:
                     )
                     break
 
-                time.sleep(1 / speed)
+                # Aguarda o próximo deadline, descontando o tempo do tick
+                self._scheduler.wait(1 / speed, self._stop_event)
 
         except Exception:
             logger.critical("Erro fatal no loop da simulação")
@@ -134,9 +167,18 @@ class SimulationLoopController:
                 self._stop_event.set()
                 if self._thread and self._thread.is_alive():
                     self._thread.join(timeout=3.0)
+                self._drain_persistence()
                 SimulationManager.clear_simulation()
         except Exception:
             logger.exception("Erro durante shutdown")
+        finally:
+            PersistenceWriter.stop()
+
+    @staticmethod
+    def _drain_persistence() -> None:
+        """Persiste os eventos pendentes e aguarda o writer esvaziar a fila."""
+        EventManager.flush()
+        PersistenceWriter.drain()
 
 
 # --------------------------------------------------
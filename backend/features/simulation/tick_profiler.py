@@ -0,0 +1,100 @@
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+TOTAL_PHASE = "total"
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseTimings:
+    phase: str
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class TickProfiler:
+    """
+    Profiler por fase do tick da simulação.
+
+    Responsável por:
+    - Medir a duração de cada fase do tick (dados de mercado, matching, juros...)
+    - Manter janelas deslizantes por fase para calcular p50/p95/p99
+    - Gravar opcionalmente um trace JSON Lines com as fases de cada tick
+    """
+
+    def __init__(self, window: int = 1000, trace_path: Path | None = None):
+        self._window = window
+        self._trace_path = trace_path
+        self._samples: dict[str, deque[float]] = {}
+        self._current: dict[str, float] = {}
+        self._tick_started = 0.0
+        self._lock = threading.Lock()
+
+    def begin_tick(self) -> None:
+        self._current = {}
+        self._tick_started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._current[name] = self._current.get(name, 0.0) + elapsed
+
+    def end_tick(self, current_date: date) -> None:
+        phases = self._current
+        phases[TOTAL_PHASE] = time.perf_counter() - self._tick_started
+
+        with self._lock:
+            for name, elapsed in phases.items():
+                samples = self._samples.get(name)
+                if samples is None:
+                    samples = self._samples[name] = deque(maxlen=self._window)
+                samples.append(elapsed)
+
+        if self._trace_path is not None:
+            self._write_trace(self._trace_path, current_date, phases)
+
+    def get_timings(self) -> list[PhaseTimings]:
+        with self._lock:
+            snapshot = {name: list(samples) for name, samples in self._samples.items()}
+
+        timings: list[PhaseTimings] = []
+        for name, samples in snapshot.items():
+            values = np.asarray(samples) * 1000
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            timings.append(
+                PhaseTimings(
+                    phase=name,
+                    count=len(values),
+                    mean_ms=float(values.mean()),
+                    p50_ms=float(p50),
+                    p95_ms=float(p95),
+                    p99_ms=float(p99),
+                    max_ms=float(values.max()),
+                )
+            )
+        return timings
+
+    @staticmethod
+    def _write_trace(path: Path, current_date: date, phases: dict[str, float]) -> None:
+        record = {
+            "date": current_date.isoformat(),
+            "phases_ms": {name: round(v * 1000, 3) for name, v in phases.items()},
+        }
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
@@ -0,0 +1,95 @@
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from backend.core.enum import OverrunPolicy
+
+
+@dataclass(frozen=True, slots=True)
+class TickSchedulerStats:
+    ticks: int
+    overruns: int
+    skipped_ticks: int
+    achieved_tps: float
+
+
+class TickScheduler:
+    """
+    Agendador de ticks por deadline, livre de drift.
+
+    Responsável por:
+    - Calcular o próximo deadline a partir do anterior, descontando o tempo do tick
+    - Recuperar ticks atrasados em sequência (catch_up) ou descartá-los (skip)
+    - Contabilizar overruns, ticks descartados e a taxa de ticks atingida
+    """
+
+    def __init__(
+        self,
+        policy: OverrunPolicy = OverrunPolicy.CATCH_UP,
+        max_catch_up: int = 10,
+        clock: Callable[[], float] = time.perf_counter,
+        window: int = 64,
+    ):
+        self._policy = policy
+        self._max_catch_up = max_catch_up
+        self._clock = clock
+        self._deadline: float | None = None
+        self._tick_times: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._ticks = 0
+        self._overruns = 0
+        self._skipped = 0
+
+    def reset(self) -> None:
+        """Descarta o deadline corrente (ex.: ao pausar ou retomar o loop)."""
+        with self._lock:
+            self._deadline = None
+            self._tick_times.clear()
+
+    def wait(self, interval: float, stop_event: threading.Event) -> None:
+        """
+        Registra o fim de um tick e aguarda até o próximo deadline.
+
+        Retorna imediatamente se o deadline já passou (overrun). A política
+        define se os ticks perdidos são recuperados ou descartados.
+        """
+        now = self._clock()
+        with self._lock:
+            self._ticks += 1
+            self._tick_times.append(now)
+
+            deadline = (
+                self._deadline if self._deadline is not None else now
+            ) + interval
+            delay = deadline - now
+            if delay < 0:
+                self._overruns += 1
+                missed = math.ceil(-delay / interval)
+                backlog = (
+                    0 if self._policy == OverrunPolicy.SKIP else self._max_catch_up
+                )
+                if missed > backlog:
+                    self._skipped += missed - backlog
+                    deadline = now - backlog * interval
+            self._deadline = deadline
+
+        if delay > 0:
+            stop_event.wait(delay)
+
+    def get_stats(self) -> TickSchedulerStats:
+        with self._lock:
+            elapsed = (
+                self._tick_times[-1] - self._tick_times[0]
+                if len(self._tick_times) > 1
+                else 0.0
+            )
+            achieved_tps = (len(self._tick_times) - 1) / elapsed if elapsed > 0 else 0.0
+            return TickSchedulerStats(
+                ticks=self._ticks,
+                overruns=self._overruns,
+                skipped_ticks=self._skipped,
+                achieved_tps=achieved_tps,
+            )
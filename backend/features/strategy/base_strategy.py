@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from uuid import UUID
+
+from backend.features.strategy.indicators import Indicators
 
 if TYPE_CHECKING:
     from backend.features.variable_income.matching_engine import MatchingEngine
@@ -12,13 +15,17 @@ class BaseStrategy:
 
     Responsável por:
     - Definir interface comum para todas as estratégias (método next)
-    - Fornecer acesso ao MatchingEngine para submissão de ordens
+    - Fornecer acesso ao MatchingEngine para submissão de ordens em nome do
+      cliente da estratégia (`client_id`)
     - Fornecer acesso ao MarketData para análise de candles
+    - Fornecer indicadores técnicos incrementais (SMA, EMA, RSI, ATR, Bollinger)
     """
 
-    def __init__(self, matching_engine: MatchingEngine):
+    def __init__(self, matching_engine: MatchingEngine, client_id: UUID | None = None):
         self.matching_engine = matching_engine
+        self.client_id = client_id
         self.market_data = matching_engine.market_data
+        self.indicators = Indicators(self.market_data)
 
     def next(self):
         """Executa a lógica da estratégia a cada tick."""
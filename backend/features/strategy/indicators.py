@@ -0,0 +1,196 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from backend.features.variable_income.market_data import CandleWindow, MarketData
+
+# =========================
+# Séries vetorizadas
+# =========================
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Média móvel simples; retorna `len(values) - period + 1` valores."""
+    if len(values) < period:
+        return np.empty(0)
+    return sliding_window_view(values, period).mean(axis=1)
+
+
+def bollinger(
+    values: np.ndarray, period: int = 20, k: float = 2.0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bandas de Bollinger (média, superior, inferior) com desvio populacional."""
+    if len(values) < period:
+        empty = np.empty(0)
+        return empty, empty, empty
+    windows = sliding_window_view(values, period)
+    mid = windows.mean(axis=1)
+    std = windows.std(axis=1)
+    return mid, mid + k * std, mid - k * std
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True Range a partir do segundo candle; retorna `len(close) - 1` valores."""
+    prev_close = close[:-1]
+    return np.maximum(high[1:], prev_close) - np.minimum(low[1:], prev_close)
+
+
+# =========================
+# Indicadores incrementais
+# =========================
+
+
+@dataclass(slots=True)
+class _State:
+    """Estado de um indicador recursivo de um ticker."""
+
+    count: int  # candles do ticker já consumidos
+    prev_close: float
+    a: float
+    b: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class Band:
+    mid: float
+    upper: float
+    lower: float
+
+
+class Indicators:
+    """
+    Indicadores técnicos por ticker sobre o MarketData.
+
+    Responsável por:
+    - Calcular SMA e Bollinger direto sobre as janelas do MarketData, sem cópia
+    - Manter EMA, RSI e ATR (Wilder) incrementais: O(1) por candle novo
+    - Semear o estado com as séries vetorizadas na primeira consulta ou quando
+      candles novos já saíram da janela
+
+    Indicadores ainda sem candles suficientes retornam None.
+    """
+
+    def __init__(self, market_data: MarketData):
+        self._market_data = market_data
+        self._states: dict[tuple[str, str, int], _State] = {}
+
+    def sma(self, ticker: str, period: int) -> float | None:
+        window = self._window(ticker, period)
+        if window is None:
+            return None
+        return float(window.close[-period:].mean())
+
+    def bollinger(self, ticker: str, period: int = 20, k: float = 2.0) -> Band | None:
+        window = self._window(ticker, period)
+        if window is None:
+            return None
+        closes = window.close[-period:]
+        mid = float(closes.mean())
+        std = float(closes.std())
+        return Band(mid=mid, upper=mid + k * std, lower=mid - k * std)
+
+    def ema(self, ticker: str, period: int) -> float | None:
+        alpha = 2 / (period + 1)
+
+        def seed(window: CandleWindow) -> _State:
+            state = _State(window.count, 0.0, float(window.close[:period].mean()))
+            for close in window.close[period:]:
+                state.a += alpha * (close - state.a)
+            return state
+
+        def step(state: _State, window: CandleWindow, i: int) -> None:
+            state.a += alpha * (window.close[i] - state.a)
+
+        state = self._update("ema", ticker, period, period, seed, step)
+        return None if state is None else state.a
+
+    def rsi(self, ticker: str, period: int = 14) -> float | None:
+        def seed(window: CandleWindow) -> _State:
+            diffs = np.diff(window.close)
+            gains = np.clip(diffs, 0, None)
+            losses = np.clip(-diffs, 0, None)
+            state = _State(
+                window.count,
+                0.0,
+                float(gains[:period].mean()),
+                float(losses[:period].mean()),
+            )
+            for gain, loss in zip(gains[period:], losses[period:], strict=True):
+                state.a = (state.a * (period - 1) + gain) / period
+                state.b = (state.b * (period - 1) + loss) / period
+            return state
+
+        def step(state: _State, window: CandleWindow, i: int) -> None:
+            diff = window.close[i] - state.prev_close
+            state.a = (state.a * (period - 1) + max(diff, 0.0)) / period
+            state.b = (state.b * (period - 1) + max(-diff, 0.0)) / period
+
+        state = self._update("rsi", ticker, period, period + 1, seed, step)
+        if state is None:
+            return None
+        avg_gain, avg_loss = state.a, state.b
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else 50.0
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+    def atr(self, ticker: str, period: int = 14) -> float | None:
+        def seed(window: CandleWindow) -> _State:
+            ranges = true_range(window.high, window.low, window.close)
+            state = _State(window.count, 0.0, float(ranges[:period].mean()))
+            for tr in ranges[period:]:
+                state.a = (state.a * (period - 1) + tr) / period
+            return state
+
+        def step(state: _State, window: CandleWindow, i: int) -> None:
+            tr = max(window.high[i], state.prev_close) - min(
+                window.low[i], state.prev_close
+            )
+            state.a = (state.a * (period - 1) + tr) / period
+
+        state = self._update("atr", ticker, period, period + 1, seed, step)
+        return None if state is None else state.a
+
+    # =========================
+    # Helpers
+    # =========================
+
+    def _window(self, ticker: str, required: int) -> CandleWindow | None:
+        window = self._market_data.get_window(ticker)
+        if window is None or len(window) < required:
+            return None
+        return window
+
+    def _update(
+        self,
+        name: str,
+        ticker: str,
+        period: int,
+        required: int,
+        seed: Callable[[CandleWindow], _State],
+        step: Callable[[_State, CandleWindow, int], None],
+    ) -> _State | None:
+        """
+        Avança o estado do indicador pelos candles recebidos desde a última
+        consulta, ou o semeia de novo pela janela quando não há estado ou o
+        candle anterior ao primeiro novo já saiu da janela.
+        """
+        window = self._window(ticker, required)
+        if window is None:
+            return None
+
+        key = (name, ticker, period)
+        state = self._states.get(key)
+        new = window.count - state.count if state is not None else 0
+
+        if state is None or new >= len(window):
+            state = self._states[key] = seed(window)
+        else:
+            for i in range(len(window) - new, len(window)):
+                step(state, window, i)
+                state.prev_close = float(window.close[i])
+
+        state.count = window.count
+        state.prev_close = float(window.close[-1])
+        return state
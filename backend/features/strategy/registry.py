@@ -0,0 +1,20 @@
+from backend.core.exceptions.http_exceptions import NotFoundError
+from backend.features.strategy.base_strategy import BaseStrategy
+from backend.features.strategy.manual import ManualStrategy
+from backend.features.strategy.sma_cross import SmaCrossStrategy
+
+# Estratégias disponíveis por nome, usadas pelo backtest (CLI e API)
+STRATEGIES: dict[str, type[BaseStrategy]] = {
+    "manual": ManualStrategy,
+    "sma-cross": SmaCrossStrategy,
+}
+
+
+def get_strategy(name: str) -> type[BaseStrategy]:
+    strategy = STRATEGIES.get(name)
+    if strategy is None:
+        available = ", ".join(STRATEGIES)
+        raise NotFoundError(
+            f"Estratégia '{name}' não encontrada. Disponíveis: {available}"
+        )
+    return strategy
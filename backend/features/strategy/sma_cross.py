@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from fastapi import HTTPException
+
+from backend.features.strategy.base_strategy import BaseStrategy
+from backend.features.variable_income.entities.order import MarketOrder, OrderAction
+
+if TYPE_CHECKING:
+    from backend.features.variable_income.matching_engine import MatchingEngine
+
+logger = logging.getLogger(__name__)
+
+
+class SmaCrossStrategy(BaseStrategy):
+    """
+    Estratégia de cruzamento de médias móveis simples.
+
+    Responsável por:
+    - Comprar um lote quando a média curta cruza a longa para cima
+    - Zerar a posição quando a média curta cruza a longa para baixo
+    - Operar todos os tickers com candles no MarketData
+
+    A média longa precisa caber no `market_data_depth` configurado.
+    """
+
+    def __init__(
+        self,
+        matching_engine: MatchingEngine,
+        client_id: UUID | None = None,
+        *,
+        fast: int = 5,
+        slow: int = 20,
+        lot: int = 100,
+    ):
+        super().__init__(matching_engine, client_id)
+        if client_id is None:
+            raise ValueError("SmaCrossStrategy precisa de um client_id")
+        if not 0 < fast < slow:
+            raise ValueError("A média curta deve ser menor que a longa")
+        self._client_id: UUID = client_id
+        self.fast = fast
+        self.slow = slow
+        self.lot = lot
+        self._above: dict[str, bool] = {}
+
+    def next(self):
+        for ticker in self.market_data.tickers():
+            fast = self.indicators.sma(ticker, self.fast)
+            slow = self.indicators.sma(ticker, self.slow)
+            if fast is None or slow is None:
+                continue
+
+            above = fast > slow
+            was_above = self._above.get(ticker)
+            self._above[ticker] = above
+            if was_above is None or above == was_above:
+                continue
+
+            position = self.matching_engine.broker.get_available_position(
+                self._client_id, ticker
+            )
+            if above and position == 0:
+                self._submit(ticker, OrderAction.BUY, self.lot)
+            elif not above and position > 0:
+                self._submit(ticker, OrderAction.SELL, position)
+
+    def _submit(self, ticker: str, action: OrderAction, size: int) -> None:
+        try:
+            self.matching_engine.submit(
+                MarketOrder(
+                    client_id=self._client_id, ticker=ticker, size=size, action=action
+                )
+            )
+        except HTTPException as e:
+            logger.debug(f"Ordem {action.name} {size}x {ticker} recusada: {e.detail}")
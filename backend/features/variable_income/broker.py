@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import logging
-import threading
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from decimal import Decimal
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -12,8 +11,10 @@ from backend.core.dto.events.equity import EquityEventDTO
 from backend.core.dto.position import PositionDTO
 from backend.core.enum import EquityEventType
 from backend.core.exceptions import InsufficentCashError, InsufficentPositionError
+from backend.core.exceptions.http_exceptions import ForbiddenError
 from backend.core.runtime.event_manager import EventManager
 from backend.core.runtime.user_manager import UserManager
+from backend.core.utils.keyed_lock import KeyedLock
 from backend.core.utils.lazy_dict import LazyDict
 from backend.features.realtime import notify
 from backend.features.realtime.schemas import PositionUpdateEventDTO
@@ -66,18 +67,18 @@ class Broker:
     def __init__(
         self,
         simulation_engine: SimulationEngine,
-        lock: threading.RLock,
+        client_locks: KeyedLock[UUID],
     ):
         self._simulation_engine = simulation_engine
-        self._lock = lock
+        self._client_locks = client_locks
         self._positions: LazyDict[UUID, dict[str, Position]] = LazyDict(load_positions)
 
     def get_positions(self, client_id: UUID) -> dict[str, Position]:
-        with self._lock:
+        with self._client_locks(client_id):
             return self._positions[client_id]
 
     def get_available_position(self, client_id: UUID, ticker: str) -> int:
-        with self._lock:
+        with self._client_locks(client_id):
             position = self._positions[client_id].get(ticker)
             if not position:
                 return 0
@@ -87,7 +88,7 @@ class Broker:
         if order.client_id == MarketLiquidity.MARKET_CLIENT_ID:
             return
 
-        with self._lock:
+        with self._client_locks(order.client_id):
             if order.action == OrderAction.BUY:
                 cost = order.price * order.size
                 if self._simulation_engine.get_cash(order.client_id) < cost:
@@ -106,11 +107,55 @@ class Broker:
                     mutation=lambda p: p.reserve(order.size),
                 )
 
+    def validate_reservations(
+        self, orders: Sequence[LimitOrder]
+    ) -> list[ForbiddenError | None]:
+        """
+        Valida de uma vez as reservas de um lote de ordens LIMIT.
+
+        Cada ordem consome o saldo/posição disponível deixado pelas anteriores
+        do lote, como se fossem reservadas em sequência. Retorna, por ordem, o
+        erro que a reserva levantaria ou None. Não reserva nada.
+        """
+        clients = {
+            order.client_id
+            for order in orders
+            if order.client_id != MarketLiquidity.MARKET_CLIENT_ID
+        }
+        with self._client_locks.acquire_many(clients):
+            cash = {c: self._simulation_engine.get_cash(c) for c in clients}
+            available: dict[tuple[UUID, str], int] = {}
+            errors: list[ForbiddenError | None] = []
+
+            for order in orders:
+                if order.client_id == MarketLiquidity.MARKET_CLIENT_ID:
+                    errors.append(None)
+                    continue
+
+                if order.action == OrderAction.BUY:
+                    cost = order.price * order.size
+                    if cash[order.client_id] < cost:
+                        errors.append(InsufficentCashError())
+                        continue
+                    cash[order.client_id] -= cost
+
+                elif order.action == OrderAction.SELL:
+                    key = (order.client_id, order.ticker)
+                    if key not in available:
+                        available[key] = self.get_available_position(*key)
+                    if available[key] < order.size:
+                        errors.append(InsufficentPositionError())
+                        continue
+                    available[key] -= order.size
+
+                errors.append(None)
+            return errors
+
     def release_limit_order(self, order: LimitOrder) -> None:
         if order.client_id == MarketLiquidity.MARKET_CLIENT_ID:
             return
 
-        with self._lock:
+        with self._client_locks(order.client_id):
             if order.action == OrderAction.BUY:
                 cost = order.price * order.remaining
                 self._simulation_engine.add_cash(order.client_id, cost)
@@ -140,7 +185,13 @@ class Broker:
         if size <= 0:
             raise ValueError("Quantidade deve ser maior que zero")
 
-        with self._lock:
+        # Ledger dos dois lados travado junto, em ordem canônica
+        clients = [
+            order.client_id
+            for order in (taker_order, maker_order)
+            if order.client_id != MarketLiquidity.MARKET_CLIENT_ID
+        ]
+        with self._client_locks.acquire_many(clients):
             if isinstance(taker_order, MarketOrder):
                 self._validate_market_order(taker_order, size, price)
 
@@ -193,7 +244,7 @@ class Broker:
         ticker: str,
         mutation: Callable[[Position], None],
     ):
-        with self._lock:
+        with self._client_locks(client_id):
             if ticker not in self._positions[client_id]:
                 self._positions[client_id][ticker] = Position(ticker)
 
@@ -234,19 +285,7 @@ class Broker:
             mutation=lambda p: p.update_buy(price, size),
         )
 
-        EventManager.push_event(
-            EquityEventDTO(
-                simulation_id=self._simulation_engine.simulation_id,
-                user_id=UserManager.get_user_id(client_id),
-                event_type=EquityEventType.BUY,
-                ticker=ticker,
-                quantity=size,
-                price=Decimal(price),
-                event_date=self._simulation_engine.current_date,
-            )
-        )
-
-        logger.info(f"Executado BUY {size}x {ticker} @ R$ {price}")
+        self._record_trade(client_id, ticker, EquityEventType.BUY, size, price)
 
     def _execute_sell(self, order: Order, size: int, price: float):
         client_id = order.client_id
@@ -265,11 +304,22 @@ class Broker:
             mutation=_sell_mutation,
         )
 
+        self._record_trade(client_id, ticker, EquityEventType.SELL, size, price)
+
+    def _record_trade(
+        self,
+        client_id: UUID,
+        ticker: str,
+        event_type: EquityEventType,
+        size: int,
+        price: float,
+    ) -> None:
+        """Registra a execução no EventManager. Sobrescrito pelo broker de backtest."""
         EventManager.push_event(
             EquityEventDTO(
                 simulation_id=self._simulation_engine.simulation_id,
                 user_id=UserManager.get_user_id(client_id),
-                event_type=EquityEventType.SELL,
+                event_type=event_type,
                 ticker=ticker,
                 quantity=size,
                 price=Decimal(price),
@@ -277,4 +327,4 @@ class Broker:
             )
         )
 
-        logger.info(f"Executado SELL {size}x {ticker} @ R$ {price}")
+        logger.info(f"Executado {event_type.name} {size}x {ticker} @ R$ {price}")
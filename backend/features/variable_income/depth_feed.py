@@ -0,0 +1,108 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from backend.core.dto.order_book_depth import DepthLevelDTO, OrderBookDepthDTO
+from backend.core.exceptions import NoActiveSimulationError
+from backend.core.runtime.simulation_manager import SimulationManager
+from backend.features.realtime import notify
+from backend.features.variable_income.order_book import DepthLevel
+from backend.types import ClientID, Event
+
+DEPTH_EVENT_PREFIX = "order_book_depth:"
+
+
+@dataclass(slots=True)
+class _PublishedDepth:
+    seq: int = 0
+    bids: dict[float, int] = field(default_factory=dict)
+    asks: dict[float, int] = field(default_factory=dict)
+
+
+class DepthFeed:
+    """
+    Feed incremental de profundidade L2 por ticker.
+
+    Responsável por:
+    - Guardar o último estado publicado de cada ticker (preço → tamanho)
+    - Calcular diffs apenas com os níveis alterados, com `seq` monotônico
+    - Montar snapshots consistentes com o `seq` corrente para (re)sincronização
+    """
+
+    def __init__(self):
+        self._published: dict[str, _PublishedDepth] = {}
+
+    def diff(
+        self, ticker: str, bids: list[DepthLevel], asks: list[DepthLevel]
+    ) -> OrderBookDepthDTO | None:
+        """
+        Registra o novo estado e retorna o diff em relação ao publicado.
+        Retorna None (sem consumir `seq`) se nada mudou.
+        """
+        state = self._published.setdefault(ticker, _PublishedDepth())
+        new_bids, new_asks = dict(bids), dict(asks)
+
+        bid_changes = _changes(state.bids, new_bids)
+        ask_changes = _changes(state.asks, new_asks)
+        if not bid_changes and not ask_changes:
+            return None
+
+        state.seq += 1
+        state.bids, state.asks = new_bids, new_asks
+        return OrderBookDepthDTO(
+            type="diff",
+            ticker=ticker,
+            seq=state.seq,
+            bids=_levels(bid_changes, reverse=True),
+            asks=_levels(ask_changes),
+        )
+
+    def snapshot(self, ticker: str) -> OrderBookDepthDTO:
+        """Último estado publicado do ticker, com o `seq` correspondente."""
+        state = self._published.get(ticker) or _PublishedDepth()
+        return OrderBookDepthDTO(
+            type="snapshot",
+            ticker=ticker,
+            seq=state.seq,
+            bids=_levels(state.bids, reverse=True),
+            asks=_levels(state.asks),
+        )
+
+
+def send_depth_snapshots(client_id: ClientID, events: Iterable[Event]) -> None:
+    """
+    Envia ao cliente o snapshot L2 de cada ticker cujo feed de profundidade
+    ele acabou de assinar. Chamado pelos pontos de entrada de assinatura.
+    """
+    tickers = [
+        event.removeprefix(DEPTH_EVENT_PREFIX)
+        for event in events
+        if event.startswith(DEPTH_EVENT_PREFIX)
+    ]
+    if not tickers:
+        return
+
+    try:
+        simulation = SimulationManager.get_active_simulation()
+    except NoActiveSimulationError:
+        return
+
+    for ticker in tickers:
+        notify(
+            event=f"{DEPTH_EVENT_PREFIX}{ticker}",
+            payload=simulation.get_order_book_depth(ticker).to_json(),
+            to=client_id,
+        )
+
+
+def _changes(old: dict[float, int], new: dict[float, int]) -> dict[float, int]:
+    changes = {price: size for price, size in new.items() if old.get(price) != size}
+    for price in old.keys() - new.keys():
+        changes[price] = 0
+    return changes
+
+
+def _levels(sizes: dict[float, int], *, reverse: bool = False) -> list[DepthLevelDTO]:
+    return [
+        DepthLevelDTO(price=price, size=size)
+        for price, size in sorted(sizes.items(), reverse=reverse)
+    ]
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     """Representa um candle de mercado."""
 
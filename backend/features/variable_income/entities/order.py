@@ -1,9 +1,25 @@
+import itertools
+import time
 import uuid
 from abc import ABC
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 
+# Sequência global e monotônica: identifica as ordens e define a prioridade
+# por tempo (menor seq = chegou antes). `next` em itertools.count é atômico.
+_sequence = itertools.count(1)
+
+
+def next_sequence() -> int:
+    """Próximo número da sequência de ordens."""
+    return next(_sequence)
+
+
+def parse_order_id(order_id: str) -> int | None:
+    """Converte o ID público (string) de uma ordem de volta para o seu `seq`."""
+    return int(order_id) if order_id.isdecimal() else None
+
 
 class OrderType(Enum):
     MARKET = "market"
@@ -22,28 +38,41 @@ class OrderStatus(Enum):
     CANCELED = "canceled"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Order(ABC):
-    """Representa uma ordem de compra ou venda executada ou pendente."""
+    """
+    Representa uma ordem de compra ou venda executada ou pendente.
+
+    Internamente a ordem é identificada pelo `seq` inteiro, que também dá a
+    prioridade por tempo; `id` é a forma pública (string) desse mesmo número.
+    """
 
     client_id: uuid.UUID
     ticker: str
     size: int
     action: OrderAction
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    seq: int = field(default_factory=next_sequence)
     remaining: int = field(init=False)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    timestamp: float = field(default_factory=time.time)
     status: OrderStatus = OrderStatus.PENDING
 
     def __post_init__(self):
         self.remaining = self.size
 
+    @property
+    def id(self) -> str:
+        return str(self.seq)
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp, UTC)
+
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MarketOrder(Order):
     pass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LimitOrder(Order):
     price: float
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from backend.core.exceptions import InsufficentPositionError
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Representa uma posição aberta em um ativo."""
 
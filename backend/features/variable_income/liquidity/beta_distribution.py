@@ -1,3 +1,8 @@
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+
 from backend.features.variable_income.entities.candle import Candle
 from backend.features.variable_income.liquidity.liquidity_distribution import (
     LiquidityDistribution,
@@ -14,6 +19,7 @@ class BetaLiquidityDistribution(LiquidityDistribution):
     - Dividir volume do candle entre níveis de preço de forma realista
     - Gerar price levels separados para zona de compra e venda
     - Aplicar tick_size para arredondamento de preços
+    - Gerar os níveis de vários candles de uma vez com operações vetoriais
     """
 
     def __init__(
@@ -37,62 +43,70 @@ class BetaLiquidityDistribution(LiquidityDistribution):
     # =========================
 
     def generate(self, candle: Candle) -> list[PriceLevel]:
-        if candle.high <= candle.low or candle.volume <= 0:
-            return []
-
-        prices = self._price_levels(candle.low, candle.high)
-        pdf = [self._beta_pdf(p, candle.low, candle.high) for p in prices]
-
-        total_density = sum(pdf)
-        if total_density == 0:
-            return []
-
-        # Converte densidade em volume absoluto
-        raw_volumes = [candle.volume * d / total_density for d in pdf]
-
-        # Arredondamento conservador
-        volumes = [int(v) for v in raw_volumes]
-
-        # Ajuste de erro de arredondamento
-        delta = candle.volume - sum(volumes)
-        if delta != 0:
-            volumes[self._center_index()] += delta
-
-        levels: list[PriceLevel] = []
-        for price, volume in zip(prices, volumes, strict=False):
-            if volume <= 0:
-                continue
-            levels.append(
-                PriceLevel(
-                    price=price,
-                    volume=volume,
+        return self.generate_batch([candle])[0]
+
+    def generate_batch(self, candles: Sequence[Candle]) -> list[list[PriceLevel]]:
+        results: list[list[PriceLevel]] = [[] for _ in candles]
+
+        valid = [i for i, c in enumerate(candles) if c.high > c.low and c.volume > 0]
+        grid, weights = _beta_profile(self.levels, self.alpha, self.beta)
+        if not valid or not weights.any():
+            return results
+
+        lows = np.array([candles[i].low for i in valid], dtype=np.float64)
+        highs = np.array([candles[i].high for i in valid], dtype=np.float64)
+        totals = np.array([candles[i].volume for i in valid], dtype=np.int64)
+
+        # Uma linha por candle, uma coluna por nível
+        prices = self._round_tick(lows[:, None] + (highs - lows)[:, None] * grid)
+
+        # Arredondamento conservador + ajuste do erro de arredondamento no centro
+        volumes = np.floor(totals[:, None] * weights).astype(np.int64)
+        volumes[:, self._center_index()] += totals - volumes.sum(axis=1)
+
+        for row, i in enumerate(valid):
+            results[i] = [
+                PriceLevel(price=price, volume=volume)
+                for price, volume in zip(
+                    prices[row].tolist(), volumes[row].tolist(), strict=True
                 )
-            )
+                if volume > 0
+            ]
 
-        return levels
+        return results
 
     # =========================
     # Helpers técnicos
     # =========================
 
-    def _price_levels(self, low: float, high: float) -> list[float]:
-        span = high - low
-        raw = [low + span * i / (self.levels - 1) for i in range(self.levels)]
-        return [self._round_tick(p) for p in raw]
-
-    def _beta_pdf(self, price: float, low: float, high: float) -> float:
-        x = (price - low) / (high - low)
-        if x <= 0 or x >= 1:
-            return 0.0
-
-        a, b = self.alpha, self.beta
-        return (x ** (a - 1)) * ((1 - x) ** (b - 1))
-
-    def _round_tick(self, price: float) -> float:
-        return round(price / self.tick_size) * self.tick_size
+    def _round_tick(self, prices: np.ndarray) -> np.ndarray:
+        return np.round(prices / self.tick_size) * self.tick_size
 
     def _center_index(self) -> int:
         """
         Índice central da distribuição (usado para correção de rounding).
         """
         return self.levels // 2
+
+
+@lru_cache(maxsize=32)
+def _beta_profile(
+    levels: int, alpha: float, beta: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Grade normalizada x = i / (levels - 1) e pesos Beta normalizados.
+
+    O formato só depende de (levels, alpha, beta), então é calculado uma vez
+    por combinação de parâmetros e reaproveitado para todos os candles.
+    """
+    grid = np.linspace(0.0, 1.0, levels)
+    pdf = np.zeros(levels)
+    inner = grid[1:-1]
+    pdf[1:-1] = inner ** (alpha - 1) * (1 - inner) ** (beta - 1)
+
+    total = pdf.sum()
+    weights = pdf / total if total > 0 else pdf
+
+    grid.setflags(write=False)
+    weights.setflags(write=False)
+    return grid, weights
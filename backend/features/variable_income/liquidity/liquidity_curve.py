@@ -0,0 +1,125 @@
+import uuid
+
+from backend.features.variable_income.entities.order import (
+    LimitOrder,
+    OrderAction,
+    next_sequence,
+)
+from backend.features.variable_income.liquidity.liquidity_distribution import (
+    PriceLevel,
+)
+from backend.features.variable_income.order_book import DepthLevel
+
+
+class CurveSide:
+    """Um lado da curva: preços do melhor para o pior e volume restante."""
+
+    __slots__ = ("action", "best", "orders", "prices", "volumes")
+
+    def __init__(self, action: OrderAction, levels: list[PriceLevel]):
+        self.action = action
+        self.prices = [level.price for level in levels]
+        self.volumes = [level.volume for level in levels]
+        self.best = 0  # primeiro nível com volume restante
+        self.orders: dict[int, LimitOrder] = {}  # níveis já materializados
+
+
+class LiquidityCurve:
+    """
+    Liquidez sintética virtual de um ticker para o candle corrente.
+
+    Responsável por:
+    - Guardar a profundidade do market maker como arrays de preço e volume
+    - Expor o melhor preço de cada lado sem criar ordens
+    - Materializar sob demanda uma LimitOrder por nível, reaproveitada depois
+    - Atualizar o volume restante à medida que os níveis são executados
+    """
+
+    def __init__(
+        self,
+        *,
+        ticker: str,
+        client_id: uuid.UUID,
+        bids: list[PriceLevel],
+        asks: list[PriceLevel],
+    ):
+        """`bids` e `asks` devem vir ordenados do melhor para o pior preço."""
+        self.ticker = ticker
+        self.client_id = client_id
+        # Posição na sequência de ordens, usada no desempate por tempo
+        self.seq = next_sequence()
+        self._sides = {
+            OrderAction.BUY: CurveSide(OrderAction.BUY, bids),
+            OrderAction.SELL: CurveSide(OrderAction.SELL, asks),
+        }
+        self._index_by_seq: dict[int, int] = {}
+
+    # =========================
+    # Public API
+    # =========================
+
+    def best_price(self, action: OrderAction) -> float | None:
+        side = self._sides[action]
+        if side.best >= len(side.prices):
+            return None
+        return side.prices[side.best]
+
+    def best_order(self, action: OrderAction) -> LimitOrder | None:
+        """Materializa (ou reaproveita) a ordem do melhor nível do lado."""
+        side = self._sides[action]
+        if side.best >= len(side.prices):
+            return None
+        return self._materialize(side, side.best)
+
+    def fill(self, order: LimitOrder) -> None:
+        """
+        Sincroniza o volume do nível com `order.remaining` após uma execução
+        e avança o melhor nível quando ele se esgota.
+        """
+        side = self._sides[order.action]
+        index = self._index_by_seq[order.seq]
+        side.volumes[index] = order.remaining
+        while side.best < len(side.volumes) and side.volumes[side.best] == 0:
+            side.best += 1
+
+    def owns(self, order: LimitOrder) -> bool:
+        return order.seq in self._index_by_seq
+
+    def get_orders(self, action: OrderAction) -> list[LimitOrder]:
+        """Materializa os níveis com volume restante, do melhor para o pior."""
+        side = self._sides[action]
+        return [
+            self._materialize(side, i)
+            for i in range(side.best, len(side.prices))
+            if side.volumes[i] > 0
+        ]
+
+    def get_depth(self, action: OrderAction) -> list[DepthLevel]:
+        side = self._sides[action]
+        return [
+            (side.prices[i], side.volumes[i])
+            for i in range(side.best, len(side.prices))
+            if side.volumes[i] > 0
+        ]
+
+    # =========================
+    # Helpers
+    # =========================
+
+    def _materialize(self, side: CurveSide, index: int) -> LimitOrder:
+        order = side.orders.get(index)
+        if order is not None:
+            return order
+
+        # Níveis só são executados depois de materializados: o volume
+        # restante aqui ainda é o volume original do nível
+        order = LimitOrder(
+            client_id=self.client_id,
+            ticker=self.ticker,
+            price=side.prices[index],
+            size=side.volumes[index],
+            action=side.action,
+        )
+        side.orders[index] = order
+        self._index_by_seq[order.seq] = index
+        return order
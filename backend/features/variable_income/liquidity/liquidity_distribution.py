@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from backend.features.variable_income.entities.candle import Candle
@@ -33,3 +34,12 @@ class LiquidityDistribution(ABC):
         - Retornar lista vazia se não houver liquidez válida.
         """
         raise NotImplementedError
+
+    def generate_batch(self, candles: Sequence[Candle]) -> list[list[PriceLevel]]:
+        """
+        Gera os níveis de liquidez de vários candles em uma única chamada.
+
+        Retorna uma lista alinhada com `candles`. Implementações podem
+        sobrescrever para vetorizar o cálculo; o padrão delega a `generate`.
+        """
+        return [self.generate(candle) for candle in candles]
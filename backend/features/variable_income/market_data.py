@@ -1,32 +1,158 @@
-from collections import deque
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
 
 from backend.features.variable_income.entities.candle import Candle
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@dataclass(frozen=True, slots=True)
+class CandleWindow:
+    """
+    Janela OHLCV de um ticker, da mais antiga para a mais recente.
+
+    As colunas são views somente-leitura sobre o buffer do MarketData: não
+    copiam dados e só valem até o próximo candle do ticker.
+    """
+
+    dates: np.ndarray  # datetime64[D]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    count: int  # total de candles já recebidos pelo ticker
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+
+class CandleBuffer:
+    """
+    Ring buffer OHLCV de um ticker em arrays NumPy pré-alocados.
+
+    Cada valor é gravado duas vezes (posições `i` e `i + depth`), então a
+    janela cronológica é sempre uma fatia contígua do array: leitura sem cópia
+    e escrita O(1).
+    """
+
+    __slots__ = (
+        "_close",
+        "_days",
+        "_high",
+        "_low",
+        "_open",
+        "_volume",
+        "count",
+        "depth",
+    )
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.count = 0
+        self._open = np.zeros(2 * depth)
+        self._high = np.zeros(2 * depth)
+        self._low = np.zeros(2 * depth)
+        self._close = np.zeros(2 * depth)
+        self._volume = np.zeros(2 * depth)
+        # Dias desde 1970-01-01: exposto como datetime64[D] sem conversão
+        self._days = np.zeros(2 * depth, dtype=np.int64)
+
+    def append(self, candle: Candle) -> None:
+        # Escritas escalares por coluna: bem mais baratas que atribuir tuplas
+        day = candle.price_date.toordinal() - _EPOCH_ORDINAL
+        i = self.count % self.depth
+        for j in (i, i + self.depth):
+            self._open[j] = candle.open
+            self._high[j] = candle.high
+            self._low[j] = candle.low
+            self._close[j] = candle.close
+            self._volume[j] = candle.volume
+            self._days[j] = day
+        self.count += 1
+
+    def window(self) -> CandleWindow:
+        size = min(self.count, self.depth)
+        end = self.count % self.depth or self.depth
+        if self.count > self.depth:
+            end += self.depth
+        start = end - size
+
+        return CandleWindow(
+            dates=_readonly(self._days[start:end].view("datetime64[D]")),
+            open=_readonly(self._open[start:end]),
+            high=_readonly(self._high[start:end]),
+            low=_readonly(self._low[start:end]),
+            close=_readonly(self._close[start:end]),
+            volume=_readonly(self._volume[start:end]),
+            count=self.count,
+        )
+
 
 class MarketData:
     """
     Buffer de candles históricos de mercado por ticker.
 
     Responsável por:
-    - Armazenar histórico limitado de candles (OHLCV) por ticker
-    - Fornecer acesso aos candles mais recentes para análise
+    - Armazenar histórico limitado de candles (OHLCV) por ticker em arrays NumPy
+    - Fornecer janelas OHLCV sem cópia para análise e indicadores
     - Retornar o último candle de um ticker para referência de preço
     """
 
     def __init__(self, maxlen: int = 30):
-        self._buffers: dict[str, deque[Candle]] = {}
+        self._buffers: dict[str, CandleBuffer] = {}
+        self._last: dict[str, Candle] = {}
         self._maxlen = maxlen
 
     def add_candle(self, candle: Candle):
-        if candle.ticker not in self._buffers:
-            self._buffers[candle.ticker] = deque(maxlen=self._maxlen)
-        self._buffers[candle.ticker].append(candle)
+        buffer = self._buffers.get(candle.ticker)
+        if buffer is None:
+            buffer = self._buffers[candle.ticker] = CandleBuffer(self._maxlen)
+        buffer.append(candle)
+        self._last[candle.ticker] = candle
+
+    def get_window(self, ticker: str) -> CandleWindow | None:
+        """Janela OHLCV do ticker (views sem cópia), ou None se não houver candles."""
+        buffer = self._buffers.get(ticker)
+        if buffer is None:
+            return None
+        return buffer.window()
 
     def get_recent(self, ticker: str) -> list[Candle]:
-        return list(self._buffers.get(ticker, []))
+        """Candles do ticker como objetos. Prefira `get_window` em código quente."""
+        window = self.get_window(ticker)
+        if window is None:
+            return []
+        return [
+            Candle(
+                ticker=ticker,
+                price_date=d.item(),
+                open=float(o),
+                high=float(h),
+                low=float(lo),
+                close=float(c),
+                volume=int(v),
+            )
+            for d, o, h, lo, c, v in zip(
+                window.dates,
+                window.open,
+                window.high,
+                window.low,
+                window.close,
+                window.volume,
+                strict=True,
+            )
+        ]
 
     def get_last(self, ticker: str) -> Candle | None:
-        buffer = self._buffers.get(ticker)
-        if not buffer:
-            return None
-        return buffer[-1]
+        return self._last.get(ticker)
+
+    def tickers(self) -> list[str]:
+        return list(self._buffers)
+
+
+def _readonly(view: np.ndarray) -> np.ndarray:
+    view.flags.writeable = False
+    return view
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import uuid
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
+from backend.core.enum import LiquidityMode
 from backend.features.variable_income.entities.candle import Candle
 from backend.features.variable_income.entities.order import LimitOrder, OrderAction
 from backend.features.variable_income.liquidity.beta_distribution import (
     BetaLiquidityDistribution,
 )
+from backend.features.variable_income.liquidity.liquidity_curve import LiquidityCurve
 from backend.features.variable_income.liquidity.liquidity_distribution import (
     LiquidityDistribution,
+    PriceLevel,
 )
 from backend.features.variable_income.order_book import OrderBook
 
@@ -25,6 +28,8 @@ class MarketLiquidity:
     - Distribuir volume do candle usando Beta Distribution (densidade centrípeta)
     - Calcular Typical Price para separar zona de BUY vs SELL
     - Rastrear ordens de mercado por ticker para limpeza eficiente
+    - No modo virtual, manter a liquidez como curva compacta por ticker
+    - Gerar a liquidez de todos os tickers do tick em lote
     """
 
     MARKET_CLIENT_ID: uuid.UUID = uuid.uuid5(uuid.NAMESPACE_DNS, "__MARKET__")
@@ -34,19 +39,28 @@ class MarketLiquidity:
         *,
         order_book: OrderBook,
         distribution: LiquidityDistribution | None = None,
+        mode: LiquidityMode = LiquidityMode.MATERIALIZED,
     ):
         self.order_book = order_book
         self.distribution: LiquidityDistribution = (
             distribution or BetaLiquidityDistribution()
         )
+        self.mode = mode
 
         # Rastreia ordens do mercado por ticker
         self._market_orders: dict[str, list[str]] = defaultdict(list)
 
+        # Modo virtual: curva de liquidez corrente por ticker
+        self._curves: dict[str, LiquidityCurve] = {}
+
     # =========================
     # Public API
     # =========================
 
+    def get_curve(self, ticker: str) -> LiquidityCurve | None:
+        """Curva virtual corrente do ticker (sempre None no modo materializado)."""
+        return self._curves.get(ticker)
+
     def refresh(
         self, candle: Candle, process_order: Callable[[LimitOrder], bool]
     ) -> None:
@@ -55,59 +69,111 @@ class MarketLiquidity:
         - Gera nova liquidez baseada no candle
         - Injeta no OrderBook
         """
-        self._remove_old_orders(candle.ticker)
+        self.refresh_batch([candle], process_order)
 
-        orders = self._generate_orders(candle)
+    def refresh_batch(
+        self, candles: Sequence[Candle], process_order: Callable[[LimitOrder], bool]
+    ) -> None:
+        """
+        Mesmo fluxo de `refresh`, gerando os níveis de todos os candles em
+        uma única chamada à distribuição.
+        """
+        levels_by_candle = self.generate_levels(candles)
+        for candle, levels in zip(candles, levels_by_candle, strict=True):
+            self.apply(candle, levels, process_order)
 
-        for order in orders:
+    def generate_levels(self, candles: Sequence[Candle]) -> list[list[PriceLevel]]:
+        """
+        Gera os níveis de liquidez dos candles em lote. Não toca o book, então
+        pode rodar sem o lock dos tickers.
+        """
+        return self.distribution.generate_batch(candles)
+
+    def apply(
+        self,
+        candle: Candle,
+        levels: list[PriceLevel],
+        process_order: Callable[[LimitOrder], bool],
+    ) -> None:
+        """
+        Substitui a liquidez do ticker pelos níveis gerados para o candle.
+
+        No modo virtual a liquidez anterior é apenas substituída por uma nova
+        curva; cruzá-la com as ordens reais do book fica a cargo do chamador.
+        """
+        if self.mode == LiquidityMode.VIRTUAL:
+            self._curves[candle.ticker] = self._build_curve(candle, levels)
+            return
+
+        self._remove_old_orders(candle.ticker)
+
+        for order in self._generate_orders(candle, levels):
             added = process_order(order)
             if added:
                 self._market_orders[candle.ticker].append(order.id)
 
-        return None
-
     # =========================
     # Geração de liquidez
     # =========================
 
-    def _generate_orders(self, candle: Candle) -> list[LimitOrder]:
+    def _generate_orders(
+        self, candle: Candle, levels: list[PriceLevel]
+    ) -> list[LimitOrder]:
+        bids, asks = self._split_levels(candle, levels)
+        return [
+            LimitOrder(
+                client_id=self.MARKET_CLIENT_ID,
+                ticker=candle.ticker,
+                price=level.price,
+                size=level.volume,
+                action=action,
+            )
+            for action, side in ((OrderAction.BUY, bids), (OrderAction.SELL, asks))
+            for level in side
+        ]
+
+    def _build_curve(self, candle: Candle, levels: list[PriceLevel]) -> LiquidityCurve:
+        bids, asks = self._split_levels(candle, levels)
+        return LiquidityCurve(
+            ticker=candle.ticker,
+            client_id=self.MARKET_CLIENT_ID,
+            bids=bids[::-1],
+            asks=asks,
+        )
+
+    def _split_levels(
+        self, candle: Candle, levels: list[PriceLevel]
+    ) -> tuple[list[PriceLevel], list[PriceLevel]]:
+        """
+        Separa os níveis em zona de compra e de venda, em ordem crescente de
+        preço, usando o Typical Price como centro.
+        """
         if candle.high < candle.low or candle.volume <= 0:
-            return []
+            return [], []
 
         if candle.high == candle.low:
-            return self._generate_flat_market(candle)
+            return self._flat_market_levels(candle)
 
         center = self._typical_price(candle)
 
-        levels = self.distribution.generate(candle)
-
-        orders: list[LimitOrder] = []
+        bids: list[PriceLevel] = []
+        asks: list[PriceLevel] = []
 
         for level in levels:
             if level.volume <= 0:
                 continue
 
             if level.price < center:
-                action = OrderAction.BUY
+                bids.append(level)
             elif level.price > center:
-                action = OrderAction.SELL
-            else:
-                # Evita cruzamento artificial exatamente no centro
-                continue
+                asks.append(level)
+            # Nível exatamente no centro é descartado: evita cruzamento artificial
 
-            orders.append(
-                LimitOrder(
-                    client_id=self.MARKET_CLIENT_ID,
-                    ticker=candle.ticker,
-                    price=level.price,
-                    size=level.volume,
-                    action=action,
-                )
-            )
+        return bids, asks
 
-        return orders
-
-    def _generate_flat_market(self, candle: Candle) -> list[LimitOrder]:
+    def _flat_market_levels(
+        self, candle: Candle
+    ) -> tuple[list[PriceLevel], list[PriceLevel]]:
         """
         Mercado com alto volume concentrado em um único preço.
         Criamos spread técnico mínimo para permitir matching.
@@ -118,24 +184,12 @@ class MarketLiquidity:
         half_volume = candle.volume // 2
 
         if half_volume <= 0:
-            return []
+            return [], []
 
-        return [
-            LimitOrder(
-                client_id=self.MARKET_CLIENT_ID,
-                ticker=candle.ticker,
-                price=price - tick,
-                size=half_volume,
-                action=OrderAction.BUY,
-            ),
-            LimitOrder(
-                client_id=self.MARKET_CLIENT_ID,
-                ticker=candle.ticker,
-                price=price + tick,
-                size=candle.volume - half_volume,
-                action=OrderAction.SELL,
-            ),
-        ]
+        return (
+            [PriceLevel(price=price - tick, volume=half_volume)],
+            [PriceLevel(price=price + tick, volume=candle.volume - half_volume)],
+        )
 
     # =========================
     # Helpers semânticos
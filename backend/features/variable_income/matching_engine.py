@@ -1,12 +1,21 @@
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
 from uuid import UUID
 
+from fastapi import HTTPException
+
+from backend import config
 from backend.core.dto.order import OrderDTO
+from backend.core.dto.order_book_depth import OrderBookDepthDTO
 from backend.core.exceptions.http_exceptions import (
     ConflictError,
     ForbiddenError,
     UnprocessableEntityError,
 )
-from backend.features.realtime import notify
+from backend.core.runtime.event_manager import EventManager
+from backend.core.utils.keyed_lock import KeyedLock
+from backend.features.realtime import deferred, has_subscribers, is_muted, notify
 from backend.features.realtime.schemas import (
     OrderBookSnapshotEventDTO,
     OrderEventDTO,
@@ -14,6 +23,7 @@ from backend.features.realtime.schemas import (
     OrderPartialExecutedEventDTO,
 )
 from backend.features.variable_income.broker import Broker
+from backend.features.variable_income.depth_feed import DEPTH_EVENT_PREFIX, DepthFeed
 from backend.features.variable_income.entities.order import (
     LimitOrder,
     MarketOrder,
@@ -21,9 +31,19 @@ from backend.features.variable_income.entities.order import (
     OrderAction,
     OrderStatus,
 )
+from backend.features.variable_income.liquidity.liquidity_curve import LiquidityCurve
 from backend.features.variable_income.market_data import MarketData
 from backend.features.variable_income.market_liquidity import MarketLiquidity
-from backend.features.variable_income.order_book import OrderBook
+from backend.features.variable_income.order_book import DepthLevel, OrderBook
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Resultado de um item (submissão ou cancelamento) de um lote de ordens."""
+
+    order_id: str
+    status: OrderStatus | None
+    error: str | None = None
 
 
 class MatchingEngine:
@@ -35,15 +55,30 @@ class MatchingEngine:
     - Aplicar regras de execução: MARKET consome tudo ou falha, LIMIT consome até limite
     - Coordenar com Broker para executar trades atomicamente
     - Gerenciar injeção de liquidez sintética baseada em candles
-    - Processar submissão e cancelamento de ordens
+    - Consultar a curva de liquidez virtual junto das ordens reais do book
+    - Reconstruir a liquidez apenas dos tickers com demanda (ordens ou inscritos)
+    - Processar submissão e cancelamento de ordens, avulsos ou em lote
+    - Serializar o matching por ticker, sem bloquear tickers independentes
     - Emitir notificações realtime de ações no OrderBook
+    - Publicar diffs L2 de profundidade por tick para os tickers assinados
     """
 
     def __init__(self, broker: Broker):
         self.broker = broker
-        self.market_data = MarketData()
+        self.market_data = MarketData(maxlen=config.toml.engine.market_data_depth)
         self.order_book = OrderBook()
-        self.market_liquidity = MarketLiquidity(order_book=self.order_book)
+        self.market_liquidity = MarketLiquidity(
+            order_book=self.order_book,
+            mode=config.toml.engine.liquidity_mode,
+        )
+        self.depth_feed = DepthFeed()
+        # Um lock por ticker protege book, curva e feed daquele ticker.
+        # Ordem de aquisição: ticker → clientes (ver SimulationEngine)
+        self._ticker_locks = KeyedLock[str]()
+        # Tickers cujo candle avançou sem reconstruir a liquidez sintética.
+        # Escrito pelo loop e pelas requisições: só é tocado sob _stale_lock
+        self._stale_tickers: set[str] = set()
+        self._stale_lock = threading.Lock()
 
     # =========================
     # API pública
@@ -53,67 +88,272 @@ class MatchingEngine:
         if order.status != OrderStatus.PENDING:
             raise UnprocessableEntityError("Ordem inválida")
 
-        if isinstance(order, MarketOrder):
-            executed = self._consume_book(order)
-            if order.remaining > 0 and executed == 0:
-                raise ConflictError("Sem liquidez no mercado")
+        with self._ticker_locks(order.ticker):
+            self.ensure_liquidity(order.ticker)
 
-        if isinstance(order, LimitOrder):
-            # Reserva o cash/posição em LIMIT para evitar que seja gasto em outro trade antes de ser executado
-            self.broker.reserve_limit_order(order)
+            if isinstance(order, MarketOrder):
+                executed = self._consume_book(order)
+                if order.remaining > 0 and executed == 0:
+                    raise ConflictError("Sem liquidez no mercado")
 
-            # LIMIT tenta consumir o book
-            self._consume_book(order)
+            if isinstance(order, LimitOrder):
+                # Reserva o cash/posição em LIMIT para evitar que seja gasto em outro trade antes de ser executado
+                self.broker.reserve_limit_order(order)
+
+                # LIMIT tenta consumir o book
+                self._consume_book(order)
+
+                # LIMIT que sobrou → entra no book
+                if order.remaining > 0:
+                    self.order_book.add(order)
+                    if not is_muted():
+                        notify(
+                            event=f"order_added:{order.ticker}",
+                            payload=OrderEventDTO(
+                                order=OrderDTO.from_model(order)
+                            ).to_json(),
+                        )
+
+    def execute_batch(
+        self,
+        *,
+        client_id: UUID,
+        orders: Sequence[Order],
+        cancel_ids: Sequence[str] = (),
+    ) -> tuple[list[BatchResult], list[BatchResult]]:
+        """
+        Executa um lote de cancelamentos e submissões do cliente.
 
-            # LIMIT que sobrou → entra no book
-            if order.remaining > 0:
-                self.order_book.add(order)
-                notify(
-                    event=f"order_added:{order.ticker}",
-                    payload=OrderEventDTO(order=OrderDTO.from_model(order)).to_json(),
+        Os locks de todos os tickers do lote são adquiridos uma única vez; os
+        cancelamentos rodam antes, liberando saldo/posição para as submissões.
+        As reservas das ordens LIMIT são validadas em conjunto antes de
+        qualquer execução, e cada item falha isoladamente sem abortar o lote.
+        Notificações realtime e eventos de equity são publicados de uma vez
+        ao final.
+
+        Retorna (resultados dos cancelamentos, resultados das submissões),
+        na ordem recebida.
+        """
+        tickers = {order.ticker for order in orders}
+        found: set[str] = set()
+        for order_id in cancel_ids:
+            if (order := self.order_book.find(order_id)) is not None:
+                tickers.add(order.ticker)
+                found.add(order_id)
+
+        # Os locks de cliente continuam por trade: segurá-los no lote inteiro
+        # inverteria a ordem ticker → cliente com a contraparte
+        with (
+            deferred(),
+            EventManager.batched(),
+            self._ticker_locks.acquire_many(tickers),
+        ):
+            # Só cancela ordens cujo ticker já está travado pelo lote
+            canceled = [
+                self._cancel_in_batch(order_id, client_id)
+                if order_id in found
+                else BatchResult(order_id, None, "Ordem não encontrada")
+                for order_id in cancel_ids
+            ]
+
+            limit_orders = [o for o in orders if isinstance(o, LimitOrder)]
+            rejections = dict(
+                zip(
+                    (o.id for o in limit_orders),
+                    self.broker.validate_reservations(limit_orders),
+                    strict=True,
                 )
+            )
+
+            submitted: list[BatchResult] = []
+            for order in orders:
+                if (rejection := rejections.get(order.id)) is not None:
+                    submitted.append(BatchResult(order.id, None, rejection.detail))
+                    continue
+                try:
+                    self.submit(order)
+                except HTTPException as e:
+                    submitted.append(BatchResult(order.id, None, e.detail))
+                else:
+                    submitted.append(BatchResult(order.id, order.status))
+
+        return canceled, submitted
 
     def on_tick(self, ticker: str) -> None:
         """
         Candle injeta liquidez sintética no book.
         """
-        candle = self.market_data.get_last(ticker)
-        if not candle:
-            return
+        self.on_ticks([ticker])
+
+    def on_ticks(self, tickers: list[str]) -> None:
+        """
+        Candles de todos os tickers do tick injetam liquidez sintética no book,
+        com a geração dos níveis feita em lote.
 
-        self.market_liquidity.refresh(candle, self._process_market_order)
+        A liquidez só é reconstruída para tickers com demanda: ordens
+        pendentes no book ou clientes inscritos no book. Os demais ficam
+        marcados como desatualizados e são reconstruídos quando uma ordem ou
+        consulta tocar o ticker.
+        """
+        active: list[str] = []
+        stale: list[str] = []
+        for ticker in tickers:
+            if self.order_book.has_orders(ticker) or self._has_book_subscribers(ticker):
+                active.append(ticker)
+            else:
+                stale.append(ticker)
+        with self._stale_lock:
+            self._stale_tickers.update(stale)
+
+        self._refresh_liquidity(active)
+
+    def ensure_liquidity(self, ticker: str) -> None:
+        """Reconstrói a liquidez do ticker se ela ficou para trás do candle."""
+        with self._ticker_locks(ticker):
+            with self._stale_lock:
+                stale = ticker in self._stale_tickers
+            if stale:
+                self._refresh_liquidity([ticker])
+
+    def get_orders(self, ticker: str) -> list[LimitOrder]:
+        """
+        Ordens pendentes do ticker (BUY + SELL) em prioridade de execução,
+        incluindo os níveis da curva virtual, materializados sob demanda.
+        """
+        with self._ticker_locks(ticker):
+            self.ensure_liquidity(ticker)
+            curve = self.market_liquidity.get_curve(ticker)
+            book_orders = self.order_book.get_orders(ticker)
+            if curve is None:
+                return book_orders
+
+            bids = [o for o in book_orders if o.action == OrderAction.BUY]
+            asks = [o for o in book_orders if o.action == OrderAction.SELL]
+            bids += curve.get_orders(OrderAction.BUY)
+            asks += curve.get_orders(OrderAction.SELL)
+
+        # Ordenação estável: em empate de preço, as ordens reais (mais antigas) vêm antes
+        bids.sort(key=lambda o: o.price, reverse=True)
+        asks.sort(key=lambda o: o.price)
+        return bids + asks
+
+    def get_depth(
+        self, ticker: str, max_levels: int | None = None
+    ) -> tuple[list[DepthLevel], list[DepthLevel]]:
+        """Profundidade agregada (bids, asks) somando book real e curva virtual."""
+        with self._ticker_locks(ticker):
+            self.ensure_liquidity(ticker)
+            bids, asks = self.order_book.get_depth(ticker)
+            curve = self.market_liquidity.get_curve(ticker)
+            if curve is not None:
+                bids = _merge_depth(
+                    bids, curve.get_depth(OrderAction.BUY), reverse=True
+                )
+                asks = _merge_depth(asks, curve.get_depth(OrderAction.SELL))
+        if max_levels is not None:
+            return bids[:max_levels], asks[:max_levels]
+        return bids, asks
 
-        notify(
-            event=f"order_book_snapshot:{candle.ticker}",
-            payload=OrderBookSnapshotEventDTO(
-                orders=[
-                    OrderDTO.from_model(o)
-                    for o in self.order_book.get_orders(candle.ticker)
-                ]
-            ).to_json(),
-        )
+    def depth_snapshot(self, ticker: str) -> OrderBookDepthDTO:
+        """
+        Snapshot L2 do ticker para (re)sincronizar um cliente.
+
+        Publica antes um diff com as mudanças pendentes, para que o `seq` do
+        snapshot corresponda ao estado atual do book.
+        """
+        with self._ticker_locks(ticker):
+            self._publish_depth(ticker)
+            return self.depth_feed.snapshot(ticker)
 
     def cancel(self, *, order_id: str, client_id: UUID) -> bool:
         order = self.order_book.find(order_id)
         if not order:
             return False
 
-        if order.client_id != client_id:
-            raise ForbiddenError("Ordem não pertence ao cliente")
+        with self._ticker_locks(order.ticker):
+            # Pode ter sido executada entre o lookup e a aquisição do lock
+            if self.order_book.find(order_id) is not order:
+                return False
 
-        if order.status != OrderStatus.PENDING:
-            raise ForbiddenError("Ordem não pode ser cancelada")
+            if order.client_id != client_id:
+                raise ForbiddenError("Ordem não pertence ao cliente")
+
+            if order.status != OrderStatus.PENDING:
+                raise ForbiddenError("Ordem não pode ser cancelada")
+
+            self.broker.release_limit_order(order)
+
+            # Remove antes de zerar o restante: o book desconta o tamanho do nível
+            self.order_book.remove(order)
+            order.status = OrderStatus.CANCELED
+            order.remaining = 0
+            if not is_muted():
+                notify(
+                    event=f"order_updated:{order.ticker}",
+                    payload=OrderEventDTO(order=OrderDTO.from_model(order)).to_json(),
+                )
+            return True
+
+    def _cancel_in_batch(self, order_id: str, client_id: UUID) -> BatchResult:
+        try:
+            if not self.cancel(order_id=order_id, client_id=client_id):
+                return BatchResult(order_id, None, "Ordem não encontrada")
+        except HTTPException as e:
+            return BatchResult(order_id, None, e.detail)
+        return BatchResult(order_id, OrderStatus.CANCELED)
+
+    def _refresh_liquidity(self, tickers: list[str]) -> None:
+        candles = [
+            candle
+            for ticker in tickers
+            if (candle := self.market_data.get_last(ticker)) is not None
+        ]
+        if not candles:
+            return
+
+        # Geração em lote fora dos locks; cada book é trocado sob o seu lock
+        levels_by_candle = self.market_liquidity.generate_levels(candles)
+
+        for candle, levels in zip(candles, levels_by_candle, strict=True):
+            with self._ticker_locks(candle.ticker):
+                # Se um candle mais novo chegou durante a geração, a marca de
+                # desatualizado fica para ele
+                if self.market_data.get_last(candle.ticker) is candle:
+                    with self._stale_lock:
+                        self._stale_tickers.discard(candle.ticker)
+                self.market_liquidity.apply(candle, levels, self._process_market_order)
+
+                curve = self.market_liquidity.get_curve(candle.ticker)
+                if curve is not None:
+                    self._cross_curve(curve)
+
+                self._notify_book(candle.ticker)
 
-        self.broker.release_limit_order(order)
+    def _notify_book(self, ticker: str) -> None:
+        if has_subscribers(f"{DEPTH_EVENT_PREFIX}{ticker}"):
+            self._publish_depth(ticker)
 
-        order.status = OrderStatus.CANCELED
-        order.remaining = 0
+        event = f"order_book_snapshot:{ticker}"
+        # Evita montar o snapshot do book quando ninguém vai recebê-lo
+        if not has_subscribers(event):
+            return
         notify(
-            event=f"order_updated:{order.ticker}",
-            payload=OrderEventDTO(order=OrderDTO.from_model(order)).to_json(),
+            event=event,
+            payload=OrderBookSnapshotEventDTO(
+                orders=[OrderDTO.from_model(o) for o in self.get_orders(ticker)]
+            ).to_json(),
+        )
+
+    def _publish_depth(self, ticker: str) -> None:
+        bids, asks = self.get_depth(ticker)
+        update = self.depth_feed.diff(ticker, bids, asks)
+        if update is not None:
+            notify(event=f"{DEPTH_EVENT_PREFIX}{ticker}", payload=update.to_json())
+
+    def _has_book_subscribers(self, ticker: str) -> bool:
+        return has_subscribers(f"order_book_snapshot:{ticker}") or has_subscribers(
+            f"{DEPTH_EVENT_PREFIX}{ticker}"
         )
-        self.order_book.remove(order)
-        return True
 
     def _process_market_order(self, mo: LimitOrder) -> bool:
         """Callback usado por MarketLiquidity.refresh.
@@ -143,12 +383,10 @@ class MatchingEngine:
         - melhor preço disponível
         - price-time priority
         """
+        curve = self.market_liquidity.get_curve(order.ticker)
+
         while order.remaining > 0:
-            counter = (
-                self.order_book.best_sell(order.ticker)
-                if order.action == OrderAction.BUY
-                else self.order_book.best_buy(order.ticker)
-            )
+            counter = self._best_counter(order, curve)
 
             if not counter:
                 break
@@ -161,8 +399,54 @@ class MatchingEngine:
                     break
 
             self._execute_trade(order, counter, counter.price)
+
+            if curve is not None and curve.owns(counter):
+                curve.fill(counter)
         return order.size - order.remaining
 
+    def _best_counter(
+        self, order: Order, curve: LiquidityCurve | None
+    ) -> LimitOrder | None:
+        """
+        Melhor contraparte entre o book real e a curva virtual.
+        Em empate de preço vence a mais antiga (price-time priority).
+        """
+        if order.action == OrderAction.BUY:
+            real = self.order_book.best_sell(order.ticker)
+            counter_action = OrderAction.SELL
+        else:
+            real = self.order_book.best_buy(order.ticker)
+            counter_action = OrderAction.BUY
+
+        if curve is None:
+            return real
+
+        virtual_price = curve.best_price(counter_action)
+        if virtual_price is None:
+            return real
+
+        if real is not None:
+            if real.price == virtual_price:
+                if real.seq < curve.seq:
+                    return real
+            elif (real.price < virtual_price) == (order.action == OrderAction.BUY):
+                return real
+
+        return curve.best_order(counter_action)
+
+    def _cross_curve(self, curve: LiquidityCurve) -> None:
+        """
+        Cruza uma curva recém-gerada com as ordens reais que ficaram no book.
+        A liquidez sintética age como taker e executa no preço do maker.
+        """
+        for action in (OrderAction.BUY, OrderAction.SELL):
+            while (taker := curve.best_order(action)) is not None:
+                self._consume_book(taker)
+                curve.fill(taker)
+                # Nível não esgotado: os seguintes, de preço pior, também não cruzam
+                if taker.remaining > 0:
+                    break
+
     def _execute_trade(self, taker: Order, maker: LimitOrder, price: float):
         """
         Executa trade atomicamente entre taker (ordem ativa) e maker (ordem do book).
@@ -191,14 +475,18 @@ class MatchingEngine:
         self._notify_execution(taker, price, qty)
         self._notify_execution(maker, price, qty)
 
-        if maker.remaining == 0:
-            self.order_book.remove(maker)
+        # Atualiza o tamanho do nível e remove o maker se foi totalmente executado
+        self.order_book.reduce(maker, qty)
 
     # =========================
     # Notificações
     # =========================
 
     def _notify_execution(self, order: Order, price: float, quantity: int):
+        # Sem montar payloads que não serão enviados (fast-forward, backtest)
+        if is_muted():
+            return
+
         event = "order_executed" if order.remaining == 0 else "order_partial_executed"
 
         if order.remaining > 0:
@@ -227,3 +515,12 @@ class MatchingEngine:
                 event=f"order_updated:{order.ticker}",
                 payload=OrderEventDTO(order=OrderDTO.from_model(order)).to_json(),
             )
+
+
+def _merge_depth(
+    real: list[DepthLevel], virtual: list[DepthLevel], *, reverse: bool = False
+) -> list[DepthLevel]:
+    sizes: dict[float, int] = {}
+    for price, size in (*real, *virtual):
+        sizes[price] = sizes.get(price, 0) + size
+    return sorted(sizes.items(), reverse=reverse)
@@ -1,101 +1,178 @@
-import heapq
+from bisect import bisect_left, insort
 from collections import defaultdict
-from datetime import datetime
+from collections.abc import Iterator
 
 from backend.features.variable_income.entities.order import (
     LimitOrder,
-    Order,
     OrderAction,
+    parse_order_id,
 )
 
+type DepthLevel = tuple[float, int]
+
+
+class BookLevel:
+    """Nível de preço do book: fila FIFO de ordens e tamanho agregado."""
+
+    __slots__ = ("orders", "price", "size")
+
+    def __init__(self, price: float):
+        self.price = price
+        # dict preserva a ordem de inserção: FIFO com remoção O(1) por seq
+        self.orders: dict[int, LimitOrder] = {}
+        self.size = 0
+
+    def first(self) -> LimitOrder:
+        return next(iter(self.orders.values()))
+
+
+class BookSide:
+    """Lado (BUY ou SELL) do book de um ticker, organizado por nível de preço."""
+
+    __slots__ = ("is_buy", "levels", "prices")
+
+    def __init__(self, is_buy: bool):
+        self.is_buy = is_buy
+        self.levels: dict[float, BookLevel] = {}
+        self.prices: list[float] = []  # escada de preços em ordem crescente
+
+    def best(self) -> BookLevel | None:
+        if not self.prices:
+            return None
+        return self.levels[self.prices[-1] if self.is_buy else self.prices[0]]
+
+    def add(self, order: LimitOrder) -> None:
+        level = self.levels.get(order.price)
+        if level is None:
+            level = self.levels[order.price] = BookLevel(order.price)
+            insort(self.prices, order.price)
+        level.orders[order.seq] = order
+        level.size += order.remaining
+
+    def remove(self, order: LimitOrder) -> None:
+        level = self.levels[order.price]
+        del level.orders[order.seq]
+        level.size -= order.remaining
+        if not level.orders:
+            del self.levels[order.price]
+            del self.prices[bisect_left(self.prices, order.price)]
+
+    def iter_levels(self) -> Iterator[BookLevel]:
+        """Percorre os níveis do melhor para o pior preço."""
+        prices = reversed(self.prices) if self.is_buy else self.prices
+        for price in prices:
+            yield self.levels[price]
+
 
 class OrderBook:
     """
-    Livro de ofertas otimizado para ordens LIMIT.
+    Livro de ofertas organizado por nível de preço para ordens LIMIT.
 
     Responsável por:
-    - Manter heaps por ticker para obter melhor preço em O(log n)
-    - Indexar ordens por ID para lookup e cancelamento em O(1)
-    - Implementar lazy deletion de ordens canceladas nos heaps
+    - Manter por ticker uma escada de preços ordenada com fila FIFO por nível
+    - Manter o tamanho agregado de cada nível para snapshots de profundidade
+    - Indexar ordens pelo seq para lookup e cancelamento reais em O(1)
     - Fornecer best buy/sell e listar ordens pendentes por ticker
     """
 
     def __init__(self):
-        self._buy_heap: dict[str, list[tuple[float, datetime, LimitOrder]]] = (
-            defaultdict(list)
-        )  # max-heap (preço mais alto primeiro)
-        self._sell_heap: dict[str, list[tuple[float, datetime, LimitOrder]]] = (
-            defaultdict(list)
-        )  # min-heap (preço mais baixo primeiro)
-        self._orders_by_id: dict[str, LimitOrder] = {}
+        self._buy_sides: dict[str, BookSide] = defaultdict(lambda: BookSide(True))
+        self._sell_sides: dict[str, BookSide] = defaultdict(lambda: BookSide(False))
+        self._orders_by_seq: dict[int, LimitOrder] = {}
+        self._counts: dict[str, int] = defaultdict(int)
 
     def add(self, order: LimitOrder):
-        """Adiciona ordem ao book
-        Custo: O(log n) para heap + O(1) para dict
+        """Adiciona ordem ao fim da fila do seu nível de preço.
+        Custo: O(1), mais O(log n) para inserir um nível novo na escada
         """
-        if order.action == OrderAction.BUY:
-            heapq.heappush(
-                self._buy_heap[order.ticker], (-order.price, order.created_at, order)
-            )
-        else:
-            heapq.heappush(
-                self._sell_heap[order.ticker], (order.price, order.created_at, order)
-            )
-
-        self._orders_by_id[order.id] = order  # O(1)
+        self._side(order.ticker, order.action).add(order)
+        self._orders_by_seq[order.seq] = order
+        self._counts[order.ticker] += 1
 
     def find(self, order_id: str) -> LimitOrder | None:
-        """Lookup instantâneo pela id da ordem.
+        """Lookup instantâneo pela id pública da ordem.
         Custo: O(1)
         """
-        return self._orders_by_id.get(order_id)
+        seq = parse_order_id(order_id)
+        if seq is None:
+            return None
+        return self._orders_by_seq.get(seq)
 
     def remove(self, order: LimitOrder):
         """
-        Remove ordem do book.
-        Usamos lazy delete: apenas removemos do dict, o heap será limpo no pop.
-        Custo: O(1)
+        Remove ordem do book, descontando o restante dela do nível.
+        Custo: O(1), mais a remoção do nível da escada quando ele esvazia
         """
-        self._orders_by_id.pop(order.id, None)
+        if self._orders_by_seq.pop(order.seq, None) is None:
+            return
+        self._side(order.ticker, order.action).remove(order)
+        self._counts[order.ticker] -= 1
 
-    def best_buy(self, ticker: str) -> LimitOrder | None:
+    def reduce(self, order: LimitOrder, quantity: int) -> None:
         """
-        Retorna melhor BUY disponível.
-        Lazy remove ordens canceladas.
-        Custo: O(1) para peek, O(log n) se precisar limpar lazy deletes
+        Registra a execução parcial/total de uma ordem do book.
+
+        Deve ser chamada depois de `order.remaining` ser decrementado; a ordem
+        sai do book quando não sobra nada.
         """
-        while self._buy_heap[ticker]:
-            _, _, order = self._buy_heap[ticker][0]
-            if order.id in self._orders_by_id:
-                return order
-            heapq.heappop(self._buy_heap[ticker])  # limpa ordem inválida
-        return None
+        if order.seq not in self._orders_by_seq:
+            return
+        side = self._side(order.ticker, order.action)
+        side.levels[order.price].size -= quantity
+        if order.remaining == 0:
+            self.remove(order)
+
+    def has_orders(self, ticker: str) -> bool:
+        """Indica se há ordens pendentes no ticker. Custo: O(1)"""
+        return self._counts.get(ticker, 0) > 0
+
+    def best_buy(self, ticker: str) -> LimitOrder | None:
+        """Retorna a BUY mais antiga do maior preço. Custo: O(1)"""
+        level = self._best_level(ticker, OrderAction.BUY)
+        return level.first() if level else None
 
     def best_sell(self, ticker: str) -> LimitOrder | None:
-        """
-        Retorna melhor SELL disponível.
-        Lazy remove ordens canceladas.
-        Custo: O(1) para peek, O(log n) se precisar limpar lazy deletes
-        """
-        while self._sell_heap[ticker]:
-            _, _, order = self._sell_heap[ticker][0]
-            if order.id in self._orders_by_id:
-                return order
-            heapq.heappop(self._sell_heap[ticker])
-        return None
-
-    def get_orders(self, ticker: str) -> list[Order]:
-        """Retorna todas as ordens válidas (BUY + SELL) para um ticker."""
-        orders: list[Order] = []
-
-        # BUY
-        for _, _, order in self._buy_heap.get(ticker, []):
-            if order.id in self._orders_by_id:
-                orders.append(order)
-
-        # SELL
-        for _, _, order in self._sell_heap.get(ticker, []):
-            if order.id in self._orders_by_id:
-                orders.append(order)
+        """Retorna a SELL mais antiga do menor preço. Custo: O(1)"""
+        level = self._best_level(ticker, OrderAction.SELL)
+        return level.first() if level else None
+
+    def get_depth(
+        self, ticker: str, max_levels: int | None = None
+    ) -> tuple[list[DepthLevel], list[DepthLevel]]:
+        """Retorna (bids, asks) agregados por preço, do melhor para o pior."""
+        return (
+            self._depth(self._buy_sides.get(ticker), max_levels),
+            self._depth(self._sell_sides.get(ticker), max_levels),
+        )
 
+    def get_orders(self, ticker: str) -> list[LimitOrder]:
+        """Retorna todas as ordens (BUY + SELL) do ticker em prioridade de execução."""
+        orders: list[LimitOrder] = []
+        for sides in (self._buy_sides, self._sell_sides):
+            side = sides.get(ticker)
+            if side is None:
+                continue
+            for level in side.iter_levels():
+                orders.extend(level.orders.values())
         return orders
+
+    def _side(self, ticker: str, action: OrderAction) -> BookSide:
+        if action == OrderAction.BUY:
+            return self._buy_sides[ticker]
+        return self._sell_sides[ticker]
+
+    def _best_level(self, ticker: str, action: OrderAction) -> BookLevel | None:
+        sides = self._buy_sides if action == OrderAction.BUY else self._sell_sides
+        side = sides.get(ticker)
+        return side.best() if side else None
+
+    @staticmethod
+    def _depth(side: BookSide | None, max_levels: int | None) -> list[DepthLevel]:
+        if side is None:
+            return []
+        depth: list[DepthLevel] = []
+        for level in side.iter_levels():
+            if max_levels is not None and len(depth) >= max_levels:
+                break
+            depth.append((level.price, level.size))
+        return depth
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from backend.core import repository
+from backend.core.dto.candle import CandleDTO
+from backend.core.dto.stock import StockDTO
+from backend.core.dto.stock_details import StockDetailsDTO
+from backend.core.dto.stock_price_history import StockPriceHistoryDTO
+
+
+class PriceStore:
+    """
+    Armazenamento colunar em memória do histórico de preços da simulação.
+
+    Responsável por:
+    - Carregar o histórico OHLCV de todos os tickers uma única vez
+    - Manter datas e OHLCV em arrays NumPy contíguos, fatiados por ticker
+    - Responder "último candle até a data" via busca binária, sem ida ao banco
+    - Fornecer histórico e preços de fechamento para detalhes e marcação a mercado
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        frame = frame.sort_values(["stock_id", "price_date"], kind="stable")
+
+        self._dates = pd.to_datetime(frame["price_date"]).to_numpy("datetime64[D]")
+        self._open = frame["open"].to_numpy(np.float64)
+        self._high = frame["high"].to_numpy(np.float64)
+        self._low = frame["low"].to_numpy(np.float64)
+        self._close = frame["close"].to_numpy(np.float64)
+        self._volume = frame["volume"].to_numpy(np.int64)
+
+        # Fatia [início, fim) de cada ticker nos arrays, em ordem de stock_id
+        self._stocks: dict[str, StockDTO] = {}
+        self._ranges: dict[str, tuple[int, int]] = {}
+        stock_ids = frame["stock_id"].to_numpy(np.int64)
+        if len(stock_ids):
+            starts = np.flatnonzero(np.diff(stock_ids, prepend=stock_ids[0] - 1))
+            ends = np.append(starts[1:], len(stock_ids))
+            tickers = frame["ticker"].to_numpy()
+            names = frame["name"].to_numpy()
+            for start, end in zip(starts.tolist(), ends.tolist(), strict=True):
+                ticker = str(tickers[start])
+                self._stocks[ticker] = StockDTO(
+                    id=int(stock_ids[start]),
+                    ticker=ticker,
+                    name=str(names[start]),
+                )
+                self._ranges[ticker] = (start, end)
+
+        self._cached_date: date | None = None
+        # Tupla: cada chamada recebe uma lista própria (os DTOs são imutáveis)
+        self._cached_candles: tuple[CandleDTO, ...] = ()
+
+    @classmethod
+    def load(cls, end_date: date) -> PriceStore:
+        return cls(repository.stock.get_price_history_frame(end_date))
+
+    @property
+    def tickers(self) -> list[str]:
+        return list(self._ranges)
+
+    def has_ticker(self, ticker: str) -> bool:
+        return ticker in self._ranges
+
+    def get_candles(self, current_date: date) -> list[CandleDTO]:
+        """Retorna o último candle de cada ticker até a data informada."""
+        if self._cached_date == current_date:
+            return list(self._cached_candles)
+
+        candles: list[CandleDTO] = []
+        for ticker in self._ranges:
+            index = self._index_as_of(ticker, current_date)
+            if index is not None:
+                candles.append(self._build_candle(ticker, index))
+
+        self._cached_date, self._cached_candles = current_date, tuple(candles)
+        return candles
+
+    def get_stock_details(
+        self, ticker: str, current_date: date
+    ) -> StockDetailsDTO | None:
+        """Retorna o último candle e o histórico completo do ticker até a data."""
+        if ticker not in self._ranges:
+            return None
+
+        start, _ = self._ranges[ticker]
+        index = self._index_as_of(ticker, current_date)
+        end = start if index is None else index + 1
+        history = [
+            StockPriceHistoryDTO(
+                price_date=price_date,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+            )
+            for price_date, open_, high, low, close, volume in zip(
+                self._dates[start:end].tolist(),
+                self._open[start:end].tolist(),
+                self._high[start:end].tolist(),
+                self._low[start:end].tolist(),
+                self._close[start:end].tolist(),
+                self._volume[start:end].tolist(),
+                strict=True,
+            )
+        ]
+
+        if index is None:
+            stock = self._stocks[ticker]
+            return StockDetailsDTO(
+                id=stock.id,
+                ticker=stock.ticker,
+                name=stock.name,
+                open=0,
+                close=0,
+                low=0,
+                high=0,
+                volume=0,
+                price_date=current_date,
+                change=0,
+                change_pct="0.00%",
+                history=history,
+            )
+
+        candle = self._build_candle(ticker, index)
+        return StockDetailsDTO(**candle.model_dump(), history=history)
+
+    def get_closes(self, current_date: date) -> dict[int, float]:
+        """Retorna o último fechamento até a data, indexado por stock_id."""
+        closes: dict[int, float] = {}
+        for ticker, stock in self._stocks.items():
+            index = self._index_as_of(ticker, current_date)
+            if index is not None:
+                closes[stock.id] = float(self._close[index])
+        return closes
+
+    def _index_as_of(self, ticker: str, current_date: date) -> int | None:
+        start, end = self._ranges[ticker]
+        position = int(
+            np.searchsorted(
+                self._dates[start:end],
+                np.datetime64(current_date, "D"),
+                side="right",
+            )
+        )
+        return start + position - 1 if position > 0 else None
+
+    def _build_candle(self, ticker: str, index: int) -> CandleDTO:
+        stock = self._stocks[ticker]
+        open_ = float(self._open[index])
+        close = float(self._close[index])
+        change = close - open_
+        change_pct = (change / open_ * 100) if open_ != 0 else 0
+        return CandleDTO(
+            id=stock.id,
+            ticker=stock.ticker,
+            name=stock.name,
+            close=close,
+            low=float(self._low[index]),
+            high=float(self._high[index]),
+            volume=int(self._volume[index]),
+            open=open_,
+            price_date=self._dates[index].item(),
+            change=round(change, 2),
+            change_pct=f"{change_pct:+.2f}%",
+        )
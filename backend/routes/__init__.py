@@ -4,6 +4,7 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 
 from backend.routes.auth import auth_router
+from backend.routes.backtest import backtest_router
 from backend.routes.error import ERROR_500_RESPONSE, ErrorResponse
 from backend.routes.frontend import register_frontend_routes
 from backend.routes.importer import import_router
@@ -31,6 +32,7 @@ def register_routes(app: FastAPI):
     app.include_router(statistics_router, responses=ERROR_500_RESPONSE)
     app.include_router(simulation_router, responses=ERROR_500_RESPONSE)
     app.include_router(tunnel_router, responses=ERROR_500_RESPONSE)
+    app.include_router(backtest_router, responses=ERROR_500_RESPONSE)
 
     # SPA FRONTEND (sempre por último para pegar todas as rotas não mapeadas)
     register_frontend_routes(app)
@@ -0,0 +1,103 @@
+from datetime import date
+from typing import Any
+
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+
+from backend.features.backtest.backtester import Backtester
+from backend.features.strategy.registry import STRATEGIES, get_strategy
+
+backtest_router = APIRouter(prefix="/api", tags=["Backtest"])
+
+
+class BacktestRequest(BaseModel):
+    strategy: str
+    start_date: date
+    end_date: date
+    starting_cash: float = Field(default=10_000, gt=0)
+    tickers: list[str] | None = None
+    params: dict[str, Any] = Field(default_factory=dict)
+
+
+class BacktestTradeResponse(BaseModel):
+    trade_date: date
+    ticker: str
+    action: str
+    quantity: int
+    price: float
+
+
+class EquityPointResponse(BaseModel):
+    date: date
+    equity: float
+
+
+class BacktestResponse(BaseModel):
+    strategy: str
+    tickers: list[str]
+    starting_cash: float
+    final_equity: float
+    total_return: float
+    max_drawdown: float
+    ticks: int
+    elapsed: float
+    trades: list[BacktestTradeResponse]
+    equity_curve: list[EquityPointResponse]
+
+
+@backtest_router.get(
+    "/backtest/strategies",
+    response_model=list[str],
+    summary="Listar estratégias",
+    description="Retorna os nomes das estratégias disponíveis para backtest.",
+)
+def list_strategies():
+    """
+    Lista as estratégias registradas.
+    """
+    return list(STRATEGIES)
+
+
+@backtest_router.post(
+    "/backtest",
+    response_model=BacktestResponse,
+    summary="Executar backtest",
+    description="Executa offline uma estratégia sobre o histórico de preços do período, com broker e caixa em memória (sem afetar a simulação ativa), e retorna trades, curva de patrimônio e tempo de execução.",
+)
+def run_backtest(payload: BacktestRequest):
+    """
+    Executa o backtest de uma estratégia.
+    """
+    strategy_cls = get_strategy(payload.strategy)
+    result = Backtester.load(payload.end_date).run(
+        strategy_cls,
+        start_date=payload.start_date,
+        end_date=payload.end_date,
+        starting_cash=payload.starting_cash,
+        tickers=payload.tickers,
+        params=payload.params,
+    )
+    return BacktestResponse(
+        strategy=result.strategy,
+        tickers=result.tickers,
+        starting_cash=result.starting_cash,
+        final_equity=result.final_equity,
+        total_return=result.total_return,
+        max_drawdown=result.max_drawdown,
+        ticks=result.ticks,
+        elapsed=result.elapsed,
+        trades=[
+            BacktestTradeResponse(
+                trade_date=t.trade_date,
+                ticker=t.ticker,
+                action=t.action.value,
+                quantity=t.quantity,
+                price=t.price,
+            )
+            for t in result.trades
+        ],
+        equity_curve=[
+            EquityPointResponse(date=d, equity=float(v))
+            for d, v in zip(result.dates, result.equity_curve.to_numpy(), strict=True)
+        ],
+    )
@@ -5,10 +5,12 @@ from pydantic import BaseModel
 
 from backend.core import repository
 from backend.core.dto.stock_status import StockStatusDTO
+from backend.core.enum import EconomicIndicatorType
 from backend.features.import_data.importer_service import (
     update_from_csv,
     update_from_yfinance,
     update_from_yfinance_batch,
+    update_indicator_from_csv,
 )
 
 import_router = APIRouter(prefix="/api/import-assets", tags=["Import Assets"])
@@ -83,3 +85,20 @@ def import_assets_csv(
     """
     overwrite_bool = str_to_bool(overwrite)
     update_from_csv(csv_file, ticker, overwrite_bool)
+
+
+@import_router.post(
+    "/indicators/csv",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Importar série de indicador econômico de CSV",
+    description="Importa a série histórica de IPCA (variação mensal, %) ou SELIC (% a.a.) "
+    "a partir de um CSV no formato do SGS do Banco Central (data;valor).",
+)
+def import_indicator_csv(
+    indicator: Annotated[EconomicIndicatorType, Form(...)],
+    csv_file: Annotated[UploadFile, File(...)],
+):
+    """
+    Importa uma série de indicador econômico de um arquivo CSV.
+    """
+    update_indicator_from_csv(csv_file, indicator)
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
 
@@ -5,6 +7,7 @@ from backend.core.dependencies import ActiveSimulation, ClientID
 from backend.core.dto.candle import CandleDTO
 from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
 from backend.core.dto.order import OrderDTO
+from backend.core.dto.order_book_depth import OrderBookDepthDTO
 from backend.core.dto.stock_details import StockDetailsDTO
 from backend.core.exceptions.http_exceptions import (
     NotFoundError,
@@ -13,9 +16,11 @@ from backend.core.exceptions.http_exceptions import (
 from backend.features.variable_income.entities.order import (
     LimitOrder,
     MarketOrder,
+    Order,
     OrderAction,
     OrderType,
 )
+from backend.features.variable_income.matching_engine import BatchResult
 
 operation_router = APIRouter(prefix="/api", tags=["Operations"])
 
@@ -31,6 +36,15 @@ class CancelOrderRequest(BaseModel):
     order_id: str
 
 
+class BatchOrderItem(SubmitOrderRequest):
+    ticker: str
+
+
+class BatchOrdersRequest(BaseModel):
+    orders: list[BatchOrderItem] = Field(default_factory=list)
+    cancels: list[str] = Field(default_factory=list)
+
+
 class BuyFixedIncomeRequest(BaseModel):
     quantity: float = Field(..., gt=0)
 
@@ -40,6 +54,25 @@ class SubmitOrderResponse(BaseModel):
     status: str
 
 
+class BatchItemResponse(BaseModel):
+    order_id: str | None
+    status: str | None
+    error: str | None
+
+    @classmethod
+    def from_result(cls, result: BatchResult) -> "BatchItemResponse":
+        return cls(
+            order_id=result.order_id,
+            status=result.status.name if result.status else None,
+            error=result.error,
+        )
+
+
+class BatchOrdersResponse(BaseModel):
+    canceled: list[BatchItemResponse]
+    submitted: list[BatchItemResponse]
+
+
 @operation_router.get(
     "/variable-income",
     response_model=list[CandleDTO],
@@ -85,40 +118,51 @@ def submit_order(
     """
     Submete uma nova ordem para o ativo.
     """
-    size = payload.quantity
-    order_type: str = payload.type.lower()
-    action: str = payload.action.lower()
+    order = _build_order(client_id, asset, payload)
+    simulation.create_order(order)
+    return SubmitOrderResponse(order_id=order.id, status=order.status.name)
 
-    # Valida os parâmetros
-    try:
-        action_enum = OrderAction(action.lower())
-    except ValueError as e:
-        raise UnprocessableEntityError("Ação inválida") from e
-    try:
-        order_type_enum = OrderType(order_type.lower())
-    except ValueError as e:
-        raise UnprocessableEntityError("Tipo de ordem inválido") from e
 
-    if order_type_enum == OrderType.MARKET:
-        order = MarketOrder(
-            client_id=client_id, ticker=asset, size=size, action=action_enum
-        )
-    else:
-        price = payload.limit_price
-        if price is None:
-            raise UnprocessableEntityError(
-                "limit_price é obrigatório para ordem limitada"
-            )
-        order = LimitOrder(
-            client_id=client_id,
-            ticker=asset,
-            size=size,
-            action=action_enum,
-            price=price,
-        )
+@operation_router.post(
+    "/variable-income/orders/batch",
+    response_model=BatchOrdersResponse,
+    summary="Submeter lote de ordens",
+    description="Cancela e submete várias ordens (de vários ativos) em uma única operação. Os cancelamentos rodam antes das submissões, as reservas das ordens LIMIT são validadas em conjunto e cada item retorna seu próprio status ou erro.",
+)
+def submit_order_batch(
+    simulation: ActiveSimulation,
+    client_id: ClientID,
+    payload: BatchOrdersRequest,
+):
+    """
+    Executa um lote de cancelamentos e submissões de ordens.
 
-    simulation.create_order(order)
-    return SubmitOrderResponse(order_id=order.id, status=order.status.name)
+    Não é tudo-ou-nada: um item inválido (ação, tipo ou preço) volta com
+    seu erro e sem order_id, e os demais itens seguem para o lote.
+    """
+    orders: list[Order] = []
+    invalid: dict[int, str] = {}
+    for index, item in enumerate(payload.orders):
+        try:
+            orders.append(_build_order(client_id, item.ticker, item))
+        except UnprocessableEntityError as e:
+            invalid[index] = str(e.detail)
+
+    canceled, results = simulation.execute_order_batch(
+        client_id=client_id, orders=orders, cancel_ids=payload.cancels
+    )
+    # Reintercala os itens inválidos na posição em que foram enviados
+    executed = iter(results)
+    submitted = [
+        BatchItemResponse(order_id=None, status=None, error=invalid[index])
+        if index in invalid
+        else BatchItemResponse.from_result(next(executed))
+        for index in range(len(payload.orders))
+    ]
+    return BatchOrdersResponse(
+        canceled=[BatchItemResponse.from_result(r) for r in canceled],
+        submitted=submitted,
+    )
 
 
 @operation_router.delete(
@@ -157,6 +201,19 @@ def list_order_book(simulation: ActiveSimulation, asset: str):
     return orders
 
 
+@operation_router.get(
+    "/variable-income/{asset}/depth",
+    response_model=OrderBookDepthDTO,
+    summary="Obter profundidade do livro",
+    description="Retorna o snapshot L2 (preço → tamanho agregado) do ativo com o seq atual. Usado para ressincronizar o feed `order_book_depth` ao detectar uma lacuna de seq.",
+)
+def get_order_book_depth(simulation: ActiveSimulation, asset: str):
+    """
+    Retorna o snapshot de profundidade do livro de ordens do ativo.
+    """
+    return simulation.get_order_book_depth(asset)
+
+
 @operation_router.get(
     "/fixed-income",
     response_model=list[FixedIncomeAssetDTO],
@@ -209,3 +266,40 @@ def buy_fixed_income(
     quantity = payload.quantity
 
     simulation.buy_fixed_income(client_id, fixed, quantity)
+
+
+def _build_order(client_id: UUID, ticker: str, payload: SubmitOrderRequest) -> Order:
+    """Monta a ordem de mercado ou limitada descrita no payload."""
+    size = payload.quantity
+    order_type: str = payload.type.lower()
+    action: str = payload.action.lower()
+
+    # Valida os parâmetros
+    try:
+        action_enum = OrderAction(action.lower())
+    except ValueError as e:
+        raise UnprocessableEntityError("Ação inválida") from e
+    try:
+        order_type_enum = OrderType(order_type.lower())
+    except ValueError as e:
+        raise UnprocessableEntityError("Tipo de ordem inválido") from e
+
+    if order_type_enum == OrderType.MARKET:
+        order = MarketOrder(
+            client_id=client_id, ticker=ticker, size=size, action=action_enum
+        )
+    else:
+        price = payload.limit_price
+        if price is None:
+            raise UnprocessableEntityError(
+                "limit_price é obrigatório para ordem limitada"
+            )
+        order = LimitOrder(
+            client_id=client_id,
+            ticker=ticker,
+            size=size,
+            action=action_enum,
+            price=price,
+        )
+
+    return order
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 from backend.core.dependencies import ClientID
 from backend.features.realtime import get_broker, get_sse_broker
 from backend.features.realtime.schemas import RealtimeEventCatalog
+from backend.features.variable_income.depth_feed import send_depth_snapshots
 
 realtime_router = APIRouter(prefix="/api", tags=["Realtime"])
 
@@ -50,6 +51,7 @@ def update_subscription(client_id: ClientID, payload: UpdateSubscriptionRequest)
 
     broker.update_subscription(client_id, events)
     logger.info("Updating subscription: %s -> %s", client_id, events)
+    send_depth_snapshots(client_id, events)
     return UpdateSubscriptionResponse(client_id=client_id, events=events)
 
 
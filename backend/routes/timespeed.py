@@ -1,7 +1,11 @@
+import time
+from datetime import date
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
-from backend.core.dependencies import ActiveSimulation, ClientID
+from backend.core.dependencies import ActiveSimulation, ClientID, HostVerified
+from backend.core.exceptions.http_exceptions import UnprocessableEntityError
 from backend.features.realtime import notify
 from backend.features.realtime.schemas import SpeedUpdateEventDTO
 from backend.features.simulation.simulation_loop import simulation_controller
@@ -23,6 +27,34 @@ class SimulationStateResponse(BaseModel):
     cash: float
 
 
+class LoopStatsResponse(BaseModel):
+    target_tps: int
+    achieved_tps: float
+    ticks: int
+    overruns: int
+    skipped_ticks: int
+
+
+class PhaseTimingResponse(BaseModel):
+    phase: str
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class FastForwardRequest(BaseModel):
+    target_date: date | None = None
+
+
+class FastForwardResponse(BaseModel):
+    current_date: str
+    ticks: int
+    elapsed_seconds: float
+
+
 @timespeed_router.post(
     "/set-speed",
     response_model=SetSpeedResponse,
@@ -64,3 +96,74 @@ def get_simulation_state(client_id: ClientID, simulation: ActiveSimulation):
         speed=speed,
         cash=cash,
     )
+
+
+@timespeed_router.get(
+    "/loop-stats",
+    response_model=LoopStatsResponse,
+    summary="Obter estatísticas do loop da simulação",
+    description="Retorna a taxa de ticks configurada e a efetivamente atingida, além da contagem de overruns e de ticks descartados.",
+)
+def get_loop_stats(simulation: ActiveSimulation):
+    """
+    Retorna as estatísticas do agendador de ticks.
+    """
+    stats = simulation_controller.get_stats()
+    return LoopStatsResponse(
+        target_tps=simulation.get_speed(),
+        achieved_tps=round(stats.achieved_tps, 2),
+        ticks=stats.ticks,
+        overruns=stats.overruns,
+        skipped_ticks=stats.skipped_ticks,
+    )
+
+
+@timespeed_router.get(
+    "/tick-profile",
+    response_model=list[PhaseTimingResponse],
+    summary="Obter tempos por fase do tick",
+    description="Retorna média, p50, p95, p99 e máximo (em ms) de cada fase do tick sobre uma janela deslizante dos últimos ticks.",
+)
+def get_tick_profile(simulation: ActiveSimulation):
+    """
+    Retorna os tempos por fase do tick da simulação.
+    """
+    return [
+        PhaseTimingResponse(
+            phase=t.phase,
+            count=t.count,
+            mean_ms=round(t.mean_ms, 3),
+            p50_ms=round(t.p50_ms, 3),
+            p95_ms=round(t.p95_ms, 3),
+            p99_ms=round(t.p99_ms, 3),
+            max_ms=round(t.max_ms, 3),
+        )
+        for t in simulation.profiler.get_timings()
+    ]
+
+
+@timespeed_router.post(
+    "/fast-forward",
+    response_model=FastForwardResponse,
+    summary="Avançar a simulação em modo headless",
+    description="Executa os ticks em sequência, sem pausas e sem notificações por tick, até a data alvo ou a data final. Apenas o host pode executar.",
+)
+def fast_forward(
+    simulation: ActiveSimulation, payload: FastForwardRequest, _: HostVerified
+):
+    """
+    Avança a simulação até a data alvo na velocidade máxima.
+    """
+    target_date = payload.target_date
+    if target_date is not None and target_date <= simulation.get_current_date():
+        raise UnprocessableEntityError(
+            "A data alvo deve ser posterior à data atual da simulação."
+        )
+
+    started = time.perf_counter()
+    ticks = simulation_controller.fast_forward(target_date)
+    return FastForwardResponse(
+        current_date=simulation.get_current_date_formatted(),
+        ticks=ticks,
+        elapsed_seconds=round(time.perf_counter() - started, 3),
+    )
@@ -0,0 +1,282 @@
+"""
+Simulador Financeiro - Código-fonte principal
+
+Copyright (C) 2025 Murilo Marino
+
+Este programa é software livre: você pode redistribuí-lo e/ou modificá-lo
+sob os termos da Licença Pública Geral GNU publicada pela Free Software Foundation,
+na versão 3 da licença, ou (a seu critério) qualquer versão posterior.
+
+Este programa é distribuído na esperança de que seja útil,
+mas SEM NENHUMA GARANTIA; sem mesmo a garantia implícita de
+COMERCIALIZAÇÃO ou ADEQUAÇÃO A UM DETERMINADO PROPÓSITO.
+Consulte a Licença Pública Geral GNU para mais detalhes.
+
+Você deve ter recebido uma cópia da Licença Pública Geral GNU
+junto com este programa. Caso não, veja <https://www.gnu.org/licenses/>.
+"""
+
+from backend import config
+from backend.core.logger import setup_logging
+
+setup_logging(
+    level=config.toml.logging.logging_level,
+    logs_path=config.toml.logging.logs_path,
+)
+# flake8: noqa: E402 - Setup de logging deve ser o primeiro para capturar logs de importação
+
+import argparse
+import json
+import logging
+import time
+from datetime import date
+
+import numpy as np
+from fastapi import HTTPException
+
+from backend.core import repository
+from backend.core.runtime.persistence_writer import PersistenceWriter
+from backend.features.backtest.backtester import Backtester
+from backend.features.backtest.sweep import (
+    SweepConfig,
+    monte_carlo_configs,
+    param_grid,
+    run_sweep,
+)
+from backend.features.realtime import muted
+from backend.features.simulation.simulation_loader import SimulationLoader
+from backend.features.strategy.registry import STRATEGIES, get_strategy
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------
+# Comandos
+# ---------------------------------------------------------------------
+
+
+def fast_forward(args: argparse.Namespace) -> None:
+    """Retoma uma simulação salva e a avança em modo headless."""
+    summary = (
+        repository.simulation.get_simulation(args.simulation_id)
+        if args.simulation_id is not None
+        else repository.simulation.get_last_simulated()
+    )
+    if summary is None:
+        raise SystemExit("Nenhuma simulação encontrada.")
+
+    started = time.perf_counter()
+    try:
+        # Sem servidor realtime: nenhuma notificação deve ser emitida
+        with muted():
+            simulation = SimulationLoader.resume(summary)
+            ticks = simulation.fast_forward(args.until)
+    except HTTPException as e:
+        raise SystemExit(e.detail) from e
+    finally:
+        # Garante que os lotes pendentes cheguem ao banco antes de sair
+        PersistenceWriter.stop()
+
+    logger.info(
+        f"Simulação '{summary.name}' avançada até "
+        f"{simulation.get_current_date_formatted()}: {ticks} ticks em "
+        f"{time.perf_counter() - started:.2f}s"
+    )
+
+
+def backtest(args: argparse.Namespace) -> None:
+    """Executa uma estratégia offline sobre o histórico de preços."""
+    try:
+        strategy_cls = get_strategy(args.strategy)
+        result = Backtester.load(args.end).run(
+            strategy_cls,
+            start_date=args.start,
+            end_date=args.end,
+            starting_cash=args.cash,
+            tickers=args.tickers.split(",") if args.tickers else None,
+            params=args.params,
+        )
+    except HTTPException as e:
+        raise SystemExit(e.detail) from e
+
+    logger.info(
+        f"Backtest {result.strategy} em {len(result.tickers)} tickers: "
+        f"{result.ticks} dias em {result.elapsed:.2f}s, {len(result.trades)} trades, "
+        f"patrimônio final R$ {result.final_equity:.2f} "
+        f"({result.total_return:+.2%}, drawdown máximo {result.max_drawdown:.2%})"
+    )
+    if args.equity_csv:
+        result.equity_curve.rename("equity").to_csv(args.equity_csv)
+
+
+def sweep(args: argparse.Namespace) -> None:
+    """Varre combinações de parâmetros da estratégia e da liquidez em paralelo."""
+    if args.samples is not None:
+        if args.grid or args.liquidity_grid:
+            raise SystemExit("Use --grid/--liquidity-grid ou --samples, não ambos.")
+        configs = monte_carlo_configs(
+            np.random.default_rng(args.seed),
+            args.samples,
+            params=args.ranges or {},
+            liquidity=args.liquidity_ranges or {},
+        )
+    else:
+        configs = [
+            SweepConfig(params=params, liquidity=liquidity)
+            for params in param_grid(**(args.grid or {}))
+            for liquidity in param_grid(**(args.liquidity_grid or {}))
+        ]
+    started = time.perf_counter()
+    try:
+        results = run_sweep(
+            repository.stock.get_price_history_frame(args.end),
+            configs,
+            strategy=args.strategy,
+            start_date=args.start,
+            end_date=args.end,
+            starting_cash=args.cash,
+            tickers=args.tickers.split(",") if args.tickers else None,
+            max_workers=args.workers,
+        )
+    except HTTPException as e:
+        raise SystemExit(e.detail) from e
+
+    logger.info(
+        f"Varredura {args.strategy}: {len(configs)} configurações em "
+        f"{time.perf_counter() - started:.2f}s\n"
+        f"{results.sort_values('final_equity', ascending=False).to_string()}"
+    )
+    if args.output:
+        results.to_csv(args.output, index=False)
+
+
+# ---------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Ferramentas de linha de comando do Simulador Financeiro.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    fast_forward_parser = commands.add_parser(
+        "fast-forward",
+        help="Avança uma simulação salva até a data alvo, sem servidor e sem pausas.",
+    )
+    fast_forward_parser.add_argument(
+        "--simulation-id",
+        type=int,
+        help="Id da simulação (padrão: a última jogada).",
+    )
+    fast_forward_parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        help="Data alvo no formato AAAA-MM-DD (padrão: a data final).",
+    )
+    fast_forward_parser.set_defaults(handler=fast_forward)
+
+    backtest_parser = commands.add_parser(
+        "backtest",
+        help="Executa uma estratégia offline sobre o histórico, sem banco de simulação.",
+    )
+    backtest_parser.add_argument(
+        "--strategy", required=True, choices=list(STRATEGIES), help="Estratégia."
+    )
+    backtest_parser.add_argument(
+        "--start",
+        type=date.fromisoformat,
+        required=True,
+        help="Data inicial no formato AAAA-MM-DD.",
+    )
+    backtest_parser.add_argument(
+        "--end",
+        type=date.fromisoformat,
+        required=True,
+        help="Data final no formato AAAA-MM-DD.",
+    )
+    backtest_parser.add_argument(
+        "--cash", type=float, default=10_000, help="Caixa inicial (padrão: 10000)."
+    )
+    backtest_parser.add_argument(
+        "--tickers", help="Tickers separados por vírgula (padrão: todos)."
+    )
+    backtest_parser.add_argument(
+        "--params",
+        type=json.loads,
+        help="Parâmetros da estratégia em JSON, ex.: '{\"fast\": 5}'.",
+    )
+    backtest_parser.add_argument(
+        "--equity-csv", help="Arquivo CSV para gravar a curva de patrimônio."
+    )
+    backtest_parser.set_defaults(handler=backtest)
+
+    sweep_parser = commands.add_parser(
+        "sweep",
+        help="Executa o backtest para cada combinação de parâmetros, em paralelo.",
+    )
+    sweep_parser.add_argument(
+        "--strategy", required=True, choices=list(STRATEGIES), help="Estratégia."
+    )
+    sweep_parser.add_argument(
+        "--start",
+        type=date.fromisoformat,
+        required=True,
+        help="Data inicial no formato AAAA-MM-DD.",
+    )
+    sweep_parser.add_argument(
+        "--end",
+        type=date.fromisoformat,
+        required=True,
+        help="Data final no formato AAAA-MM-DD.",
+    )
+    sweep_parser.add_argument(
+        "--cash", type=float, default=10_000, help="Caixa inicial (padrão: 10000)."
+    )
+    sweep_parser.add_argument(
+        "--tickers", help="Tickers separados por vírgula (padrão: todos)."
+    )
+    sweep_parser.add_argument(
+        "--grid",
+        type=json.loads,
+        help="Valores por parâmetro da estratégia, ex.: '{\"fast\": [5, 10]}'.",
+    )
+    sweep_parser.add_argument(
+        "--liquidity-grid",
+        type=json.loads,
+        help="Valores por parâmetro da liquidez, ex.: '{\"alpha\": [2, 4]}'.",
+    )
+    sweep_parser.add_argument(
+        "--samples",
+        type=int,
+        help="Sorteia N configurações (Monte Carlo) em vez de varrer a grade.",
+    )
+    sweep_parser.add_argument(
+        "--ranges",
+        type=json.loads,
+        help="Intervalo [min, max] por parâmetro da estratégia, ex.: "
+        "'{\"fast\": [3, 10]}' (limites inteiros sorteiam inteiros).",
+    )
+    sweep_parser.add_argument(
+        "--liquidity-ranges",
+        type=json.loads,
+        help="Intervalo [min, max] por parâmetro da liquidez, ex.: "
+        "'{\"alpha\": [1.5, 5.0]}'.",
+    )
+    sweep_parser.add_argument(
+        "--seed", type=int, help="Semente do sorteio de --samples."
+    )
+    sweep_parser.add_argument(
+        "--workers", type=int, help="Processos em paralelo (padrão: núcleos da CPU)."
+    )
+    sweep_parser.add_argument("--output", help="Arquivo CSV para gravar os resultados.")
+    sweep_parser.set_defaults(handler=sweep)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
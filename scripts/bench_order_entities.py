@@ -0,0 +1,111 @@
+"""
+Microbenchmark do layout das ordens em memória.
+
+Compara o layout antigo (dataclass com `__dict__`, id `uuid4()` em string e
+`datetime` com fuso) com o atual (slots, `seq` inteiro e timestamp float),
+medindo alocações, memória e tempo para N ordens LIMIT em repouso no book.
+
+Uso:
+    python -X utf8 -m scripts.bench_order_entities [N]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from backend.features.variable_income.entities.order import (
+    LimitOrder,
+    OrderAction,
+    OrderStatus,
+)
+from backend.features.variable_income.order_book import OrderBook
+
+
+@dataclass(kw_only=True)
+class LegacyLimitOrder:
+    """Layout anterior de LimitOrder, reproduzido apenas para comparação."""
+
+    client_id: uuid.UUID
+    ticker: str
+    size: int
+    action: OrderAction
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    remaining: int = field(init=False)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    status: OrderStatus = OrderStatus.PENDING
+    price: float
+
+    def __post_init__(self):
+        self.remaining = self.size
+
+
+def _measure(label: str, build: Callable[[], object]) -> None:
+    # Tempo medido sem tracemalloc, que distorce o custo de cada alocação
+    gc.collect()
+    started = time.perf_counter()
+    keep = build()
+    elapsed = time.perf_counter() - started
+    del keep
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    keep = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del keep
+
+    print(
+        f"{label:<32} {blocks:>10,} blocos  {current / 2**20:>8.2f} MiB  "
+        f"{elapsed * 1000:>8.1f} ms"
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    client_id = uuid.uuid4()
+
+    def legacy_orders():
+        return [
+            LegacyLimitOrder(
+                client_id=client_id,
+                ticker="TEST",
+                size=100,
+                action=OrderAction.BUY,
+                price=10.0 + (i % 50) * 0.01,
+            )
+            for i in range(n)
+        ]
+
+    def slotted_orders():
+        return [
+            LimitOrder(
+                client_id=client_id,
+                ticker="TEST",
+                size=100,
+                action=OrderAction.BUY,
+                price=10.0 + (i % 50) * 0.01,
+            )
+            for i in range(n)
+        ]
+
+    def slotted_book():
+        book = OrderBook()
+        for order in slotted_orders():
+            book.add(order)
+        return book
+
+    print(f"{n:,} ordens LIMIT em repouso")
+    _measure("legado (dict, uuid4, datetime)", legacy_orders)
+    _measure("slots (seq, timestamp)", slotted_orders)
+    _measure("slots + OrderBook", slotted_book)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.core.enum import EquityEventType
+from backend.core.exceptions.http_exceptions import UnprocessableEntityError
+from backend.features.backtest import sweep
+from backend.features.backtest.backtester import Backtester
+from backend.features.backtest.sweep import (
+    SweepConfig,
+    monte_carlo_configs,
+    param_grid,
+)
+from backend.features.strategy.sma_cross import SmaCrossStrategy
+
+# Alta, queda e nova alta: dois cruzamentos para cima e um para baixo
+CLOSES = [10, 10, 10, 10, 11, 12, 13, 14, 13, 12, 11, 10, 9, 10, 11, 12, 13, 14]
+
+
+def _frame() -> pd.DataFrame:
+    start = date(2024, 1, 1)
+    return pd.DataFrame(
+        [
+            {
+                "stock_id": 1,
+                "ticker": "ABCD",
+                "name": "Abcd",
+                "price_date": start + timedelta(days=i),
+                "open": close,
+                "high": close * 1.01,
+                "low": close * 0.99,
+                "close": close,
+                "volume": 100_000,
+            }
+            for i, close in enumerate(CLOSES)
+        ]
+    )
+
+
+def test_sma_cross_replays_trades_and_equity():
+    result = Backtester.from_frame(_frame()).run(
+        SmaCrossStrategy,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        starting_cash=10_000,
+        params={"fast": 2, "slow": 4, "lot": 10},
+    )
+
+    assert result.ticks == len(CLOSES)
+    assert [t.action for t in result.trades] == [
+        EquityEventType.BUY,
+        EquityEventType.SELL,
+        EquityEventType.BUY,
+    ]
+    assert all(t.quantity == 10 for t in result.trades)
+
+    # Patrimônio do último dia = caixa + posição marcada no fechamento
+    cash = 10_000 + sum(
+        (t.price if t.action == EquityEventType.SELL else -t.price) * t.quantity
+        for t in result.trades
+    )
+    assert result.final_equity == pytest.approx(cash + 10 * CLOSES[-1])
+    assert result.equity_curve.iloc[0] == 10_000
+    assert 0 < result.max_drawdown < 1
+
+
+def test_invalid_params_are_rejected():
+    with pytest.raises(UnprocessableEntityError):
+        Backtester.from_frame(_frame()).run(
+            SmaCrossStrategy,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            starting_cash=10_000,
+            params={"fast": 5, "slow": 3},
+        )
+
+
+def test_sweep_worker_replays_from_memmap(tmp_path):
+    configs = [
+        SweepConfig(params=params)
+        for params in param_grid(fast=[2, 3], slow=[4], lot=[10])
+    ]
+    assert [c.params["fast"] for c in configs] == [2, 3]
+
+    # Mesmo caminho dos workers do pool, sem subir processos
+    Backtester.from_frame(_frame()).save(tmp_path)
+    sweep._init_worker(str(tmp_path))
+    worker = sweep._worker_backtester
+    assert worker is not None
+    assert isinstance(worker._prices, np.memmap)  # mapeado, não copiado
+    args = ("sma-cross", date(2024, 1, 1), date(2024, 12, 31), 10_000, None)
+    row = sweep._run_config(configs[0], args)
+
+    direct = Backtester.from_frame(_frame()).run(
+        SmaCrossStrategy,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        starting_cash=10_000,
+        params=configs[0].params,
+    )
+    assert row["fast"] == 2
+    assert row["trades"] == len(direct.trades)
+    assert row["final_equity"] == pytest.approx(direct.final_equity)
+
+
+def test_monte_carlo_configs_sample_within_ranges():
+    configs = monte_carlo_configs(
+        np.random.default_rng(7),
+        50,
+        params={"fast": [2, 3], "slow": [4, 6]},
+        liquidity={"alpha": [1.5, 5.0]},
+    )
+    again = monte_carlo_configs(
+        np.random.default_rng(7),
+        50,
+        params={"fast": [2, 3], "slow": [4, 6]},
+        liquidity={"alpha": [1.5, 5.0]},
+    )
+
+    assert configs == again  # reprodutível pela semente
+    assert {c.params["fast"] for c in configs} == {2, 3}  # inteiros, limites inclusos
+    assert all(isinstance(c.params["slow"], int) for c in configs)
+    assert all(1.5 <= c.liquidity["alpha"] < 5.0 for c in configs)
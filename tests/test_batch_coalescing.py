@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from typing import cast
+
+import pytest
+
+import backend.features.realtime as realtime
+from backend.core.dto.events.equity import EquityEventDTO
+from backend.core.enum import EquityEventType
+from backend.core.runtime.event_manager import EventManager
+
+
+class RecordingBroker:
+    def __init__(self):
+        self.sent: list[tuple] = []
+
+    def notify(self, event, payload, to):
+        self.sent.append((event, payload, to))
+
+
+def _equity(quantity: int, price: str = "10") -> EquityEventDTO:
+    return EquityEventDTO(
+        simulation_id=1,
+        user_id=1,
+        event_date=date(2024, 1, 2),
+        ticker="ABCD",
+        event_type=EquityEventType.BUY,
+        quantity=quantity,
+        price=Decimal(price),
+    )
+
+
+def test_deferred_keeps_only_latest_state_per_client(monkeypatch: pytest.MonkeyPatch):
+    broker = RecordingBroker()
+    monkeypatch.setattr(realtime, "get_broker", lambda: broker)
+    a, b = uuid.uuid4(), uuid.uuid4()
+
+    with realtime.deferred():
+        realtime.notify("cash_update", {"cash": 1}, to=a)
+        realtime.notify("order_executed", {"id": 1}, to=a)
+        realtime.notify("cash_update", {"cash": 2}, to=b)
+        realtime.notify("cash_update", {"cash": 3}, to=a)
+        realtime.notify("order_executed", {"id": 2}, to=a)
+        assert broker.sent == []
+
+    assert broker.sent == [
+        ("order_executed", {"id": 1}, a),
+        ("cash_update", {"cash": 2}, b),
+        ("cash_update", {"cash": 3}, a),
+        ("order_executed", {"id": 2}, a),
+    ]
+
+
+def test_batched_merges_equity_fills(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(EventManager, "_events", [])
+
+    with EventManager.batched():
+        EventManager.push_event(_equity(5))
+        EventManager.push_event(_equity(3, price="11"))
+        EventManager.push_event(_equity(2))
+
+    events = cast(list[EquityEventDTO], EventManager._events)
+    assert [(e.quantity, e.price) for e in events] == [
+        (5 + 2, Decimal("10")),
+        (3, Decimal("11")),
+    ]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import date
+
+from backend.features.variable_income.entities.candle import Candle
+from backend.features.variable_income.liquidity.beta_distribution import (
+    BetaLiquidityDistribution,
+)
+
+
+def _candle(ticker: str, low: float, high: float, volume: int) -> Candle:
+    return Candle(
+        ticker=ticker,
+        price_date=date(2024, 1, 2),
+        open=low,
+        high=high,
+        low=low,
+        close=high,
+        volume=volume,
+    )
+
+
+def test_levels_preserve_volume_and_range():
+    candle = _candle("ABCD", 10.0, 12.5, 1_000_003)
+
+    levels = BetaLiquidityDistribution().generate(candle)
+
+    assert sum(level.volume for level in levels) == candle.volume
+    assert all(candle.low <= level.price <= candle.high for level in levels)
+    # Densidade centrípeta: o maior volume fica no meio da faixa
+    peak = max(levels, key=lambda level: level.volume)
+    assert 11.0 < peak.price < 11.5
+
+
+def test_batch_matches_single_generation():
+    distribution = BetaLiquidityDistribution()
+    candles = [
+        _candle("AAAA", 10.0, 12.0, 5_000),
+        _candle("BBBB", 5.0, 5.0, 100),  # sem amplitude
+        _candle("CCCC", 1.0, 1.5, 0),  # sem volume
+        _candle("DDDD", 50.0, 53.0, 77_777),
+    ]
+
+    batch = distribution.generate_batch(candles)
+
+    assert batch == [distribution.generate(c) for c in candles]
+    assert batch[1] == [] and batch[2] == []
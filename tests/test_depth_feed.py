@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from backend.core.dto.order_book_depth import DepthLevelDTO
+from backend.features.variable_income.depth_feed import DepthFeed
+
+
+def _levels(*pairs: tuple[float, int]) -> list[DepthLevelDTO]:
+    return [DepthLevelDTO(price=price, size=size) for price, size in pairs]
+
+
+def test_diff_only_carries_changed_levels():
+    feed = DepthFeed()
+
+    first = feed.diff("ABCD", [(10.0, 100), (9.9, 50)], [(10.1, 70)])
+    assert first is not None
+    assert first.seq == 1
+    assert first.bids == _levels((10.0, 100), (9.9, 50))
+
+    assert feed.diff("ABCD", [(10.0, 100), (9.9, 50)], [(10.1, 70)]) is None
+
+    second = feed.diff("ABCD", [(10.0, 40)], [(10.1, 70), (10.2, 5)])
+    assert second is not None
+    assert second.seq == 2
+    # Nível removido é enviado com tamanho zero
+    assert second.bids == _levels((10.0, 40), (9.9, 0))
+    assert second.asks == _levels((10.2, 5))
+
+
+def test_snapshot_matches_last_published_seq():
+    feed = DepthFeed()
+    assert feed.snapshot("ABCD").seq == 0
+
+    feed.diff("ABCD", [(10.0, 100)], [(10.1, 70)])
+    feed.diff("ABCD", [(10.0, 90)], [(10.1, 70)])
+
+    snapshot = feed.snapshot("ABCD")
+    assert snapshot.type == "snapshot"
+    assert snapshot.seq == 2
+    assert snapshot.bids == _levels((10.0, 90))
+    assert snapshot.asks == _levels((10.1, 70))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from backend.core.enum import RateIndexType
+from backend.features.economic.cumulative_factors import (
+    CumulativeFactors,
+    business_day_number,
+)
+from backend.features.economic.economic_indicators import EconomicIndicators
+from backend.features.economic.indicator_series import IndicatorSeries
+
+
+def _series(points: list[tuple[str, float]], fallback: float) -> IndicatorSeries:
+    return IndicatorSeries(
+        np.array([d for d, _ in points], dtype="datetime64[D]"),
+        np.array([rate for _, rate in points]),
+        fallback,
+    )
+
+
+def test_series_is_a_step_function_of_the_date():
+    # Fora de ordem de propósito
+    selic = _series([("2024-03-01", 0.10), ("2024-01-01", 0.12)], fallback=0.5)
+
+    assert selic.rate_at(date(2023, 6, 1)) == 0.12  # antes da primeira
+    assert selic.rate_at(date(2024, 1, 1)) == 0.12
+    assert selic.rate_at(date(2024, 2, 29)) == 0.12
+    assert selic.rate_at(date(2024, 3, 1)) == 0.10
+    assert selic.rate_at(date(2030, 1, 1)) == 0.10  # depois da última
+    assert selic.rates_at(
+        np.array(["2023-06-01", "2024-02-29", "2024-03-01"], dtype="datetime64[D]")
+    ) == pytest.approx([0.12, 0.12, 0.10])
+    assert IndicatorSeries.constant(0.5).rate_at(date(2024, 1, 1)) == 0.5
+
+
+def test_factors_compound_each_business_day_at_its_rate():
+    indicators = EconomicIndicators(
+        ipca=IndicatorSeries.constant(0.04),
+        selic=_series([("2024-01-01", 0.12), ("2024-01-08", 0.10)], fallback=0.5),
+    )
+    indicators.precompute(date(2024, 1, 1), date(2024, 1, 31))
+    assert indicators.get_cdi_rate(date(2024, 1, 8)) == pytest.approx(0.099)
+
+    # De 2024-01-03 (qua) a 2024-01-10 (qua): 04 e 05 a 12%, 08 a 10 a 10%
+    factors = indicators.factors(RateIndexType.SELIC)
+    growth = factors.log_factor(
+        business_day_number(date(2024, 1, 10))
+    ) - factors.log_factor(business_day_number(date(2024, 1, 3)))
+    expected = 1.12 ** (2 / 252) * 1.10 ** (3 / 252)
+    assert np.exp(growth) == pytest.approx(expected)
+
+
+def test_vector_lookup_rejects_days_outside_the_table():
+    factors = CumulativeFactors(IndicatorSeries.constant(0.10))
+    origin = business_day_number(date(2024, 1, 10))
+    factors.extend(origin)  # Primeira extensão fixa a origem
+    factors.extend(origin + 5)
+
+    days = np.array([origin, origin + 5])
+    assert factors.log_factors(days) == pytest.approx(
+        [factors.log_factor(origin), factors.log_factor(origin + 5)]
+    )
+    with pytest.raises(ValueError):
+        factors.log_factor(origin - 1)
+    with pytest.raises(ValueError):
+        factors.log_factors(np.array([origin - 1, origin]))
+    with pytest.raises(ValueError):
+        factors.log_factors(np.array([origin + 6]))
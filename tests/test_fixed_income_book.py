@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from backend.core.dto.fixed_income_asset import FixedIncomeAssetDTO
+from backend.core.enum import FixedIncomeType, RateIndexType
+from backend.features.economic.economic_indicators import EconomicIndicators
+from backend.features.economic.indicator_series import IndicatorSeries
+from backend.features.fixed_income.entities.fixed_income_position import (
+    FixedIncomePosition,
+)
+from backend.features.fixed_income.fixed_income_book import FixedIncomeBook
+
+START = date(2024, 1, 1)
+
+
+def _asset(rate_index: RateIndexType, maturity_days: int) -> FixedIncomeAssetDTO:
+    return FixedIncomeAssetDTO(
+        name=f"CDB {rate_index.value}",
+        issuer="Banco",
+        investment_type=FixedIncomeType.CDB,
+        rate_index=rate_index,
+        maturity_date=START + timedelta(days=maturity_days),
+        interest_rate=0.12,
+    )
+
+
+def test_closed_form_accrual_matches_daily_compounding():
+    indicators = EconomicIndicators(
+        ipca=IndicatorSeries.constant(0.04), selic=IndicatorSeries.constant(0.15)
+    )
+    book = FixedIncomeBook(indicators, capacity=1)  # força o crescimento dos arrays
+    cdi = FixedIncomePosition(
+        book, _asset(RateIndexType.CDI, 30), 1000.0, START, as_of=START
+    )
+    pre = FixedIncomePosition(
+        book, _asset(RateIndexType.PREFIXADO, 7), 500.0, START, as_of=START
+    )
+    pre.invest(100.0)
+
+    # 2024-01-08 (segunda): cinco dias úteis depois, vencimento do prefixado
+    expired = book.advance(START + timedelta(days=7))
+
+    cdi_daily = (1 + indicators.get_cdi_rate(START)) ** (1 / 252) - 1
+    assert cdi.current_value == pytest.approx(1000.0 * (1 + cdi_daily) ** 5)
+    assert pre.current_value == pytest.approx(600.0 * 1.12 ** (5 / 252))
+    assert pre.total_applied == 600.0
+    assert expired == [pre.slot]
+    assert book.current_values([cdi.slot, pre.slot]) == pytest.approx(
+        [cdi.current_value, pre.current_value]
+    )
+
+    # Aporte reancora a posição: o capital novo só rende a partir de hoje
+    cdi.invest(1000.0)
+    before = cdi.current_value
+    book.advance(START + timedelta(days=8))
+    assert cdi.current_value == pytest.approx(before * (1 + cdi_daily))
+
+    # Fechada, a posição congela os valores e o slot volta a ser usado
+    value = pre.current_value
+    pre.close()
+    book.advance(START + timedelta(days=9))
+    assert pre.current_value == value
+    today = START + timedelta(days=9)
+    reused = FixedIncomePosition(
+        book, _asset(RateIndexType.SELIC, 30), 10.0, today, as_of=today
+    )
+    assert reused.slot == pre.slot
+    assert reused.current_value == 10.0
+
+
+def test_maturity_heap_skips_closed_and_reused_slots():
+    indicators = EconomicIndicators(
+        ipca=IndicatorSeries.constant(0.04), selic=IndicatorSeries.constant(0.15)
+    )
+    book = FixedIncomeBook(indicators)
+    early = book.open(_asset(RateIndexType.CDI, 7), 100.0, START)
+    late = book.open(_asset(RateIndexType.CDI, 30), 100.0, START)
+
+    # Slot fechado e reaproveitado por um ativo com outro vencimento
+    book.close(early)
+    reused = book.open(_asset(RateIndexType.PREFIXADO, 20), 100.0, START)
+    assert reused == early
+
+    assert book.advance(START + timedelta(days=7)) == []
+    assert book.advance(START + timedelta(days=25)) == [reused]
+    assert book.advance(START + timedelta(days=26)) == []
+    assert book.advance(START + timedelta(days=40)) == [late]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from backend.features.strategy.indicators import Indicators, sma, true_range
+from backend.features.variable_income.entities.candle import Candle
+from backend.features.variable_income.market_data import MarketData
+
+CLOSES = [10.0, 10.5, 10.2, 10.8, 11.3, 11.0, 10.6, 11.4, 11.9, 11.7, 12.2, 12.0]
+
+
+def _candle(i: int, close: float) -> Candle:
+    return Candle(
+        ticker="ABCD",
+        price_date=date(2024, 1, 1) + timedelta(days=i),
+        open=close - 0.1,
+        high=close + 0.3,
+        low=close - 0.4,
+        close=close,
+        volume=100 + i,
+    )
+
+
+def test_ring_buffer_wraps_into_zero_copy_views():
+    data = MarketData(maxlen=5)
+    for i, close in enumerate(CLOSES[:7]):
+        data.add_candle(_candle(i, close))
+
+    window = data.get_window("ABCD")
+    assert window is not None
+    assert window.count == 7
+    assert window.close.tolist() == CLOSES[2:7]
+    assert window.dates[-1] == np.datetime64("2024-01-07")
+    assert not window.close.flags.writeable
+    assert not window.close.flags.owndata
+
+    recent = data.get_recent("ABCD")
+    assert [c.close for c in recent] == CLOSES[2:7]
+    assert recent[-1] == data.get_last("ABCD")
+
+
+def test_incremental_indicators_match_fresh_seed():
+    data = MarketData(maxlen=50)
+    incremental = Indicators(data)
+
+    for i, close in enumerate(CLOSES):
+        data.add_candle(_candle(i, close))
+        # Consulta a cada candle para exercitar o caminho O(1)
+        incremental.ema("ABCD", 3)
+        incremental.rsi("ABCD", 3)
+        incremental.atr("ABCD", 3)
+
+    fresh = Indicators(data)
+    for name in ("ema", "rsi", "atr"):
+        assert getattr(incremental, name)("ABCD", 3) == pytest.approx(
+            getattr(fresh, name)("ABCD", 3)
+        )
+
+    window = data.get_window("ABCD")
+    assert window is not None
+    assert incremental.sma("ABCD", 4) == pytest.approx(sma(window.close, 4)[-1])
+    assert fresh.atr("ABCD", 11) == pytest.approx(
+        true_range(window.high, window.low, window.close).mean()
+    )
+    assert incremental.rsi("ABCD", 30) is None
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import threading
+
+from backend.core.utils.keyed_lock import KeyedLock
+
+
+def test_same_key_shares_a_reentrant_lock():
+    locks = KeyedLock[str]()
+
+    assert locks("ABCD") is locks("ABCD")
+    assert locks("ABCD") is not locks("EFGH")
+
+    with locks("ABCD"), locks("ABCD"):
+        pass
+
+
+def test_acquire_many_blocks_other_threads_until_released():
+    locks = KeyedLock[str]()
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        # Ordem invertida e repetida: acquire_many normaliza
+        with locks.acquire_many(["B", "A", "B"]):
+            acquired.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    acquired.wait()
+
+    assert not locks("A").acquire(blocking=False)
+    assert not locks("B").acquire(blocking=False)
+    assert locks("C").acquire(blocking=False)
+    locks("C").release()
+
+    release.set()
+    thread.join()
+    assert locks("A").acquire(blocking=False)
+    locks("A").release()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from typing import cast
+
+import pytest
+
+import backend.features.variable_income.matching_engine as me
+from backend.core.enum import LiquidityMode
+from backend.core.runtime import user_manager
+from backend.features.variable_income.broker import Broker
+from backend.features.variable_income.entities.candle import Candle
+from backend.features.variable_income.entities.order import (
+    LimitOrder,
+    MarketOrder,
+    OrderAction,
+    OrderStatus,
+)
+from backend.features.variable_income.market_liquidity import MarketLiquidity
+from backend.features.variable_income.matching_engine import MatchingEngine
+
+
+class FakeBroker(Broker):
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    def reserve_limit_order(self, order: LimitOrder) -> None:
+        pass
+
+    def execute_trade(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def _calls(engine: MatchingEngine) -> list[dict]:
+    return cast(FakeBroker, engine.broker).calls
+
+
+@pytest.fixture(autouse=True)
+def disable_side_effects(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(me, "notify", lambda **_: None)
+    monkeypatch.setattr(me, "has_subscribers", lambda _: False)
+    monkeypatch.setattr(user_manager.UserManager, "get_user", lambda _: None)
+
+
+@pytest.fixture
+def engine() -> MatchingEngine:
+    engine = MatchingEngine(FakeBroker())
+    engine.market_liquidity = MarketLiquidity(
+        order_book=engine.order_book, mode=LiquidityMode.VIRTUAL
+    )
+    return engine
+
+
+def _tick(engine: MatchingEngine, *, low: float, high: float, volume: int):
+    engine.market_data.add_candle(
+        Candle(
+            ticker="ABCD",
+            price_date=date(2024, 1, 2),
+            open=low,
+            high=high,
+            low=low,
+            close=(low + high) / 2,
+            volume=volume,
+        )
+    )
+    engine.on_tick("ABCD")
+
+
+def _limit(*, price: float, size: int, action: OrderAction) -> LimitOrder:
+    return LimitOrder(
+        client_id=uuid.uuid4(),
+        ticker="ABCD",
+        price=price,
+        size=size,
+        action=action,
+    )
+
+
+def test_virtual_liquidity_stays_out_of_the_order_book(engine: MatchingEngine):
+    _tick(engine, low=10.0, high=12.0, volume=10_000)
+
+    assert engine.order_book.get_orders("ABCD") == []
+    bids, asks = engine.get_depth("ABCD")
+    assert sum(size for _, size in bids + asks) <= 10_000
+    assert bids[0][0] < asks[0][0]
+
+    # Materialização sob demanda usa IDs estáveis para o mesmo candle
+    first = [o.id for o in engine.get_orders("ABCD")]
+    assert first == [o.id for o in engine.get_orders("ABCD")]
+
+
+def test_market_order_consumes_curve_levels(engine: MatchingEngine):
+    _tick(engine, low=10.0, high=12.0, volume=10_000)
+    best_ask, best_size = engine.get_depth("ABCD")[1][0]
+
+    order = MarketOrder(
+        client_id=uuid.uuid4(),
+        ticker="ABCD",
+        size=best_size + 1,
+        action=OrderAction.BUY,
+    )
+    engine.submit(order)
+
+    assert order.status == OrderStatus.EXECUTED
+    prices = [call["price"] for call in _calls(engine)]
+    assert prices[0] == best_ask and prices[-1] > best_ask
+    assert engine.get_depth("ABCD")[1][0][0] > best_ask
+
+
+def test_older_real_order_wins_price_tie(engine: MatchingEngine):
+    _tick(engine, low=10.0, high=12.0, volume=10_000)
+    best_ask = engine.get_depth("ABCD")[1][0][0]
+
+    # Ordem criada antes da curva do próximo candle (mesmo candle, mesmo preço)
+    real = _limit(price=best_ask, size=5, action=OrderAction.SELL)
+    _tick(engine, low=10.0, high=12.0, volume=10_000)
+    engine.submit(real)
+    curve = engine.market_liquidity.get_curve("ABCD")
+    assert curve is not None and real.seq < curve.seq
+
+    buy = _limit(price=best_ask, size=5, action=OrderAction.BUY)
+    engine.submit(buy)
+
+    assert _calls(engine)[-1]["maker_order"] is real
+    assert real.status == OrderStatus.EXECUTED
+
+
+def test_refresh_crosses_resting_real_orders(engine: MatchingEngine):
+    _tick(engine, low=10.0, high=12.0, volume=10_000)
+    # Compra real acima de toda a faixa do próximo candle
+    resting = _limit(price=30.0, size=50, action=OrderAction.BUY)
+    engine.order_book.add(resting)
+
+    _tick(engine, low=20.0, high=22.0, volume=10_000)
+
+    assert resting.status == OrderStatus.EXECUTED
+    assert engine.order_book.find(resting.id) is None
+    call = _calls(engine)[-1]
+    assert call["maker_order"] is resting
+    assert call["price"] == 30.0
+
+
+def test_liquidity_is_rebuilt_only_on_demand(
+    engine: MatchingEngine, monkeypatch: pytest.MonkeyPatch
+):
+    _tick(engine, low=10.0, high=12.0, volume=10_000)
+    assert engine.market_liquidity.get_curve("ABCD") is None
+
+    # Consulta ao book reconstrói a partir do último candle
+    assert engine.get_depth("ABCD")[0][0][0] < 12.0
+    first = engine.market_liquidity.get_curve("ABCD")
+
+    _tick(engine, low=20.0, high=22.0, volume=10_000)
+    assert engine.market_liquidity.get_curve("ABCD") is first
+
+    # Cliente inscrito no book do ticker mantém a liquidez em dia a cada tick
+    monkeypatch.setattr(me, "has_subscribers", lambda _: True)
+    _tick(engine, low=30.0, high=32.0, volume=10_000)
+    curve = engine.market_liquidity.get_curve("ABCD")
+    assert curve is not first
+    assert curve is not None
+    best_ask = curve.best_price(OrderAction.SELL)
+    assert best_ask is not None and best_ask > 30.0
+
+
+def test_candle_arriving_during_a_refresh_stays_stale(
+    engine: MatchingEngine, monkeypatch: pytest.MonkeyPatch
+):
+    _tick(engine, low=10.0, high=12.0, volume=10_000)
+    generate_levels = engine.market_liquidity.generate_levels
+
+    def generate_then_tick(candles):
+        levels = generate_levels(candles)
+        monkeypatch.setattr(engine.market_liquidity, "generate_levels", generate_levels)
+        _tick(engine, low=20.0, high=22.0, volume=10_000)  # Candle novo no meio
+        return levels
+
+    monkeypatch.setattr(engine.market_liquidity, "generate_levels", generate_then_tick)
+
+    # Aplica a curva do candle antigo, mas não apaga a marca do novo
+    assert engine.get_depth("ABCD")[0][0][0] < 12.0
+    assert engine.get_depth("ABCD")[0][0][0] > 12.0
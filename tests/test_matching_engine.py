@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import uuid
-from datetime import UTC, datetime, timedelta
 
 import pytest
 
@@ -33,6 +32,12 @@ class FakeBroker(Broker):
         if client_id in self._fail_for_uuids:
             raise self._fail_for_uuids[client_id]
 
+    def release_limit_order(self, order: LimitOrder) -> None:
+        pass
+
+    def validate_reservations(self, orders):
+        return [self._fail_for_uuids.get(order.client_id) for order in orders]
+
     def execute_trade(self, **kwargs):
         self.calls.append(kwargs)
 
@@ -60,7 +65,6 @@ def _limit(
     price: float,
     size: int,
     action: OrderAction,
-    created_at: datetime | None = None,
 ) -> LimitOrder:
     uuid_client_id = uuid.uuid5(uuid.NAMESPACE_DNS, client_id)
     return LimitOrder(
@@ -69,7 +73,6 @@ def _limit(
         price=price,
         size=size,
         action=action,
-        created_at=created_at or datetime.now(UTC),
     )
 
 
@@ -229,17 +232,8 @@ def test_time_priority_same_price():
     broker = FakeBroker()
     engine = MatchingEngine(broker)
 
-    t0 = datetime.now(UTC)
-    limit1 = _limit(
-        client_id="s1", price=10, size=3, action=OrderAction.SELL, created_at=t0
-    )
-    limit2 = _limit(
-        client_id="s2",
-        price=10,
-        size=5,
-        action=OrderAction.SELL,
-        created_at=t0 + timedelta(seconds=1),
-    )
+    limit1 = _limit(client_id="s1", price=10, size=3, action=OrderAction.SELL)
+    limit2 = _limit(client_id="s2", price=10, size=5, action=OrderAction.SELL)
     engine.submit(limit1)
     engine.submit(limit2)
     engine.submit(_market(client_id="b", size=4, action=OrderAction.BUY))
@@ -588,3 +582,35 @@ def test_market_sell_without_position_is_rejected():
     assert engine.order_book.find(buy.id) is buy
     assert buy.remaining == 5
     assert buy.status == OrderStatus.PENDING
+
+
+def test_batch_cancels_first_and_isolates_failures():
+    """Lote cancela antes de submeter e cada item falha sem abortar os demais."""
+    broker = FakeBroker(fail_for={"poor": InsufficentCashError()})
+    engine = MatchingEngine(broker)
+
+    resting = _limit(client_id="a", price=10, size=5, action=OrderAction.SELL)
+    engine.submit(resting)
+
+    a_id = uuid.uuid5(uuid.NAMESPACE_DNS, "a")
+    buy = _limit(client_id="b", price=10, size=5, action=OrderAction.BUY)
+    poor = _limit(client_id="poor", price=10, size=5, action=OrderAction.BUY)
+
+    canceled, submitted = engine.execute_batch(
+        client_id=a_id,
+        orders=[buy, poor],
+        cancel_ids=[resting.id, "missing"],
+    )
+
+    assert [(r.status, r.error) for r in canceled] == [
+        (OrderStatus.CANCELED, None),
+        (None, "Ordem não encontrada"),
+    ]
+    assert submitted[0].status == OrderStatus.PENDING
+    assert submitted[1].status is None
+    assert submitted[1].error == InsufficentCashError().detail
+
+    # O cancelamento rodou antes: a compra não cruzou com a venda cancelada
+    assert broker.calls == []
+    assert engine.order_book.find(buy.id) is buy
+    assert engine.order_book.find(poor.id) is None
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from typing import Any, cast
+
+from backend.features.variable_income.entities.order import Order, OrderStatus
+from backend.features.variable_income.matching_engine import BatchResult
+from backend.routes.operation import (
+    BatchOrderItem,
+    BatchOrdersRequest,
+    submit_order_batch,
+)
+
+
+class FakeSimulation:
+    def __init__(self):
+        self.orders: list[Order] = []
+
+    def execute_order_batch(
+        self, *, client_id: uuid.UUID, orders: Sequence[Order], cancel_ids
+    ) -> tuple[list[BatchResult], list[BatchResult]]:
+        self.orders = list(orders)
+        return [], [BatchResult(o.id, OrderStatus.PENDING) for o in orders]
+
+
+def _item(action: str, order_type: str = "market", **kwargs) -> BatchOrderItem:
+    return BatchOrderItem(
+        ticker="ABCD", quantity=10, type=order_type, action=action, **kwargs
+    )
+
+
+def test_invalid_item_fails_alone_keeping_its_position():
+    simulation = FakeSimulation()
+    payload = BatchOrdersRequest(
+        orders=[
+            _item("buy"),
+            _item("hold"),
+            _item("sell", "limit"),  # Sem limit_price
+            _item("sell", "limit", limit_price=12.5),
+        ]
+    )
+
+    response = submit_order_batch(cast(Any, simulation), uuid.uuid4(), payload)
+
+    assert [o.id for o in simulation.orders] == [
+        r.order_id for r in (response.submitted[0], response.submitted[3])
+    ]
+    assert [(r.status, r.error) for r in response.submitted] == [
+        ("PENDING", None),
+        (None, "Ação inválida"),
+        (None, "limit_price é obrigatório para ordem limitada"),
+        ("PENDING", None),
+    ]
+    assert response.submitted[1].order_id is None
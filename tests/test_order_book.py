@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import uuid
+
+from backend.features.variable_income.entities.order import LimitOrder, OrderAction
+from backend.features.variable_income.order_book import OrderBook
+
+
+def _limit(*, price: float, size: int, action: OrderAction) -> LimitOrder:
+    return LimitOrder(
+        client_id=uuid.uuid4(),
+        ticker="ABCD",
+        price=price,
+        size=size,
+        action=action,
+    )
+
+
+def test_best_prices_and_fifo_within_level():
+    book = OrderBook()
+    first = _limit(price=10.0, size=100, action=OrderAction.BUY)
+    second = _limit(price=10.0, size=50, action=OrderAction.BUY)
+    lower = _limit(price=9.5, size=10, action=OrderAction.BUY)
+    ask = _limit(price=10.5, size=20, action=OrderAction.SELL)
+    for order in (lower, first, second, ask):
+        book.add(order)
+
+    assert book.best_buy("ABCD") is first
+    assert book.best_sell("ABCD") is ask
+    assert book.get_orders("ABCD") == [first, second, lower, ask]
+
+    book.remove(first)
+    assert book.best_buy("ABCD") is second
+
+
+def test_depth_tracks_partial_fills_and_cancels():
+    book = OrderBook()
+    a = _limit(price=10.0, size=100, action=OrderAction.SELL)
+    b = _limit(price=10.0, size=50, action=OrderAction.SELL)
+    c = _limit(price=11.0, size=30, action=OrderAction.SELL)
+    for order in (a, b, c):
+        book.add(order)
+
+    assert book.get_depth("ABCD") == ([], [(10.0, 150), (11.0, 30)])
+
+    a.remaining -= 40
+    book.reduce(a, 40)
+    assert book.get_depth("ABCD")[1] == [(10.0, 110), (11.0, 30)]
+
+    a.remaining -= 60
+    book.reduce(a, 60)
+    assert book.find(a.id) is None
+    assert book.best_sell("ABCD") is b
+
+    book.remove(b)
+    assert book.get_depth("ABCD", max_levels=1) == ([], [(11.0, 30)])
+
+
+def test_remove_unknown_order_is_noop():
+    book = OrderBook()
+    order = _limit(price=10.0, size=10, action=OrderAction.BUY)
+
+    book.remove(order)
+    book.add(order)
+    book.remove(order)
+    book.remove(order)
+
+    assert book.best_buy("ABCD") is None
+    assert book.get_depth("ABCD") == ([], [])
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from backend.core.dto.events.base_event import BaseEventDTO
+from backend.core.exceptions import PersistenceError
+from backend.core.runtime.event_manager import EventManager
+from backend.core.runtime.persistence_writer import PersistenceWriter
+
+
+def _failing_job() -> None:
+    raise ValueError("banco fora do ar")
+
+
+def test_jobs_after_a_failure_are_discarded_until_drain():
+    done: list[int] = []
+    try:
+        PersistenceWriter.submit(_failing_job)
+        PersistenceWriter.submit(lambda: done.append(1))
+
+        with pytest.raises(PersistenceError) as error:
+            PersistenceWriter.drain()
+        assert isinstance(error.value.__cause__, ValueError)
+        assert done == []
+
+        # Reportada uma única vez; a fila volta a executar
+        PersistenceWriter.submit(lambda: done.append(2))
+        PersistenceWriter.drain()
+        assert done == [2]
+    finally:
+        PersistenceWriter.stop()
+
+
+def _event(user_id: int) -> BaseEventDTO:
+    return BaseEventDTO(simulation_id=1, user_id=user_id, event_date=date(2024, 1, 2))
+
+
+def test_flush_keeps_the_batch_when_submit_fails(monkeypatch: pytest.MonkeyPatch):
+    def failing_submit(job) -> None:
+        EventManager.push_event(late)  # Chega durante o submit
+        raise PersistenceError
+
+    batch = [_event(1), _event(2)]
+    late = _event(3)
+    monkeypatch.setattr(EventManager, "_events", list(batch))
+    monkeypatch.setattr(PersistenceWriter, "submit", failing_submit)
+
+    with pytest.raises(PersistenceError):
+        EventManager.flush()
+    assert EventManager._events == [*batch, late]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from backend.features.variable_income.price_store import PriceStore
+
+
+def _frame(rows: list[tuple[int, str, date, float, float]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "stock_id": stock_id,
+                "ticker": ticker,
+                "name": ticker.title(),
+                "price_date": price_date,
+                "open": open_,
+                "high": max(open_, close),
+                "low": min(open_, close),
+                "close": close,
+                "volume": 100,
+            }
+            for stock_id, ticker, price_date, open_, close in rows
+        ]
+    )
+
+
+@pytest.fixture
+def store() -> PriceStore:
+    return PriceStore(
+        _frame(
+            [
+                (2, "BBBB", date(2024, 1, 3), 20.0, 22.0),
+                (1, "AAAA", date(2024, 1, 2), 10.0, 11.0),
+                (1, "AAAA", date(2024, 1, 4), 11.0, 9.9),
+                (2, "BBBB", date(2024, 1, 5), 22.0, 21.0),
+            ]
+        )
+    )
+
+
+def test_candles_as_of_date_use_latest_previous_row(store: PriceStore):
+    candles = store.get_candles(date(2024, 1, 3))
+
+    assert [(c.ticker, c.price_date, c.close) for c in candles] == [
+        ("AAAA", date(2024, 1, 2), 11.0),
+        ("BBBB", date(2024, 1, 3), 22.0),
+    ]
+    assert candles[0].change == 1.0
+    assert candles[0].change_pct == "+10.00%"
+
+
+def test_cached_candles_are_not_shared_between_callers(store: PriceStore):
+    store.get_candles(date(2024, 1, 3)).clear()
+    store.get_candles(date(2024, 1, 3)).clear()  # Já do cache
+
+    assert [c.ticker for c in store.get_candles(date(2024, 1, 3))] == [
+        "AAAA",
+        "BBBB",
+    ]
+
+
+def test_tickers_without_history_yet_are_skipped(store: PriceStore):
+    candles = store.get_candles(date(2024, 1, 2))
+
+    assert [c.ticker for c in candles] == ["AAAA"]
+    assert store.get_closes(date(2024, 1, 2)) == {1: 11.0}
+
+
+def test_stock_details_history_stops_at_date(store: PriceStore):
+    details = store.get_stock_details("AAAA", date(2024, 1, 3))
+
+    assert details is not None
+    assert details.close == 11.0
+    assert [h.price_date for h in details.history] == [date(2024, 1, 2)]
+
+    details = store.get_stock_details("BBBB", date(2024, 1, 2))
+
+    assert details is not None
+    assert details.close == 0
+    assert details.history == []
+    assert store.get_stock_details("CCCC", date(2024, 1, 2)) is None
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from contextlib import nullcontext
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pandas as pd
+import pytest
+
+import backend.features.simulation.simulation as simulation_module
+from backend.core.runtime.event_manager import EventManager
+from backend.features.simulation.simulation import Simulation
+from backend.features.simulation.tick_profiler import TOTAL_PHASE, TickProfiler
+from backend.features.variable_income.price_store import PriceStore
+from backend.routes.timespeed import get_tick_profile
+
+
+class FakeEngine:
+    def update_market_data(self, stocks) -> None:
+        pass
+
+    def advance_fixed_income(self, current_date: date) -> None:
+        pass
+
+    def run_strategy(self) -> None:
+        pass
+
+
+def _simulation(profiler: TickProfiler) -> Simulation:
+    """Simulação sem banco: só o necessário para rodar um tick diário."""
+    frame = pd.DataFrame(
+        [
+            {
+                "stock_id": 1,
+                "ticker": "ABCD",
+                "name": "Abcd",
+                "price_date": date(2024, 1, 2),
+                "open": 10.0,
+                "high": 11.0,
+                "low": 9.0,
+                "close": 10.5,
+                "volume": 100,
+            }
+        ]
+    )
+    simulation = Simulation.__new__(Simulation)
+    simulation.settings = cast(Any, SimpleNamespace(end_date=date(2024, 12, 31)))
+    simulation._current_date = date(2024, 1, 2)
+    simulation._last_snapshot_month = (2024, 1)  # Sem virada de mês
+    simulation._engine = cast(Any, FakeEngine())
+    simulation._prices = PriceStore(frame)
+    simulation.profiler = profiler
+    return simulation
+
+
+def test_tick_profile_reports_every_phase(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(simulation_module, "unit_of_work", nullcontext)
+    monkeypatch.setattr(simulation_module, "notify", lambda *_, **__: None)
+    monkeypatch.setattr(EventManager, "_events", [])
+    simulation = _simulation(TickProfiler())
+
+    simulation.next_tick()
+    simulation.next_tick()
+
+    timings = {t.phase: t for t in get_tick_profile(simulation)}
+    assert set(timings) == {
+        "market_data",
+        "matching",
+        "fixed_income",
+        "strategy",
+        "flush",
+        "notify",
+        TOTAL_PHASE,
+    }
+    for t in timings.values():
+        assert t.count == 2
+        assert 0 <= t.p50_ms <= t.p95_ms <= t.p99_ms <= t.max_ms
+        assert t.mean_ms >= 0
+    assert timings[TOTAL_PHASE].max_ms >= timings["market_data"].max_ms
+
+
+def test_trace_records_each_tick(tmp_path: Path):
+    profiler = TickProfiler(window=2, trace_path=tmp_path / "trace.jsonl")
+    for day in (2, 3, 4):
+        profiler.begin_tick()
+        with profiler.phase("matching"):
+            pass
+        with profiler.phase("matching"):  # Fase repetida acumula no tick
+            pass
+        profiler.end_tick(date(2024, 1, day))
+
+    records = [
+        json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()
+    ]
+    assert [r["date"] for r in records] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert set(records[0]["phases_ms"]) == {"matching", TOTAL_PHASE}
+    # Janela deslizante: só os 2 últimos ticks entram nos percentis
+    assert {t.phase: t.count for t in profiler.get_timings()} == {
+        "matching": 2,
+        TOTAL_PHASE: 2,
+    }
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from backend.core.enum import OverrunPolicy
+from backend.features.simulation.tick_scheduler import TickScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeStopEvent(threading.Event):
+    def __init__(self, clock: FakeClock):
+        super().__init__()
+        self.clock = clock
+        self.waits: list[float] = []
+
+    def wait(self, timeout: float | None = None) -> bool:
+        assert timeout is not None
+        self.waits.append(timeout)
+        self.clock.now += timeout
+        return False
+
+
+def _run(scheduler: TickScheduler, clock: FakeClock, tick_costs: list[float]):
+    stop = FakeStopEvent(clock)
+    for cost in tick_costs:
+        clock.now += cost
+        scheduler.wait(1.0, stop)
+    return stop.waits
+
+
+def test_sleep_discounts_tick_runtime():
+    clock = FakeClock()
+    scheduler = TickScheduler(clock=clock)
+
+    waits = _run(scheduler, clock, [0.25, 0.5, 0.1])
+
+    # O primeiro deadline é ancorado no fim do primeiro tick
+    assert waits == pytest.approx([1.0, 0.5, 0.9])
+    assert clock.now == pytest.approx(3.25)
+    assert scheduler.get_stats().overruns == 0
+
+
+def test_catch_up_runs_missed_ticks_without_sleeping():
+    clock = FakeClock()
+    scheduler = TickScheduler(OverrunPolicy.CATCH_UP, max_catch_up=10, clock=clock)
+
+    waits = _run(scheduler, clock, [0.0, 2.5, 0.0, 0.0])
+
+    # Deadlines em 1, 2, 3 e 4: o tick lento atrasa o de t=2 e o de t=3
+    assert waits == [1.0, 0.5]
+    stats = scheduler.get_stats()
+    assert stats.overruns == 2
+    assert stats.skipped_ticks == 0
+
+
+def test_skip_policy_restarts_deadline_from_now():
+    clock = FakeClock()
+    scheduler = TickScheduler(OverrunPolicy.SKIP, clock=clock)
+
+    waits = _run(scheduler, clock, [0.0, 2.5, 0.0])
+
+    assert waits == [1.0, 1.0]
+    stats = scheduler.get_stats()
+    assert stats.overruns == 1
+    assert stats.skipped_ticks == 2
+    assert stats.achieved_tps > 0